@@ -12,6 +12,31 @@ TODO:
     - rentals
 
 Updates:
+    2026-10-19 21:00  - tools.house - parsed fields are memoized on disk by (text hash, extractor version), unchanged pages skip parse_text entirely until the host's PARSE_RULES change
+    2026-10-19 20:30  - tools.house - --archive keeps the rendered html of every fetch lzma'd and content-addressed with a manifest, reextract mode reparses it offline across processes
+    2026-10-19 20:00  - tools.house - search runs zillow and realtor at the same time on separate browsers, one of them the search's own
+    2026-10-19 19:30  - tools.house - card fields captured on both search paths, --max-monthly/--bed-min prefilter the cards at current rates before any detail page is opened
+    2026-10-19 19:00  - tools.house - search shards by price band and zip (--bands/--shard-zip/--shard-miles), capped shards split in half, shards run on --workers browsers and merge-dedupe
+    2026-10-19 18:30  - tools.house - url_file isolates each url: classified faults, retries with backoff, a fresh tab before giving up, <NOW>.dead.urls for the rest
+    2026-10-19 18:00  - tools.house - DriverRecycler samples browser rss and page heap per page and relaunches past --recycle-mb/--recycle-heap-mb/--recycle-pages, keeping cookies and profile
+    2026-10-19 17:30  - tools.house - sqlite fts5 index over the txt-cache kept current on every cache write, grep mode with boolean terms and phrases
+    2026-10-19 17:00  - tools.house - latitude/longitude from the page json (zip centroid otherwise), grid spatial index and the near mode
+    2026-10-19 16:30  - tools.house - browse hands listings to background headless browsers, your tab is never hijacked, results stream back
+    2026-10-19 16:00  - tools.house - warm mode, a polite headless pool prefetches the txt-cache cheapest first
+    2026-10-19 15:30  - tools.house - prometheus style metrics over --metrics-port or a rewritten --metrics-filepath, pages/cache/captchas/timeouts/latency/memory
+    2026-10-19 15:00  - tools.house - outputs also get a columnar .props file, PropertyColumns mmaps it for random access and column scans
+    2026-10-19 14:30  - tools.house - sqlite work queue with leases, search --queue enqueues and any number of house workers drain it
+    2026-10-19 14:00  - tools.house - zillow captcha check is instant, no more 2.5 sec toll on every listing without one
+    2026-10-19 13:30  - tools.house - realtor search pages are harvested by one scripted scroll that waits for the lazy cards to settle
+    2026-10-19 13:00  - tools.house - zillow search reads the search-state json page by page instead of scrolling the grid
+    2026-10-19 12:30  - tools.house - parse_text is linear time, fields only match in bounded windows around anchors, per-field budget
+    2026-10-19 12:00  - tools.house - memory-mapped per-listing time series of price and the day's rates, trend mode
+    2026-10-19 11:30  - tools.house - listing history, refetches are hashed and stored as field deltas, changes mode for price cuts
+    2026-10-19 11:00  - tools.house - vectorized amortization schedules and the project mode for cost of ownership
+    2026-10-19 10:30  - tools.house - top mode, k best over every stored output in constant memory
+    2026-10-19 10:00  - tools.house - offline commute estimates against every --commute for every listing, zillow included
+    2026-10-19 09:30  - tools.house - headless mode and devtools resource blocking per host for detail pages
+    2026-10-19 09:00  - tools.house - added the daemon mode, url_file/browse/search attach to a warmed browser instead of cold-starting
     2026-01-20 06:22  - tools.house - zillow captcha and realtor commute optimized, things are smoother now
     2026-01-14 06:22  - tools.house - added search with realtor/zillow, does not parse url correclty wll have to fix
     2026-01-13 06:22  - tools.house - added zillow, XPATH has been a revolution, Keys.ENTER the same way
@@ -26,26 +51,46 @@ import os
 import sys
 import logging
 import urllib.parse
+import urllib.request
 import datetime
 import random
 import time
 import json
 import csv
 import re
+import zipfile
+import heapq
+import glob
+import hashlib
+import socket
+import sqlite3
+import threading
+import contextlib
+import lzma
+import concurrent.futures
+import queue
+import shutil
+import tempfile
 from urllib.parse import urlparse, urljoin, unquote_plus
-from typing import List, Generator, Optional, Dict, Tuple
+from typing import List, Generator, Optional, Dict, Tuple, Iterable, Callable
 from dataclasses import dataclass, field, asdict
 from argparse import ArgumentParser
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from html.parser import HTMLParser
 
 # third party imports
+from selenium import webdriver
 from selenium.webdriver import Keys, ActionChains
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException, ElementNotInteractableException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException, ElementNotInteractableException, WebDriverException
 import undetected_chromedriver as uc
+import numpy as np
+import psutil
 
 # project imports
 from chriscarl.core.constants import TEMP_DIRPATH
@@ -71,9 +116,286 @@ LOGGER.addHandler(logging.NullHandler())
 DEFAULT_FIB_INIT = [0, 1]
 DEFAULT_OUTPUT_DIRPATH = abspath(TEMP_DIRPATH, 'tools.house')
 DEFAULT_LOG_FILEPATH = abspath(TEMP_DIRPATH, 'tools.house.log')
+DEFAULT_CHROME_DEBUG_PORT = 7654
+DEFAULT_PROFILE_DIRPATH = abspath(TEMP_DIRPATH, 'tools.house.profile')
+DEFAULT_DAEMON_FILEPATH = abspath(TEMP_DIRPATH, 'tools.house.daemon.json')
+DEFAULT_COMMUTE_MPH = 30.0
+DEFAULT_COMMUTE_CIRCUITY = 1.3  # road miles per straight-line mile, typical for US metros
+DEFAULT_COMMUTE_OVERHEAD_MINUTES = 5.0  # parking, lights, getting out of the driveway
 
 # tool constants
 NOW = datetime.datetime.now().strftime('%Y-%m-%d')
+DAEMON_WARMUP_URLS = [
+    'https://www.realtor.com',
+    'https://www.zillow.com',
+]
+LISTING_STATUS_REGEX = r'^[ \t]*(for sale|pending|contingent|under contract|coming soon|sold|off market|foreclosure)\b'
+LISTING_STATUS_ANCHOR = r'for sale|pending|contingent|under contract|coming soon|sold|off market|foreclosure'
+PARSE_FIELD_BUDGET = 0.25  # seconds per field, far above the ~1ms a sane page takes
+URL_ZILLOW_SEARCH_STATE = 'https://www.zillow.com/async-create-search-page-state'
+ZILLOW_SEARCH_STATE_SCRIPT = '''
+const [url, body, done] = arguments;
+fetch(url, {method: 'PUT', credentials: 'include', headers: {'content-type': 'application/json'}, body: JSON.stringify(body)})
+    .then(response => response.ok ? response.json() : {error: response.status})
+    .then(done, error => done({error: String(error)}));
+'''
+REALTOR_SEARCH_HARVEST_SCRIPT = '''
+const [cardSelector, anchorSelector, stableTicks, interval, timeout, done] = arguments;
+const started = Date.now();
+let last = -1, stable = 0;
+const finished = () => document.querySelector('div[aria-label="pagination"]') || document.evaluate(
+    '//p[contains(normalize-space(.), "nd of matching")]', document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const tick = () => {
+    const cards = document.querySelectorAll(cardSelector);
+    if (cards.length) cards[cards.length - 1].scrollIntoView({block: 'end'});
+    window.scrollTo(0, document.body.scrollHeight);
+    stable = cards.length === last ? stable + 1 : 0;
+    last = cards.length;
+    if (stable >= (finished() ? 1 : stableTicks) || Date.now() - started > timeout) {
+        done(Array.from(document.querySelectorAll(cardSelector), card => ({
+            hrefs: Array.from(card.querySelectorAll(anchorSelector), anchor => anchor.getAttribute('href')).filter(Boolean),
+            text: card.innerText,
+        })));
+    } else {
+        setTimeout(tick, interval);
+    }
+};
+tick();
+'''
+LISTING_COORDINATES_SCRIPT = r'''
+const patterns = [
+    /"latitude"\s*:\s*"?(-?\d+\.\d+)"?\s*,\s*"longitude"\s*:\s*"?(-?\d+\.\d+)/,
+    /"coordinate"\s*:\s*\{\s*"lat"\s*:\s*(-?\d+\.\d+)\s*,\s*"lon"\s*:\s*(-?\d+\.\d+)/,
+];
+for (const script of document.querySelectorAll('script[type="application/ld+json"], script#__NEXT_DATA__')) {
+    for (const pattern of patterns) {
+        const match = script.textContent.match(pattern);
+        if (match) return [parseFloat(match[1]), parseFloat(match[2])];
+    }
+}
+return null;
+'''
+HISTORY_FIELDS = ['price', 'hoa', 'land_lease', 'listing_age', 'status']
+# Network.setBlockedURLs only speaks url patterns, so resource types are blocked by their usual extensions
+RESOURCE_TYPE_URL_PATTERNS = {
+    'Image': ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.avif*', '*.svg*', '*.ico*'],
+    'Font': ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*'],
+    'Media': ['*.mp4*', '*.webm*', '*.m3u8*', '*.ts?*', '*.mp3*'],
+}
+# rough transfer sizes, only used to estimate what a blocked request would have cost
+RESOURCE_TYPE_ESTIMATED_BYTES = {
+    'Image': 60_000,
+    'Font': 40_000,
+    'Media': 500_000,
+    'Script': 80_000,
+    'XHR': 5_000,
+    'Fetch': 5_000,
+    'Other': 10_000,
+}
+TRACKER_URL_PATTERNS = [
+    '*googletagmanager.com*',
+    '*google-analytics.com*',
+    '*doubleclick.net*',
+    '*connect.facebook.net*',
+    '*bat.bing.com*',
+    '*nr-data.net*',
+    '*hotjar.com*',
+    '*maps.googleapis.com*',
+    '*maps.gstatic.com*',
+]
+DEFAULT_BLOCK_CONFIG = {
+    'realtor.com': {
+        'resource_types': ['Image', 'Font', 'Media'],
+        'url_patterns': TRACKER_URL_PATTERNS + ['*rdcpix.com*', '*mapbox.com*'],
+    },
+    'zillow.com': {
+        'resource_types': ['Image', 'Font', 'Media'],
+        # NOTE: perimeterx (px-cdn, px-cloud) must stay reachable or the captcha never resolves
+        'url_patterns': TRACKER_URL_PATTERNS + ['*photos.zillowstatic.com*', '*maps.zillowstatic.com*'],
+    },
+}
+
+
+DEFAULT_METRICS_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+METRICS_HELP = {
+    'house_pages_fetched_total': ('counter', 'detail pages pulled through the browser, per host'),
+    'house_cache_total': ('counter', 'txt-cache lookups by result hit/miss'),
+    'house_captchas_total': ('counter', 'captchas encountered, per host'),
+    'house_webdriver_timeouts_total': ('counter', 'webdriver waits that timed out, per host'),
+    'house_parse_failures_total': ('counter', 'fields parse_text gave up on, by field and reason'),
+    'house_parse_memo_total': ('counter', 'ParseMemo lookups by result hit/miss, a hit skips parse_text'),
+    'house_listings_total': ('counter', 'listings parsed and calculated'),
+    'house_stage_seconds': ('histogram', 'latency per stage (search/fetch/parse/calculate), per host'),
+    'house_driver_memory_bytes': ('gauge', 'rss of each live browser and all of its child processes, by browser pid'),
+    'house_driver_peak_memory_bytes': ('gauge', 'highest browser rss seen by any DriverRecycler this run'),
+    'house_page_heap_bytes': ('gauge', 'js heap of the last page a DriverRecycler sampled'),
+    'house_driver_recycles_total': ('counter', 'browsers relaunched (or tabs swapped) by DriverRecycler, by reason rss/heap/pages'),
+    'house_listing_retries_total': ('counter', 'listing fetches retried by url_file, by fault'),
+    'house_listing_failures_total': ('counter', 'listings url_file gave up on and dead-lettered, by fault'),
+    'house_cards_prefiltered_total': ('counter', 'search results skipped on their card alone, by reason'),
+    'house_last_progress_timestamp_seconds': ('gauge', 'unix time the last listing finished, a stalled browser stops moving this'),
+}
+
+
+class Metrics():
+    '''
+    Description:
+        counters, gauges and histograms keyed by name + labels, rendered as prometheus text exposition.
+        thread safe, cheap enough to call per listing, nothing is exported unless serve/write is used.
+    '''
+
+    def __init__(self, buckets=DEFAULT_METRICS_BUCKETS):
+        # type: (Tuple[float, ...]) -> None
+        self.buckets = tuple(buckets)
+        self.lock = threading.Lock()
+        self.values = {}  # type: Dict[Tuple[str, tuple], float]
+        self.histograms = {}  # type: Dict[Tuple[str, tuple], List[float]]
+        self.callbacks = {}  # type: Dict[Tuple[str, tuple], Callable[[], float]]
+
+    @staticmethod
+    def key(name, labels):
+        # type: (str, dict) -> Tuple[str, tuple]
+        return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+    def inc(self, name, value=1.0, **labels):
+        # type: (str, float, **object) -> None
+        key = Metrics.key(name, labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0.0) + value
+
+    def set(self, name, value, **labels):
+        # type: (str, float, **object) -> None
+        with self.lock:
+            self.values[Metrics.key(name, labels)] = float(value)
+
+    def observe(self, name, value, **labels):
+        # type: (str, float, **object) -> None
+        key = Metrics.key(name, labels)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [0.0] * (len(self.buckets) + 2)  # buckets..., sum, count
+            for b, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram[b] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    @contextlib.contextmanager
+    def timer(self, name, **labels):
+        # type: (str, **object) -> Generator[None, None, None]
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.observe(name, time.time() - start, **labels)
+
+    def gauge_callback(self, name, callback, **labels):
+        # type: (str, Callable[[], float], **object) -> None
+        '''
+        evaluated at render time, for things like memory that are only worth measuring when someone looks
+        '''
+        with self.lock:
+            self.callbacks[Metrics.key(name, labels)] = callback
+
+    def drop_callback(self, name, **labels):
+        # type: (str, **object) -> None
+        with self.lock:
+            self.callbacks.pop(Metrics.key(name, labels), None)
+
+    def get(self, name, **labels):
+        # type: (str, **object) -> float
+        return self.values.get(Metrics.key(name, labels), 0.0)
+
+    @staticmethod
+    def format_labels(labels):
+        # type: (tuple) -> str
+        if not labels:
+            return ''
+        escaped = ('{}="{}"'.format(label, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')) for label, value in labels)
+        return '{' + ','.join(escaped) + '}'
+
+    def render(self):
+        # type: () -> str
+        with self.lock:
+            values = dict(self.values)
+            histograms = {key: list(histogram) for key, histogram in self.histograms.items()}
+            callbacks = dict(self.callbacks)
+        for key, callback in callbacks.items():
+            try:
+                values[key] = float(callback())
+            except Exception as ex:
+                LOGGER.debug('metrics callback %s failed: %s', key, ex)
+
+        lines = []
+        names = sorted({name for name, _ in values} | {name for name, _ in histograms})
+        for name in names:
+            kind, help = METRICS_HELP.get(name, ('untyped', name))
+            lines.append(f'# HELP {name} {help}')
+            lines.append(f'# TYPE {name} {kind}')
+            for (metric, labels), value in sorted(values.items()):
+                if metric == name:
+                    lines.append(f'{name}{Metrics.format_labels(labels)} {value:.15g}')
+            for (metric, labels), histogram in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, count in zip(self.buckets + (float('inf'), ), histogram[:len(self.buckets)] + [histogram[-1]]):
+                    le = '+Inf' if bound == float('inf') else f'{bound:g}'
+                    lines.append(f'{name}_bucket{Metrics.format_labels(labels + (("le", le), ))} {count:.15g}')
+                lines.append(f'{name}_sum{Metrics.format_labels(labels)} {histogram[-2]:.15g}')
+                lines.append(f'{name}_count{Metrics.format_labels(labels)} {histogram[-1]:.15g}')
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port, host='127.0.0.1'):
+        # type: (int, str) -> ThreadingHTTPServer
+        '''
+        GET http://host:port/metrics from a background thread, port 0 picks a free one
+        '''
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('content-type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('content-length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                LOGGER.debug(format, *args)
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True, name='metrics').start()
+        LOGGER.info('metrics at http://%s:%d/metrics', host, server.server_port)
+        return server
+
+    def write(self, filepath):
+        # type: (str) -> None
+        temp_filepath = f'{filepath}.{os.getpid()}'
+        write_text_file(temp_filepath, self.render())
+        os.replace(temp_filepath, filepath)
+
+    def write_every(self, filepath, every=5.0):
+        # type: (str, int|float) -> threading.Thread
+        '''
+        rewrite the file from a background thread, for node_exporter's textfile collector or just tail/watch
+        '''
+        def loop():
+            while True:
+                try:
+                    self.write(filepath)
+                except OSError as ex:
+                    LOGGER.warning('could not write metrics to "%s": %s', filepath, ex)
+                time.sleep(every)
+
+        thread = threading.Thread(target=loop, daemon=True, name='metrics-file')
+        thread.start()
+        return thread
+
+
+METRICS = Metrics()
 
 
 def mortgage_monthly(P, apr, down=0.2, years=30, as_float=False):
@@ -89,6 +411,212 @@ def mortgage_monthly(P, apr, down=0.2, years=30, as_float=False):
     return monthly if as_float else round(monthly)
 
 
+def as_fraction(percent):
+    # type: (np.ndarray) -> np.ndarray
+    '''
+    same leniency as mortgage_monthly, 6.088 and 0.06088 are both 6.088%
+    '''
+    percent = np.asarray(percent, dtype=np.float64)
+    return np.where(percent > 1, percent / 100, percent)
+
+
+def amortization_schedules(
+    prices,
+    aprs,
+    down=20.0,
+    years=30,
+    hoa=0.0,
+    land_lease=0.0,
+    hoa_growth=0.0,
+    land_lease_growth=0.0,
+    appreciation=0.0,
+):
+    # type: (np.ndarray, np.ndarray|float, float, int, np.ndarray|float, np.ndarray|float, float, float, float) -> Dict[str, np.ndarray]
+    '''
+    Description:
+        month-by-month schedules for N properties at once, closed form so there is no python loop over months.
+        hoa and land lease escalate once a year by their growth rate, the home value by appreciation, all three in percent.
+        apr and down accept percent or fraction like mortgage_monthly, apr per-property array or one scalar.
+
+    Returns:
+        Dict[str, np.ndarray]
+            every value is (N, years * 12), month 1 in column 0:
+            payment, interest, principal, balance, cum_interest, cum_principal, hoa, land_lease, cum_cost, value, equity
+    '''
+    prices = np.atleast_1d(np.asarray(prices, dtype=np.float64))
+    N, n = prices.shape[0], years * 12
+    r = np.broadcast_to(as_fraction(aprs) / 12, (N, ))[:, np.newaxis]
+    down = float(as_fraction(down))
+    P = (prices * (1 - down))[:, np.newaxis]
+    k = np.arange(1, n + 1, dtype=np.float64)[np.newaxis, :]
+
+    zero_rate = r == 0
+    safe_r = np.where(zero_rate, 1.0, r)
+    growth_n = (1 + r)**n
+    payment = np.where(zero_rate, P / n, P * r * growth_n / np.where(zero_rate, 1.0, growth_n - 1))
+    growth_k = (1 + r)**k
+    balance = np.where(zero_rate, P - payment * k, P * growth_k - payment * (growth_k - 1) / safe_r)
+    balance = np.maximum(balance, 0.0)
+    balance_prev = np.concatenate([P, balance[:, :-1]], axis=1)
+    interest = balance_prev * r
+    principal = balance_prev - balance
+    payment = np.broadcast_to(payment, (N, n))
+
+    year = np.floor((k - 1) / 12)
+    hoa = np.broadcast_to(np.asarray(hoa, dtype=np.float64), (N, ))[:, np.newaxis] * (1 + hoa_growth / 100)**year
+    land_lease = np.broadcast_to(np.asarray(land_lease, dtype=np.float64), (N, ))[:, np.newaxis] * (1 + land_lease_growth / 100)**year
+    value = prices[:, np.newaxis] * (1 + appreciation / 100)**(k / 12)
+
+    return dict(
+        payment=payment,
+        interest=interest,
+        principal=principal,
+        balance=balance,
+        cum_interest=np.cumsum(interest, axis=1),
+        cum_principal=P - balance,
+        hoa=hoa,
+        land_lease=land_lease,
+        cum_cost=np.cumsum(payment + hoa + land_lease, axis=1),
+        value=value,
+        equity=value - balance,
+    )
+
+
+def amortization_schedule(price, apr, down=20.0, years=30, hoa=0.0, land_lease=0.0, hoa_growth=0.0, land_lease_growth=0.0, appreciation=0.0):
+    # type: (float, float, float, int, float, float, float, float, float) -> Generator[Dict[str, float], None, None]
+    '''
+    Description:
+        the same schedule as amortization_schedules for a single property, lazily one month at a time
+    '''
+    r = float(as_fraction(apr)) / 12
+    n = years * 12
+    balance = price * (1 - float(as_fraction(down)))
+    payment = mortgage_monthly(price, apr, down=down, years=years, as_float=True) if r else balance / n
+    cum_interest = cum_principal = cum_cost = 0.0
+    for month in range(1, n + 1):
+        year = (month - 1) // 12
+        interest = balance * r
+        principal = min(payment - interest, balance)
+        balance -= principal
+        cum_interest += interest
+        cum_principal += principal
+        month_hoa = hoa * (1 + hoa_growth / 100)**year
+        month_land_lease = land_lease * (1 + land_lease_growth / 100)**year
+        cum_cost += payment + month_hoa + month_land_lease
+        value = price * (1 + appreciation / 100)**(month / 12)
+        yield dict(
+            month=month,
+            payment=payment,
+            interest=interest,
+            principal=principal,
+            balance=balance,
+            cum_interest=cum_interest,
+            cum_principal=cum_principal,
+            hoa=month_hoa,
+            land_lease=month_land_lease,
+            cum_cost=cum_cost,
+            value=value,
+            equity=value - balance,
+        )
+
+
+def parse_field(text, regex, anchor, before, after, budget=PARSE_FIELD_BUDGET):
+    # type: (str, re.Pattern, re.Pattern, int, int, float) -> Optional[re.Match]
+    '''
+    Description:
+        run regex only inside the windows [anchor.start - before, anchor.end + after) of the anchor hits, in document order.
+        overlapping windows are merged into spans of about two windows, each searched once, so a character is searched
+        at most twice and every window still sits whole inside some span.
+        a run of back to back anchors is hopped over before + 1 chars at a time instead of anchor by anchor,
+        which can stretch a span up to before + after chars past the last window, but keeps the whole field linear.
+        pattern.search(text, pos, endpos) keeps ^ and lookarounds honest without slicing copies of the text.
+
+    Raises:
+        TimeoutError
+            the field used up its budget in seconds before finding anything, parse_text warns and counts it
+    '''
+    start_time = time.perf_counter()
+    span_cap = 2 * (before + after + 1)  # keeps .+ and [^\d]+ from backtracking over a whole page of merged windows
+    span_start = span_end = -1
+    pos = 0
+    while True:
+        anchor_mo = anchor.search(text, pos)
+        if anchor_mo is None:
+            break
+        window_start, window_end = max(0, anchor_mo.start() - before), min(len(text), anchor_mo.end() + after)
+        pos = max(anchor_mo.end(), anchor_mo.start() + 1)
+        if window_start <= span_end and span_end - span_start < span_cap:
+            span_end = max(span_end, window_end)
+            limit = min(len(text), span_end + before + 1)
+            if not anchor.search(text, pos, limit):
+                continue
+            pos, span_end = limit, min(len(text), limit + after)  # every anchor before limit merges into this span
+        else:
+            first = span_end < 0
+            if not first:
+                mo = regex.search(text, span_start, span_end)
+                if mo:
+                    return mo
+            span_start, span_end = window_start, window_end
+            if first:
+                continue
+        if time.perf_counter() - start_time > budget:
+            raise TimeoutError(f'{regex.pattern!r} over budget')
+    return regex.search(text, span_start, span_end) if span_end >= 0 else None
+
+
+def parse_rules(rules):
+    # type: (list) -> list
+    '''
+    (key, regex, flags, anchor, before, after) -> (key, compiled regex, compiled anchor, before, after), anchors share the regex flags
+    '''
+    return [(key, re.compile(regex, flags), re.compile(anchor, flags), before, after) for key, regex, flags, anchor, before, after in rules]
+
+
+# (key, regex, flags, anchor, chars before the anchor, chars after the anchor)
+# the regex must match inside that window, which is what keeps [^\d]+, .+ and \s* from scanning the whole page
+PARSE_RULES = {
+    'realtor.com': parse_rules([
+        ('address', r'\n\s*(.+, .+, [A-Z]{2} \d{5})', re.MULTILINE, r', [A-Z]{2} \d{5}', 300, 0),
+        ('property_type', r'Property type\n(.+)\n', re.MULTILINE, r'Property type\n', 0, 300),
+        ('price', r'\n\s*\$([\d,]{5,})', re.MULTILINE, r'\$', 200, 40),
+        ('bed', r'([\d]+)\n\s*bed', re.MULTILINE, r'bed', 100, 0),
+        ('bath', r'([\d]+)\n\s*bath', re.MULTILINE, r'bath', 100, 0),
+        ('hoa', r'HOA fees\n\$?([\d\.,]{3,})', re.MULTILINE, r'HOA fees\n', 0, 60),
+        ('land_lease', r'(?:lease |land lease|rent)[^\d]+\$?([\d\., ]{3,})[^\d]', re.IGNORECASE | re.MULTILINE, r'lease|rent', 5, 300),
+        ('area', r'([\d\.,]{3,}) (square foot lot|acre lot|square feet)', re.MULTILINE, r' (?:square foot lot|acre lot|square feet)', 60, 20),
+        ('area_unit', r'[\d\.,]{3,} (square foot lot|acre lot|square feet)', re.MULTILINE, r' (?:square foot lot|acre lot|square feet)', 60, 20),
+        ('year', r'Year built\n(.+)', re.MULTILINE, r'Year built\n', 0, 300),
+        ('commute', r'(\d+ min)\nto', re.MULTILINE, r' min\nto', 60, 0),
+        ('listing_age', r'On Realtor.com\n(\d+) days', re.MULTILINE, r'On Realtor.com\n', 0, 60),
+        ('listing_agent', r'Listed by (.+)', 0, r'Listed by ', 0, 300),
+        ('listing_agent_brokerage', r'Brokered by (.+)', 0, r'Brokered by ', 0, 300),
+        ('status', LISTING_STATUS_REGEX, re.IGNORECASE | re.MULTILINE, LISTING_STATUS_ANCHOR, 100, 20),
+        ('latitude', r'Coordinates: (-?[\d\.]+),', 0, r'Coordinates: ', 0, 60),
+        ('longitude', r'Coordinates: -?[\d\.]+, (-?[\d\.]+)', 0, r'Coordinates: ', 0, 60),
+    ]),
+    'zillow.com': parse_rules([
+        ('address', r'\n\s*(.+, .+, [A-Z]{2} \d{5})', re.MULTILINE, r', [A-Z]{2} \d{5}', 300, 0),
+        ('property_type', r'Home type\:\s*(.+)\n', re.MULTILINE, r'Home type\:', 0, 300),
+        ('price', r'\n\s*\$([\d,]{5,})', re.MULTILINE, r'\$', 200, 40),
+        ('bed', r'([\d]+)\s*bed', re.MULTILINE, r'bed', 100, 0),
+        ('bath', r'([\d]+)\s*bath', re.MULTILINE, r'bath', 100, 0),
+        ('hoa', r'\$?([\d\.,]{3,})\/mo HOA', 0, r'/mo HOA', 60, 0),
+        ('land_lease', r'(?:lease amount|rent)\:+s*\$?([\d\., ]{3,})', re.IGNORECASE, r'lease amount|rent', 0, 300),
+        ('area', r'area\:\s*([\d\.,]{3,})', re.MULTILINE, r'area\:', 0, 100),
+        ('area_unit', r'area\:\s*([\d\.,]{3,}) (sqft lot|acre lot|sqft)', re.MULTILINE, r'area\:', 0, 100),
+        ('year', r'Year built\:\s*(.+)', re.MULTILINE, r'Year built\:', 0, 300),
+        ('commute', r'(\d+ min)\nto', re.MULTILINE, r' min\nto', 60, 0),
+        ('listing_age', r'(\d+) days on Zillow', re.MULTILINE, r' days on Zillow', 60, 0),
+        ('listing_agent', r'Listed by:\n([^\d]+)\s+[\d \-]+,\n(?:.+)\s+[\d\-\(\)]{9,}', re.MULTILINE, r'Listed by:\n', 0, 400),
+        ('listing_agent_brokerage', r'Listed by:\n(?:[^\d]+)\s+[\d \-]+,\n(.+)\s+[\d\-\(\)]{9,}', re.MULTILINE, r'Listed by:\n', 0, 400),
+        ('status', LISTING_STATUS_REGEX, re.IGNORECASE | re.MULTILINE, LISTING_STATUS_ANCHOR, 100, 20),
+        ('latitude', r'Coordinates: (-?[\d\.]+),', 0, r'Coordinates: ', 0, 60),
+        ('longitude', r'Coordinates: -?[\d\.]+, (-?[\d\.]+)', 0, r'Coordinates: ', 0, 60),
+    ]),
+}
+
+
 @dataclass
 class Property():
     # street: str
@@ -107,9 +635,15 @@ class Property():
     area_unit: str = ''
     year: int = 6969
     commute: str = ''
+    commute_miles: float = 0.0
+    commute_minutes: float = 0.0
+    commutes: str = ''
+    latitude: float = 0.0
+    longitude: float = 0.0
     listing_age: int = 0
     listing_agent: str = ''
     listing_agent_brokerage: str = ''
+    status: str = ''
     monthly_30: float = 1.0
     monthly_20: float = 1.0
     monthly_15: float = 1.0
@@ -129,53 +663,30 @@ class Property():
         return f'Property({self.address!r})'
 
     @staticmethod
-    def parse_text(text, hostname):
-        # type: (str, str) -> Property
+    def parse_text(text, hostname, budget=None, failures=None):
+        # type: (str, str, Optional[float], Optional[List[str]]) -> Property
+        '''
+        Description:
+            every field regex only ever runs inside a bounded window around a cheap anchor (see PARSE_RULES),
+            so parsing is linear in the text no matter how long or hostile the page is.
+            budget is seconds per field, a field that blows it keeps its default and gets a warning.
+            failures, if given, gets the key of every field that timed out or errored (not ones simply absent)
+        '''
+        budget = PARSE_FIELD_BUDGET if budget is None else budget
         kwargs = {}
 
-        if 'realtor.com' in hostname:
-            regexes = [
-                ('address', r'\n\s*(.+, .+, [A-Z]{2} \d{5})', re.MULTILINE),
-                ('property_type', r'Property type\n(.+)\n', re.MULTILINE),
-                ('price', r'\n\s*\$([\d,]{5,})', re.MULTILINE),
-                ('bed', r'([\d]+)\n\s*bed', re.MULTILINE),
-                ('bath', r'([\d]+)\n\s*bath', re.MULTILINE),
-                ('hoa', r'HOA fees\n\$?([\d\.,]{3,})', re.MULTILINE),
-                ('land_lease', r'(?:lease |land lease|rent)[^\d]+\$?([\d\., ]{3,})[^\d]', re.IGNORECASE | re.MULTILINE),
-                ('area', r'([\d\.,]{3,}) (square foot lot|acre lot|square feet)', re.MULTILINE),
-                ('area_unit', r'[\d\.,]{3,} (square foot lot|acre lot|square feet)', re.MULTILINE),
-                ('year', r'Year built\n(.+)', re.MULTILINE),
-                ('commute', r'(\d+ min)\nto', re.MULTILINE),
-                ('listing_age', r'On Realtor.com\n(\d+) days', re.MULTILINE),
-                ('listing_agent', r'Listed by (.+)', 0),
-                ('listing_agent_brokerage', r'Brokered by (.+)', 0),
-            ]
-        elif 'zillow.com' in hostname:
-            regexes = [
-                ('address', r'\n\s*(.+, .+, [A-Z]{2} \d{5})', re.MULTILINE),
-                ('property_type', r'Home type\:\s*(.+)\n', re.MULTILINE),
-                ('price', r'\n\s*\$([\d,]{5,})', re.MULTILINE),
-                ('bed', r'([\d]+)\s*bed', re.MULTILINE),
-                ('bath', r'([\d]+)\s*bath', re.MULTILINE),
-                ('hoa', r'\$?([\d\.,]{3,})\/mo HOA', 0),
-                ('land_lease', r'(?:lease amount|rent)\:+s*\$?([\d\., ]{3,})', re.IGNORECASE),
-                ('area', r'area\:\s*([\d\.,]{3,})', re.MULTILINE),
-                ('area_unit', r'area\:\s*([\d\.,]{3,}) (sqft lot|acre lot|sqft)', re.MULTILINE),
-                ('year', r'Year built\:\s*(.+)', re.MULTILINE),
-                ('commute', r'(\d+ min)\nto', re.MULTILINE),
-                ('listing_age', r'(\d+) days on Zillow', re.MULTILINE),
-                ('listing_agent', r'Listed by:\n([^\d]+)\s+[\d \-]+,\n(?:.+)\s+[\d\-\(\)]{9,}', re.MULTILINE),
-                ('listing_agent_brokerage', r'Listed by:\n(?:[^\d]+)\s+[\d \-]+,\n(.+)\s+[\d\-\(\)]{9,}', re.MULTILINE),
-            ]
+        for host, rules in PARSE_RULES.items():
+            if host in hostname:
+                break
         else:
             raise NotImplementedError(f'{hostname} not yet implemented!')
 
-        for tpl in regexes:
-            key, regex, flags = tpl
+        for tpl in rules:
+            key, regex, anchor, before, after = tpl
             try:
                 default = getattr(DEFAULT_PROPERTY, key)
                 KeyType = type(default)
-                mo = re.search(regex, text, flags=flags)
+                mo = parse_field(text, regex, anchor, before, after, budget=budget)
                 if not mo:
                     # LOGGER.debug(text)
                     value = '' if KeyType is str else default
@@ -188,9 +699,18 @@ class Property():
 
                 value = KeyType(value)
                 kwargs[key] = value
+            except TimeoutError:
+                LOGGER.warning('gave up on %r after %0.3f sec with regex "%s"!', key, budget, regex.pattern)
+                METRICS.inc('house_parse_failures_total', field=key, reason='timeout')
+                if failures is not None:
+                    failures.append(key)
+                continue
             except Exception:
-                LOGGER.error('failed to parse %d with regex "%s"!', key, regex)
-                LOGGER.debug('failed to parse %d with regex "%s"!', key, regex, exc_info=True)
+                LOGGER.error('failed to parse %r with regex "%s"!', key, regex.pattern)
+                METRICS.inc('house_parse_failures_total', field=key, reason='error')
+                LOGGER.debug('failed to parse %r with regex "%s"!', key, regex.pattern, exc_info=True)
+                if failures is not None:
+                    failures.append(key)
                 continue
 
         prop = Property(**kwargs)
@@ -246,7 +766,195 @@ def download_mortgage_rates(dirpath=TEMP_DIRPATH):
     return mortgage_rate_30, mortgage_rate_20, mortgage_rate_15
 
 
+URL_ZIP_CENTROIDS = 'https://www2.census.gov/geo/docs/maps-data/data/gazetteer/2023_Gazetteer/2023_Gaz_zcta_national.zip'
+EARTH_RADIUS_MILES = 3958.8
+
+
+def download_zip_centroids(dirpath=TEMP_DIRPATH):
+    # type: (str) -> Dict[str, Tuple[float, float]]
+    '''
+    Description:
+        URL used: https://www2.census.gov/geo/docs/maps-data/data/gazetteer/2023_Gazetteer/2023_Gaz_zcta_national.zip
+        the census ZCTA gazetteer, downloaded once and boiled down to zip-centroids.csv, every run after that is offline.
+
+    Returns:
+        Dict[str, Tuple[float, float]]
+            zip -> (latitude, longitude)
+    '''
+    centroids_filepath = abspath(dirpath, 'zip-centroids.csv')
+    if not is_file(centroids_filepath):
+        dataset_filepath, _ = download(URL_ZIP_CENTROIDS, dirpath)
+        with zipfile.ZipFile(dataset_filepath) as zf:
+            name = [name for name in zf.namelist() if name.endswith('.txt')][0]
+            lines = zf.read(name).decode('utf-8').splitlines()
+        reader = csv.DictReader(lines, delimiter='\t')
+        reader.fieldnames = [fieldname.strip() for fieldname in (reader.fieldnames or [])]
+        with open(centroids_filepath, 'w', encoding='utf-8', newline='') as w:
+            writer = csv.writer(w)
+            writer.writerow(['zip', 'latitude', 'longitude'])
+            for row in reader:
+                writer.writerow([row['GEOID'], row['INTPTLAT'].strip(), row['INTPTLONG'].strip()])
+
+    centroids = {}
+    with open(centroids_filepath, 'r', encoding='utf-8') as r:
+        for row in csv.DictReader(r):
+            centroids[row['zip']] = (float(row['latitude']), float(row['longitude']))
+    return centroids
+
+
+class Geocoder():
+    '''
+    Description:
+        address -> (latitude, longitude) from an on-disk cache, falling back to the zip centroid.
+        the cache is plain json, hand-edit an address in there if you want it exact rather than zip-level.
+    '''
+
+    def __init__(self, centroids, cache_filepath=''):
+        # type: (Dict[str, Tuple[float, float]], str) -> None
+        self.centroids = centroids
+        self.cache_filepath = cache_filepath
+        self.cache = {}  # type: Dict[str, List[float]]
+        if cache_filepath and is_file(cache_filepath):
+            with open(cache_filepath, 'r', encoding='utf-8') as r:
+                self.cache = json.load(r)
+        self.dirty = False
+
+    @staticmethod
+    def load(dirpath):
+        # type: (str) -> Geocoder
+        return Geocoder(download_zip_centroids(dirpath=dirpath), cache_filepath=abspath(dirpath, 'geocode-cache.json'))
+
+    def geocode(self, address):
+        # type: (str) -> Optional[Tuple[float, float]]
+        if address in self.cache:
+            lat, lon = self.cache[address]
+            return lat, lon
+        zips = re.findall(r'\b(\d{5})(?:-\d{4})?\b', address)
+        if not zips or zips[-1] not in self.centroids:
+            return None
+        lat, lon = self.centroids[zips[-1]]
+        self.cache[address] = [lat, lon]
+        self.dirty = True
+        return lat, lon
+
+    def save(self):
+        # type: () -> None
+        if self.cache_filepath and self.dirty:
+            write_text_file(self.cache_filepath, json.dumps(self.cache, indent=2))
+            self.dirty = False
+
+
+def haversine_miles(origins, destinations):
+    # type: (np.ndarray, np.ndarray) -> np.ndarray
+    '''
+    Description:
+        straight-line miles between every origin and every destination
+
+    Arguments:
+        origins: np.ndarray
+            (N, 2) of latitude, longitude in degrees
+        destinations: np.ndarray
+            (M, 2) of latitude, longitude in degrees
+
+    Returns:
+        np.ndarray
+            (N, M), NaN wherever an origin or destination is NaN
+    '''
+    origins = np.radians(np.asarray(origins, dtype=np.float64).reshape(-1, 2))
+    destinations = np.radians(np.asarray(destinations, dtype=np.float64).reshape(-1, 2))
+    lat1, lon1 = origins[:, 0:1], origins[:, 1:2]
+    lat2, lon2 = destinations[:, 0][np.newaxis, :], destinations[:, 1][np.newaxis, :]
+    a = np.sin((lat2 - lat1) / 2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2)**2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def commute_matrix(origins, destinations, mph=DEFAULT_COMMUTE_MPH, circuity=DEFAULT_COMMUTE_CIRCUITY, overhead=DEFAULT_COMMUTE_OVERHEAD_MINUTES):
+    # type: (np.ndarray, np.ndarray, float, float, float) -> Tuple[np.ndarray, np.ndarray]
+    '''
+    Returns:
+        Tuple[np.ndarray, np.ndarray]
+            (N, M) road miles estimate, (N, M) minutes estimate
+    '''
+    miles = haversine_miles(origins, destinations) * circuity
+    minutes = miles / mph * 60 + overhead
+    return miles, minutes
+
+
+def property_latlon(prop, geocoder=None):
+    # type: (Property, Optional[Geocoder]) -> Optional[Tuple[float, float]]
+    '''
+    the scraped coordinates if the page had them, otherwise the geocoder's (zip centroid unless hand-edited)
+    '''
+    if prop.latitude or prop.longitude:
+        return prop.latitude, prop.longitude
+    if geocoder is None:
+        return None
+    return geocoder.geocode(prop.address)
+
+
+def estimate_commutes(properties, commute_addresses, geocoder, **kwargs):
+    # type: (List[Property], List[str], Geocoder, **float) -> int
+    '''
+    Description:
+        geocode every property and every destination, then fill commute_miles/commute_minutes against the
+        first destination and commutes with all of them, in one matrix pass. kwargs go to commute_matrix.
+
+    Returns:
+        int
+            how many properties got estimates
+    '''
+    if not properties or not commute_addresses:
+        return 0
+    nan = (float('nan'), float('nan'))
+    origins = np.array([property_latlon(prop, geocoder) or nan for prop in properties], dtype=np.float64)
+    destinations = np.array([geocoder.geocode(address) or nan for address in commute_addresses], dtype=np.float64)
+    geocoder.save()
+    for address, latlon in zip(commute_addresses, destinations):
+        if np.isnan(latlon).any():
+            LOGGER.warning('could not geocode commute destination %r', address)
+
+    miles, minutes = commute_matrix(origins, destinations, **kwargs)
+    estimated = 0
+    for p, prop in enumerate(properties):
+        if np.isnan(miles[p]).all():
+            continue
+        prop.commute_miles = round(float(miles[p, 0]), 1) if not np.isnan(miles[p, 0]) else 0.0
+        prop.commute_minutes = round(float(minutes[p, 0]), 0) if not np.isnan(minutes[p, 0]) else 0.0
+        prop.commutes = '; '.join(
+            f'{round(float(minutes[p, d]))} min / {miles[p, d]:0.1f} mi to {address}' for d, address in enumerate(commute_addresses) if not np.isnan(miles[p, d])
+        )
+        estimated += 1
+    return estimated
+
+
+def commute_addresses(commute):
+    # type: (str|List[str]|None) -> List[str]
+    if not commute:
+        return []
+    if isinstance(commute, str):
+        return [commute]
+    return [address for address in commute if address]
+
+
+def estimate_commutes_ez(properties, commute, dirpath):
+    # type: (List[Property], str|List[str]|None, str) -> None
+    addresses = commute_addresses(commute)
+    if not addresses or not properties:
+        return
+    try:
+        geocoder = Geocoder.load(dirpath)
+    except Exception:
+        LOGGER.warning('no zip centroids, skipping commute estimates')
+        LOGGER.debug('no zip centroids, skipping commute estimates', exc_info=True)
+        return
+    estimated = estimate_commutes(properties, addresses, geocoder)
+    LOGGER.info('estimated commutes for %d / %d properties', estimated, len(properties))
+
+
 DEFAULT_PROPERTY = Property()
+# the fields parse_text fills in, the rest are derived by calculate/estimate_commutes
+PARSED_KEYS = ['address', 'property_type', 'price', 'bed', 'bath', 'hoa', 'land_lease', 'area', 'area_unit', 'year', 'commute', 'latitude', 'longitude', 'listing_age', 'listing_agent', 'listing_agent_brokerage', 'status']
+PROPERTY_KEY_TYPES = {key: type(value) for key, value in asdict(DEFAULT_PROPERTY).items()}
 
 
 def realtor_com_populate_commute(driver, url, commute_address):
@@ -297,6 +1005,21 @@ def realtor_com_populate_commute(driver, url, commute_address):
     return True
 
 
+def listing_coordinates_text(driver):
+    # type: (WebDriver) -> str
+    '''
+    both sites ship the listing's latitude/longitude in their page json, it goes into the text as a line parse_text reads back
+    '''
+    try:
+        coordinates = driver.execute_script(LISTING_COORDINATES_SCRIPT)
+    except WebDriverException as ex:
+        LOGGER.debug('no coordinates: %s', ex)
+        return ''
+    if not coordinates:
+        return ''
+    return f'Coordinates: {coordinates[0]}, {coordinates[1]}'
+
+
 def realtor_com_to_text(driver, wait, url, sleep_for=3):
     # type: (WebDriver, WebDriverWait, str, int|float) -> str
     # data = {}
@@ -345,32 +1068,36 @@ def realtor_com_to_text(driver, wait, url, sleep_for=3):
 
     # data['details'] = details_text
     text.append(details_text)
+    text.append(listing_coordinates_text(driver))
     time.sleep(random.randint(0, int(1000 * sleep_for)) / 1000)
 
     return '\n'.join(text)
 
 
-def zillow_captcha_detect_and_solve(driver, captcha_timeout=25):
-    # type: (WebDriver, int|float) -> bool
+def zillow_captcha_detect_and_solve(driver, captcha_timeout=25, detect_timeout=0):
+    # type: (WebDriver, int|float, int|float) -> bool
     '''
     returns whether the captcha was encountered or not
+    detect_timeout=0 is an instant presence check, free when there is no captcha
     '''
-    try:
-        wait = WebDriverWait(driver, timeout=2.5)
-        wait.until(EC.presence_of_element_located((By.ID, 'px-captcha')))  # px-captcha-modal
+    if detect_timeout:
+        try:
+            WebDriverWait(driver, timeout=detect_timeout).until(EC.presence_of_element_located((By.ID, 'px-captcha')))  # px-captcha-modal
+        except TimeoutException:
+            return False
+    elif not driver.find_elements(By.ID, 'px-captcha'):
+        return False
+
+    METRICS.inc('house_captchas_total', host='zillow.com')
+    LOGGER.warning('must solve captcha!')
+    now = time.time()
+    while driver.find_elements(By.ID, 'px-captcha'):
         LOGGER.warning('must solve captcha!')
-        now = time.time()
-        while driver.find_element(By.ID, 'px-captcha'):
-            LOGGER.warning('must solve captcha!')
-            time.sleep(1)
-            if time.time() - now > captcha_timeout:
-                raise RuntimeError('failed captcha timeout!')
-
-        return True
-    except (NoSuchElementException, TimeoutException):
-        pass
+        time.sleep(1)
+        if time.time() - now > captcha_timeout:
+            raise RuntimeError('failed captcha timeout!')
 
-    return False
+    return True
 
 
 def zillow_com_to_text(driver, wait, url, sleep_for=3, captcha_timeout=25):
@@ -384,7 +1111,11 @@ def zillow_com_to_text(driver, wait, url, sleep_for=3, captcha_timeout=25):
     # wait.until(EC.presence_of_element_located((By.XPATH, f'//section[@data-testid="contact-form"]')))
     # wait.until(EC.presence_of_element_located((By.XPATH, '//input[@id="hidden-reg-details"]')))
     # wait.until(EC.presence_of_element_located((By.XPATH, '//div[@id="bdp-building-location"]')))
-    div = wait.until(EC.presence_of_element_located((By.CLASS_NAME, 'layout-static-column-container')))
+    # either the listing or the captcha, whichever shows up first
+    wait.until(EC.any_of(
+        EC.presence_of_element_located((By.CLASS_NAME, 'layout-static-column-container')),
+        EC.presence_of_element_located((By.ID, 'px-captcha')),
+    ))
     captcha_encountered = zillow_captcha_detect_and_solve(driver, captcha_timeout=captcha_timeout)
     if captcha_encountered:
         driver.get(url)
@@ -429,44 +1160,63 @@ def zillow_com_to_text(driver, wait, url, sleep_for=3, captcha_timeout=25):
     for aria_label in aria_labels:
         div = driver.find_element(By.XPATH, f'//div[@aria-label="{aria_label}"]')
         text.append(div.text)
+    text.append(listing_coordinates_text(driver))
 
     time.sleep(random.randint(0, int(1000 * sleep_for)) / 1000)
 
     return '\n'.join(text)
 
 
-def realtor_com_search_page_visit(driver, wait, url):
-    # type: (WebDriver, WebDriverWait, str) -> List[str]
+CARD_FIELD_REGEXES = {
+    'price': re.compile(r'\$\s?([\d,]+)'),
+    'bed': re.compile(r'(\d+(?:\.\d+)?)\s*(?:bd|bds|beds?)\b', flags=re.IGNORECASE),
+    'bath': re.compile(r'(\d+(?:\.\d+)?)\+?\s*(?:ba|baths?)\b', flags=re.IGNORECASE),
+    'area': re.compile(r'([\d,]+)\s*(?:sqft|sq ft|square feet)', flags=re.IGNORECASE),
+    'hoa': re.compile(r'HOA[^$\d\n]*\$\s?([\d,]+)', flags=re.IGNORECASE),
+}
+
+
+def card_fields(text):
+    # type: (str) -> dict
+    '''
+    price/bed/bath/area/hoa off the visible text of a search result card, whatever is not there is left out
+    '''
+    fields = {}
+    for key, regex in CARD_FIELD_REGEXES.items():
+        mo = regex.search(text or '')
+        if mo:
+            fields[key] = float(mo.groups()[0].replace(',', ''))
+    return fields
+
+
+def realtor_com_search_page_visit(driver, wait, url, stable_ticks=4, interval=0.15, timeout=20, cards=None):
+    # type: (WebDriver, WebDriverWait, str, int, int|float, int|float, Optional[List[dict]]) -> List[str]
+    '''
+    Description:
+        one scripted scroll to the bottom until the lazy-loaded card count stops growing
+        (or the paginator/end of results shows up), then every card href and card text in the same call
+        cards gets url + card_fields per card
+    '''
     # url = 'https://www.realtor.com/realestateandhomes-search/San-Jose_CA'
     if driver.current_url != url:
         driver.get(url)
     LOGGER.debug('scrapping page %s', url)
     wait.until(EC.presence_of_element_located((By.XPATH, '//div[@data-testid="card-content"]//a')))
-    body = driver.find_element(By.XPATH, '//body')  # still exists
-    while True:
-        try:
-            # no matches found
-            driver.find_element(By.XPATH, '//p[contains(normalize-space(.), "nd of matching")]')
-            break
-        except NoSuchElementException:
-            pass
-
-        try:
-            # paginator found
-            driver.find_element(By.XPATH, '//div[@aria-label="pagination"]')
-            break
-        except NoSuchElementException:
-            body.send_keys(Keys.PAGE_DOWN)
-            time.sleep(0.1)
-
+    driver.set_script_timeout(timeout + 5)
+    harvested = driver.execute_async_script(
+        REALTOR_SEARCH_HARVEST_SCRIPT,
+        'div[data-testid="card-content"]',
+        'a',
+        stable_ticks,
+        int(interval * 1000),
+        int(timeout * 1000),
+    )
     urls = []
-    for anchor in driver.find_elements(By.XPATH, '//div[@data-testid="card-content"]//a'):
-        href = anchor.get_attribute('href')
-        if not href:
-            continue
-        else:
-            urls.append(urljoin(url, href))
-
+    for card in harvested or []:
+        card_urls = [urljoin(url, href) for href in card['hrefs']]
+        urls.extend(card_urls)
+        if cards is not None and card_urls:
+            cards.append(dict(url=card_urls[0], **card_fields(card['text'])))
     return urls
 
 
@@ -480,10 +1230,18 @@ def realtor_com_search(
     price_min=None,
     show_contingent=False,
     sleep_for=3,
+    meta=None,
+    cards=None,
 ):
-    # type: (WebDriver, WebDriverWait, Optional[str], Optional[str], Optional[int], Optional[int|float], Optional[int|float], bool, int|float) -> List[str]
+    # type: (WebDriver, WebDriverWait, Optional[str], Optional[str], Optional[int], Optional[int|float], Optional[int|float], bool, int|float, Optional[dict], Optional[List[dict]]) -> List[str]
+    '''
+    Description:
+        meta gets pages, how many result pages realtor said the search has, so a sharded search can tell it was capped
+        cards gets the card-level fields of every result, see card_fields
+    '''
     if not ((city and state) or (zip)):
         raise ValueError('must provide either city and state OR zip!')
+    meta = {} if meta is None else meta
 
     # searching manually:
     # url = 'https://www.realtor.com'
@@ -519,13 +1277,14 @@ def realtor_com_search(
     # https://www.realtor.com/realestateandhomes-search/San-Jose_CA/pnd-ctg-hide/price-na-400000
     search_url = f'{"/".join(tokens)}/'
     LOGGER.info('%s', search_url)
-    urls = realtor_com_search_page_visit(driver, wait, search_url)  # page 1
+    urls = realtor_com_search_page_visit(driver, wait, search_url, cards=cards)  # page 1
     LOGGER.info('scraped page 1, %d urls discovered so far', len(urls))
 
     # see if htere is a page 2
     try:
         # no matches found
         driver.find_element(By.XPATH, '//p[contains(normalize-space(.), "nd of matching")]')
+        meta['pages'] = 1
         return urls
     except NoSuchElementException:
         pass
@@ -536,6 +1295,7 @@ def realtor_com_search(
     if not max_page_mo:
         raise RuntimeError('could not find the max page for the search!')
     max_page = int(max_page_mo.groups()[0])
+    meta['pages'] = max_page
     if max_page > 1:
         base = urlparse(driver.current_url)
         base_url = f'{base.scheme}://{base.hostname}{base.path}/'
@@ -544,15 +1304,15 @@ def realtor_com_search(
             # https://www.realtor.com/realestateandhomes-search/San-Jose_CA/pg-2
             # https://www.realtor.com/realestateandhomes-search/San-Jose_CA/pg-3...
             search_url_page = urljoin(base_url, f'pg-{page}')
-            urls.extend(realtor_com_search_page_visit(driver, wait, search_url_page))
+            urls.extend(realtor_com_search_page_visit(driver, wait, search_url_page, cards=cards))
             time.sleep(random.randint(0, int(1000 * sleep_for)) / 1000)
 
     LOGGER.info('found %d urls', len(urls))
     return urls
 
 
-def zillow_com_search_page_visit(driver, wait):
-    # type: (WebDriver, WebDriverWait) -> List[str]
+def zillow_com_search_page_visit(driver, wait, cards=None):
+    # type: (WebDriver, WebDriverWait, Optional[List[dict]]) -> List[str]
 
     # this div IS interactable, others arent..
     grid = wait.until(EC.presence_of_element_located((By.XPATH, '//div[@id="search-page-list-container"]')))
@@ -561,16 +1321,104 @@ def zillow_com_search_page_visit(driver, wait):
         time.sleep(0.1)
 
     urls = []
-    for anchor in driver.find_elements(By.XPATH, '//div[@data-testid="property-card-data"]/a'):
-        href = anchor.get_attribute('href')
+    for card in driver.find_elements(By.XPATH, '//div[@data-testid="property-card-data"]'):
+        anchors = card.find_elements(By.XPATH, './a')
+        href = anchors[0].get_attribute('href') if anchors else None
         if not href:
             continue
         else:
             urls.append(href)
+            if cards is not None:
+                cards.append(dict(url=href, **card_fields(card.text)))
 
     return urls
 
 
+def zillow_com_search_results_parse(payload, base_url='https://www.zillow.com'):
+    # type: (dict, str) -> Tuple[List[dict], int]
+    '''
+    Description:
+        pull the cards out of one page of the search-state json, no browser needed
+    Returns:
+        Tuple[List[dict], int]
+            cards of url, zpid, price, bed, bath, area, address, status
+            total pages zillow says the search has
+    '''
+    cat1 = payload.get('cat1', {})
+    cards = []
+    for result in cat1.get('searchResults', {}).get('listResults', []):
+        detail_url = result.get('detailUrl')
+        if not detail_url:
+            continue
+        home_info = result.get('hdpData', {}).get('homeInfo', {})
+        cards.append(
+            dict(
+                url=urljoin(base_url, detail_url),
+                zpid=str(result.get('zpid', '')),
+                price=result.get('unformattedPrice') or home_info.get('price'),
+                bed=result.get('beds') or home_info.get('bedrooms'),
+                bath=result.get('baths') or home_info.get('bathrooms'),
+                area=result.get('area') or home_info.get('livingArea'),
+                address=result.get('address', ''),
+                status=result.get('statusText', ''),
+            )
+        )
+    total_pages = cat1.get('searchList', {}).get('totalPages') or 1
+    return cards, int(total_pages)
+
+
+def zillow_com_search_state_fetch(driver, search_query_state, page=1, url=URL_ZILLOW_SEARCH_STATE, timeout=20):
+    # type: (WebDriver, dict, int, str, int|float) -> dict
+    '''
+    Description:
+        ask for one page of results the same way the grid does, from inside the page so cookies come along
+    Raises:
+        RuntimeError: zillow said no, usually a captcha
+    '''
+    query_state = dict(search_query_state, pagination={'currentPage': page})
+    body = dict(searchQueryState=query_state, wants={'cat1': ['listResults'], 'cat2': ['total']}, requestId=page)
+    driver.set_script_timeout(timeout)
+    payload = driver.execute_async_script(ZILLOW_SEARCH_STATE_SCRIPT, url, body)
+    if not isinstance(payload, dict) or 'error' in payload:
+        raise RuntimeError(f'search-state page {page} failed: {payload.get("error") if isinstance(payload, dict) else payload!r}')
+    return payload
+
+
+def zillow_com_search_state(driver, search_query_state, url=URL_ZILLOW_SEARCH_STATE, page_max=None, sleep_for=0.5, meta=None):
+    # type: (WebDriver, dict, str, Optional[int], int|float, Optional[dict]) -> Tuple[List[str], List[dict]]
+    '''
+    Description:
+        every page of the search straight from the search-state json, no scrolling, no paginator clicks
+        meta gets pages, the total zillow reported before page_max
+    Returns:
+        Tuple[List[str], List[dict]]
+            urls in result order, deduped
+            card-level fields for each url
+    '''
+    parsed = urlparse(url)
+    base_url = f'{parsed.scheme}://{parsed.netloc}'
+    urls, cards, seen = [], [], set()
+    page, total_pages = 1, 1
+    while page <= total_pages:
+        payload = zillow_com_search_state_fetch(driver, search_query_state, page=page, url=url)
+        page_cards, total_pages = zillow_com_search_results_parse(payload, base_url=base_url)
+        if meta is not None:
+            meta['pages'] = total_pages
+        if page_max:
+            total_pages = min(total_pages, page_max)
+        for card in page_cards:
+            if card['url'] in seen:
+                continue
+            seen.add(card['url'])
+            urls.append(card['url'])
+            cards.append(card)
+        LOGGER.info('search-state page %d / %d, %d urls discovered so far', page, total_pages, len(urls))
+        page += 1
+        if page <= total_pages and sleep_for:
+            time.sleep(random.randint(0, int(1000 * sleep_for)) / 1000)
+    return urls, cards
+
+
 def zillow_com_home(driver, wait):
     # type: (WebDriver, WebDriverWait) -> bool
     driver.get('https://zillow.com')
@@ -594,10 +1442,18 @@ def zillow_com_search(
     price_min=None,
     show_contingent=False,
     sleep_for=3,
+    search_state=True,
+    cards=None,
+    meta=None,
 ):
-    # type: (WebDriver, WebDriverWait, Optional[str], Optional[str], Optional[int], Optional[int|float], Optional[int|float], bool, int|float) -> List[str]
+    # type: (WebDriver, WebDriverWait, Optional[str], Optional[str], Optional[int], Optional[int|float], Optional[int|float], bool, int|float, bool, Optional[List[dict]], Optional[dict]) -> List[str]
+    '''
+    Description:
+        meta gets pages, how many result pages zillow said the search has, so a sharded search can tell it was capped
+    '''
     if not ((city and state) or (zip)):
         raise ValueError('must provide either city and state OR zip!')
+    meta = {} if meta is None else meta
 
     zillow_com_home(driver, wait)
 
@@ -621,7 +1477,7 @@ def zillow_com_search(
     except NoSuchElementException:
         pass
 
-    captcha_encountered = zillow_captcha_detect_and_solve(driver)
+    captcha_encountered = zillow_captcha_detect_and_solve(driver, detect_timeout=2.5)  # once per search, the results page is still loading
     if captcha_encountered:
         zillow_com_home(driver, wait)
         driver.refresh()
@@ -671,6 +1527,17 @@ def zillow_com_search(
     minified = re.sub(r'(\s{2,}|\n)', '', json.dumps(data))
     minified = re.sub(r'([\:,]) ', r'\g<1>', minified)
 
+    if search_state:
+        # already on a zillow page so the fetch is same-origin
+        try:
+            urls, search_cards = zillow_com_search_state(driver, data, meta=meta)
+            if cards is not None:
+                cards.extend(search_cards)
+            LOGGER.info('found %d urls', len(urls))
+            return urls
+        except (WebDriverException, RuntimeError, KeyError, ValueError, TypeError) as ex:
+            LOGGER.warning('search-state json failed, falling back to scrolling the grid: %s', ex)
+
     search_url = f'{parsed.scheme}://{parsed.hostname}{parsed.path}?{query}={minified}'
     LOGGER.debug('modified the search url from %s to %s', url, search_url)
     driver.get(search_url)
@@ -681,10 +1548,11 @@ def zillow_com_search(
         max_page = int(pages[-1])
     except NoSuchElementException:
         max_page = 1
+    meta['pages'] = max_page
     LOGGER.info('%d pages to search through!', max_page)
     page = 1
 
-    urls = zillow_com_search_page_visit(driver, wait)  # visit the current page
+    urls = zillow_com_search_page_visit(driver, wait, cards=cards)  # visit the current page
     LOGGER.info('scraped page %d, %d urls discovered so far', page, len(urls))
 
     while True:
@@ -699,7 +1567,7 @@ def zillow_com_search(
 
         LOGGER.info('scrapping %d / %d, %d urls discovered so far', page, max_page, len(urls))
         next_arrow.click()
-        new_urls = zillow_com_search_page_visit(driver, wait)
+        new_urls = zillow_com_search_page_visit(driver, wait, cards=cards)
         urls.extend(new_urls)
         time.sleep(random.randint(0, int(1000 * sleep_for)) / 1000)
 
@@ -707,6 +1575,498 @@ def zillow_com_search(
     return urls
 
 
+def daemon_state(daemon_filepath=DEFAULT_DAEMON_FILEPATH, timeout=1.0):
+    # type: (str, int|float) -> Optional[dict]
+    '''
+    Description:
+        read the state file written by the daemon and make sure the browser behind it still answers on the debugger address
+
+    Returns:
+        Optional[dict]
+            None if there is no daemon or it died without cleaning up after itself
+    '''
+    if not is_file(daemon_filepath):
+        return None
+    try:
+        with open(daemon_filepath, 'r', encoding='utf-8') as r:
+            state = json.load(r)
+        with urllib.request.urlopen(f'http://{state["debugger_address"]}/json/version', timeout=timeout) as response:
+            response.read()
+        return state
+    except Exception:
+        LOGGER.debug('daemon state "%s" is stale', daemon_filepath, exc_info=True)
+        return None
+
+
+def attach_driver(debugger_address, driver_executable_path='', performance_log=False):
+    # type: (str, str, bool) -> WebDriver
+    '''
+    Description:
+        attach to an already running chrome over its debugger address, the browser outlives this driver.
+        the daemon's patched chromedriver is preferred so the cdc_ fingerprint stays gone, selenium-manager otherwise.
+    '''
+    options = webdriver.ChromeOptions()
+    options.debugger_address = debugger_address
+    if performance_log:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    if driver_executable_path and is_file(driver_executable_path):
+        service = Service(executable_path=driver_executable_path)
+    else:
+        service = Service()
+    return webdriver.Chrome(options=options, service=service)
+
+
+# uc's Patcher unlinks, downloads and patches one shared chromedriver on every launch, two threads launching at once get
+# "Text file busy", a missing binary or a half-patched one, and unlinks the one a running daemon uses.
+# so launches take turns and reuse the daemon's or this process's already patched chromedriver
+DRIVER_LAUNCH_LOCK = threading.Lock()
+PATCHED_DRIVER = {}  # type: Dict[str, str]
+
+
+def get_driver(headless=False, attach=True, daemon_filepath=DEFAULT_DAEMON_FILEPATH, performance_log=False, profile_dirpath=''):
+    # type: (bool, bool, str, bool, str) -> WebDriver
+    '''
+    Description:
+        attach to the daemon's warmed browser if one is running, otherwise cold-start a fresh one
+        performance_log turns on the devtools network log that ResourceBlocker reads its stats from
+        profile_dirpath keeps a cold-started browser's profile there instead of a throwaway one, driver.attached tells them apart
+        headless never attaches to a daemon that shows its window, it cold-starts a headless browser instead
+        cold starts take turns on DRIVER_LAUNCH_LOCK, so WarmPool and shard threads can call this at the same time
+    '''
+    state = daemon_state(daemon_filepath) if attach else None
+    if state and headless and not state.get('headless'):
+        LOGGER.warning('the daemon at %s is not headless, cold-starting a headless browser instead of attaching', state['debugger_address'])
+        state = None
+    if state:
+        LOGGER.info('attaching to the daemon browser at %s', state['debugger_address'])
+        driver = attach_driver(state['debugger_address'], driver_executable_path=state.get('driver_executable_path', ''), performance_log=performance_log)
+        driver.browser_pid = state.get('browser_pid')  # type: ignore
+        driver.attached = True  # type: ignore
+    else:
+        options = uc.ChromeOptions()
+        if performance_log:
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        kwargs = dict(options=options, headless=headless, use_subprocess=True)  # NOTE: use_subprocess=False in python interactive mode
+        if profile_dirpath:
+            kwargs['user_data_dir'] = profile_dirpath
+        with DRIVER_LAUNCH_LOCK:
+            patched_filepath = PATCHED_DRIVER.get('filepath') or (daemon_state(daemon_filepath) or {}).get('driver_executable_path', '')
+            if patched_filepath and is_file(patched_filepath):
+                kwargs['driver_executable_path'] = patched_filepath  # a given path is only checked, never unlinked or refetched
+            driver = uc.Chrome(**kwargs)
+            PATCHED_DRIVER['filepath'] = driver.patcher.executable_path
+        driver.attached = False  # type: ignore
+    watch_driver_memory(driver)
+    return driver
+
+
+WATCHED_BROWSERS = {}  # type: Dict[object, int]
+WATCHED_BROWSERS_LOCK = threading.Lock()
+
+
+def watch_driver_memory(driver):
+    # type: (WebDriver) -> None
+    '''
+    one house_driver_memory_bytes series per browser pid, counted per driver since every driver attached to the daemon
+    shares its pid. call unwatch_driver_memory when a driver quits, the series goes when the last driver on that browser does.
+    '''
+    pid = getattr(driver, 'browser_pid', None)
+    browser = pid or id(driver)
+    with WATCHED_BROWSERS_LOCK:
+        WATCHED_BROWSERS[browser] = WATCHED_BROWSERS.get(browser, 0) + 1
+        if WATCHED_BROWSERS[browser] == 1:
+            METRICS.gauge_callback('house_driver_memory_bytes', lambda: browser_memory_bytes(pid), browser=browser)
+
+
+def unwatch_driver_memory(driver):
+    # type: (WebDriver) -> None
+    browser = getattr(driver, 'browser_pid', None) or id(driver)
+    with WATCHED_BROWSERS_LOCK:
+        if browser not in WATCHED_BROWSERS:
+            return
+        WATCHED_BROWSERS[browser] -= 1
+        if WATCHED_BROWSERS[browser] <= 0:
+            del WATCHED_BROWSERS[browser]
+            METRICS.drop_callback('house_driver_memory_bytes', browser=browser)
+
+
+def driver_memory_bytes(driver):
+    # type: (WebDriver) -> int
+    '''
+    rss of the browser process and every renderer/gpu/utility child it spawned, 0 if it is gone or unknown
+    '''
+    return browser_memory_bytes(getattr(driver, 'browser_pid', None))
+
+
+def browser_memory_bytes(pid):
+    # type: (Optional[int]) -> int
+    if not pid:
+        return 0
+    try:
+        process = psutil.Process(pid)
+        processes = [process] + process.children(recursive=True)
+    except psutil.Error:
+        return 0
+    rss = 0
+    for process in processes:
+        try:
+            rss += process.memory_info().rss
+        except psutil.Error:
+            continue
+    return rss
+
+
+PAGE_HEAP_SCRIPT = 'return window.performance && performance.memory ? performance.memory.usedJSHeapSize : 0;'
+COOKIE_PARAM_KEYS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires')
+
+
+@dataclass
+class RecycleLimits:
+    '''
+    a browser is relaunched once any one of these is crossed, 0 turns that one off
+    '''
+    rss_mb: float = 2048.0
+    heap_mb: float = 512.0
+    pages: int = 250
+
+
+class DriverRecycler():
+    '''
+    Description:
+        owns the browser for a long run. after every page it samples the rss of the browser process tree and the js heap
+        of the page, and past RecycleLimits it relaunches the browser: cookies are carried over through devtools and the
+        profile dirpath is reused, so logins, the realtor commute and captcha clearance survive the relaunch.
+        a browser this did not launch (the daemon's, or a driver handed in) is never quit, its tab is swapped for a fresh
+        one instead, which is where most of the growth lives anyway.
+        read .driver and .wait every time, they change under you.
+    '''
+
+    def __init__(self, driver=None, headless=False, attach=True, performance_log=False, limits=None):
+        # type: (Optional[WebDriver], bool, bool, bool, Optional[RecycleLimits]) -> None
+        self.headless = headless
+        self.attach = attach
+        self.performance_log = performance_log
+        self.limits = limits or RecycleLimits()
+        self.borrowed = driver is not None
+        self.profile_dirpath = ''
+        self.lifetimes = []  # type: List[dict]
+        self.peak_rss = 0
+        self.peak_heap = 0
+        self.driver = driver or self.launch()
+        self.wait = WebDriverWait(self.driver, 20)
+        self.current = dict(started=time.time(), pages=0, peak_rss=0, peak_heap=0)
+
+    @property
+    def owned(self):
+        # type: () -> bool
+        return not self.borrowed and not getattr(self.driver, 'attached', False)
+
+    def launch(self):
+        # type: () -> WebDriver
+        if not self.profile_dirpath:
+            make_dirpath(TEMP_DIRPATH)
+            self.profile_dirpath = tempfile.mkdtemp(prefix='house-profile-', dir=TEMP_DIRPATH)
+        return get_driver(headless=self.headless, attach=self.attach, performance_log=self.performance_log, profile_dirpath=self.profile_dirpath)
+
+    def sample(self):
+        # type: () -> Tuple[int, int]
+        '''
+        Returns:
+            Tuple[int, int]
+                (rss of the browser process tree, js heap of the current page) in bytes, 0 for whatever is unknown
+        '''
+        rss = driver_memory_bytes(self.driver)
+        try:
+            heap = int(self.driver.execute_script(PAGE_HEAP_SCRIPT) or 0)
+        except Exception:
+            heap = 0
+        return rss, heap
+
+    def page_done(self):
+        # type: () -> str
+        '''
+        call after every url that reached a final state, cached or fetched, succeeded or failed
+        Returns:
+            str
+                why the browser was recycled (rss/heap/pages), empty if it was not
+        '''
+        rss, heap = self.sample()
+        self.current['pages'] += 1
+        self.current['peak_rss'] = max(self.current['peak_rss'], rss)
+        self.current['peak_heap'] = max(self.current['peak_heap'], heap)
+        self.peak_rss = max(self.peak_rss, rss)
+        self.peak_heap = max(self.peak_heap, heap)
+        METRICS.set('house_page_heap_bytes', heap)
+        METRICS.set('house_driver_peak_memory_bytes', max(self.peak_rss, METRICS.get('house_driver_peak_memory_bytes')))
+
+        reason = ''
+        if self.limits.rss_mb and rss > self.limits.rss_mb * 1024 * 1024:
+            reason = 'rss'
+        elif self.limits.heap_mb and heap > self.limits.heap_mb * 1024 * 1024:
+            reason = 'heap'
+        elif self.limits.pages and self.current['pages'] >= self.limits.pages:
+            reason = 'pages'
+        if reason:
+            LOGGER.info('recycling the browser after %d pages (%s): rss %0.0f MB, page heap %0.0f MB', self.current['pages'], reason, rss / 1024**2, heap / 1024**2)
+            self.recycle(reason)
+        return reason
+
+    def cookies(self):
+        # type: () -> List[dict]
+        try:
+            cookies = self.driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+        except Exception:
+            LOGGER.warning('could not read the cookies off the old browser, the new one starts without them', exc_info=True)
+            return []
+        kept = []
+        for cookie in cookies:
+            kept.append({key: cookie[key] for key in COOKIE_PARAM_KEYS if key in cookie and not (key == 'expires' and cookie.get('session'))})
+        return kept
+
+    def retire(self, reason):
+        # type: (str) -> None
+        lifetime = dict(self.current, seconds=time.time() - self.current['started'], reason=reason)
+        lifetime.pop('started')
+        self.lifetimes.append(lifetime)
+        self.current = dict(started=time.time(), pages=0, peak_rss=0, peak_heap=0)
+
+    def recycle(self, reason):
+        # type: (str) -> None
+        METRICS.inc('house_driver_recycles_total', reason=reason)
+        self.retire(reason)
+        if self.owned:
+            cookies = self.cookies()
+            unwatch_driver_memory(self.driver)
+            try:
+                self.driver.quit()
+            except Exception:
+                LOGGER.debug('old browser did not quit cleanly', exc_info=True)
+            self.driver = self.launch()
+            if cookies:
+                try:
+                    self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+                except Exception:
+                    LOGGER.warning('could not carry %d cookies over to the new browser', len(cookies), exc_info=True)
+        else:
+            self.fresh_tab()
+        self.wait = WebDriverWait(self.driver, 20)
+
+    def fresh_tab(self):
+        # type: () -> None
+        '''
+        swap the current tab for a brand-new one, same browser, same cookies, none of the old page
+        '''
+        old_handle = self.driver.current_window_handle
+        self.driver.switch_to.new_window('tab')
+        new_handle = self.driver.current_window_handle
+        self.driver.switch_to.window(old_handle)
+        self.driver.close()
+        self.driver.switch_to.window(new_handle)
+
+    def report(self):
+        # type: () -> dict
+        '''
+        Returns:
+            dict
+                browsers, recycles by reason, peak rss/heap in bytes and the average pages and seconds per browser
+        '''
+        lifetimes = self.lifetimes + [dict(self.current, seconds=time.time() - self.current['started'], reason='')]
+        reasons = {}  # type: Dict[str, int]
+        for lifetime in self.lifetimes:
+            reasons[lifetime['reason']] = reasons.get(lifetime['reason'], 0) + 1
+        stats = dict(
+            browsers=len(lifetimes),
+            recycles=reasons,
+            peak_rss=self.peak_rss,
+            peak_heap=self.peak_heap,
+            pages_per_browser=sum(lifetime['pages'] for lifetime in lifetimes) / len(lifetimes),
+            seconds_per_browser=sum(lifetime['seconds'] for lifetime in lifetimes) / len(lifetimes),
+        )
+        LOGGER.info(
+            '%d browser(s), recycled %s, peak rss %0.0f MB, peak page heap %0.0f MB, %0.1f pages / %0.0f sec per browser',
+            stats['browsers'],
+            json.dumps(reasons) if reasons else 'never',
+            self.peak_rss / 1024**2,
+            self.peak_heap / 1024**2,
+            stats['pages_per_browser'],
+            stats['seconds_per_browser'],
+        )
+        return stats
+
+    def close(self):
+        # type: () -> dict
+        '''
+        report, quit the browser if this launched it and drop the profile dirpath
+        '''
+        stats = self.report()
+        if self.owned:
+            unwatch_driver_memory(self.driver)
+            try:
+                self.driver.quit()
+            except Exception:
+                LOGGER.debug('browser did not quit cleanly', exc_info=True)
+        if self.profile_dirpath:
+            shutil.rmtree(self.profile_dirpath, ignore_errors=True)
+        return stats
+
+
+def load_block_config(block_config_filepath=''):
+    # type: (str) -> Dict[str, dict]
+    '''
+    Description:
+        json like DEFAULT_BLOCK_CONFIG, {hostname: {resource_types: [Image, ...], url_patterns: [*tracker.com*, ...]}}
+        hosts given in the file replace the defaults for that host, the rest keep the defaults
+    '''
+    block_config = {hostname: dict(config) for hostname, config in DEFAULT_BLOCK_CONFIG.items()}
+    if block_config_filepath:
+        with open(block_config_filepath, 'r', encoding='utf-8') as r:
+            block_config.update(json.load(r))
+    for hostname, config in block_config.items():
+        for resource_type in config.get('resource_types', []):
+            if resource_type not in RESOURCE_TYPE_URL_PATTERNS:
+                raise ValueError(f'{hostname!r} blocks unknown resource type {resource_type!r}, pick from {list(RESOURCE_TYPE_URL_PATTERNS)}')
+    return block_config
+
+
+class ResourceBlocker():
+    '''
+    Description:
+        blocks resource types and url patterns per host through devtools network interception (Network.setBlockedURLs)
+        and tallies what got through vs what got blocked from the performance log, if the driver has one.
+    '''
+
+    def __init__(self, block_config=None):
+        # type: (Optional[Dict[str, dict]]) -> None
+        self.block_config = block_config or load_block_config()
+        self.applied = {}  # type: Dict[str, str]
+        self.stats = {}  # type: Dict[str, Dict[str, int]]
+        self.pending = {}  # type: Dict[str, Tuple[str, str]]
+        self.lock = threading.Lock()  # the WarmPool threads share one blocker
+
+    def patterns(self, hostname):
+        # type: (str) -> List[str]
+        for host, config in self.block_config.items():
+            if host in hostname:
+                patterns = []
+                for resource_type in config.get('resource_types', []):
+                    patterns.extend(RESOURCE_TYPE_URL_PATTERNS[resource_type])
+                patterns.extend(config.get('url_patterns', []))
+                return patterns
+        return []
+
+    def apply(self, driver, url):
+        # type: (WebDriver, str) -> None
+        '''
+        call before driver.get(url), the block list sticks to the tab so it is only resent when the host changes
+        '''
+        hostname = urlparse(url).hostname or ''
+        if self.applied.get(driver.session_id) == hostname:
+            return
+        patterns = self.patterns(hostname)
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        self.applied[driver.session_id] = hostname
+        LOGGER.debug('blocking %d url patterns on %s', len(patterns), hostname)
+
+    def collect(self, driver, hostname):
+        # type: (WebDriver, str) -> None
+        '''
+        drain the performance log after a page and tally requests/bytes loaded vs requests blocked
+        '''
+        try:
+            entries = driver.get_log('performance')
+        except Exception:
+            LOGGER.debug('no performance log on this driver, no blocking stats', exc_info=True)
+            return
+        with self.lock:
+            stats = self.stats.setdefault(hostname, dict(pages=0, requests=0, requests_blocked=0, bytes_loaded=0, bytes_saved_estimate=0))
+            stats['pages'] += 1
+            for entry in entries:
+                message = json.loads(entry['message'])['message']
+                method, params = message.get('method'), message.get('params', {})
+                if method == 'Network.requestWillBeSent':
+                    stats['requests'] += 1
+                    self.pending[params['requestId']] = (params.get('type', 'Other'), params.get('request', {}).get('url', ''))
+                elif method == 'Network.loadingFinished':
+                    stats['bytes_loaded'] += int(params.get('encodedDataLength', 0))
+                    self.pending.pop(params['requestId'], None)
+                elif method == 'Network.loadingFailed':
+                    resource_type, _ = self.pending.pop(params['requestId'], (params.get('type', 'Other'), ''))
+                    if params.get('blockedReason'):
+                        stats['requests_blocked'] += 1
+                        stats['bytes_saved_estimate'] += RESOURCE_TYPE_ESTIMATED_BYTES.get(resource_type, RESOURCE_TYPE_ESTIMATED_BYTES['Other'])
+            self.pending.clear()  # whatever is still in flight belongs to a page we are done with
+
+    def report(self):
+        # type: () -> None
+        for hostname, stats in self.stats.items():
+            LOGGER.info(
+                '%s - %d pages, %d / %d requests blocked, %0.1f MB loaded, ~%0.1f MB saved',
+                hostname,
+                stats['pages'],
+                stats['requests_blocked'],
+                stats['requests'],
+                stats['bytes_loaded'] / 1e6,
+                stats['bytes_saved_estimate'] / 1e6,
+            )
+
+
+def daemon(
+    debug_port=DEFAULT_CHROME_DEBUG_PORT,
+    profile_dirpath=DEFAULT_PROFILE_DIRPATH,
+    daemon_filepath=DEFAULT_DAEMON_FILEPATH,
+    headless=False,
+    poll_for=1,
+):
+    # type: (int, str, str, bool, int|float) -> None
+    '''
+    Description:
+        keep a warmed browser alive with a persistent profile so cookies, the patched chromedriver
+        and already-solved captchas survive between runs. other modes find it via the daemon state file.
+    '''
+    state = daemon_state(daemon_filepath)
+    if state:
+        raise RuntimeError(f'a daemon is already running at {state["debugger_address"]} with pid {state["pid"]}!')
+
+    make_dirpath(profile_dirpath)
+    # NOTE: use_subprocess=False in python interactive mode
+    with DRIVER_LAUNCH_LOCK:
+        driver = uc.Chrome(headless=headless, use_subprocess=True, user_data_dir=profile_dirpath, port=debug_port)
+    watch_driver_memory(driver)
+    wait = WebDriverWait(driver, 20)
+
+    for warmup_url in DAEMON_WARMUP_URLS:
+        LOGGER.info('warming up on %s', warmup_url)
+        driver.get(warmup_url)
+        wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
+        if 'zillow.com' in warmup_url:
+            zillow_captcha_detect_and_solve(driver)
+
+    state = dict(
+        pid=os.getpid(),
+        browser_pid=driver.browser_pid,
+        debugger_address=driver.options.debugger_address,
+        driver_executable_path=driver.patcher.executable_path,
+        profile_dirpath=profile_dirpath,
+        headless=headless,
+        started=datetime.datetime.now().isoformat(),
+    )
+    write_text_file(daemon_filepath, json.dumps(state, indent=2))
+    LOGGER.info('daemon listening at %s, ctrl + c to stop', state['debugger_address'])
+
+    try:
+        while get_url(driver) is not None:
+            time.sleep(poll_for)
+        LOGGER.warning('browser went away!')
+    except KeyboardInterrupt:
+        LOGGER.warning('ctrl + c detected!')
+    finally:
+        if os.path.isfile(daemon_filepath):
+            os.remove(daemon_filepath)
+        unwatch_driver_memory(driver)
+        driver.quit()
+
+
 @dataclass
 class Arguments:
     '''
@@ -714,7 +2074,7 @@ class Arguments:
     '''
     mode: str = ''
     input_filepath: str = ''
-    commute: str = ''
+    commute: List[str] = field(default_factory=list)
     output_dirpath: str = DEFAULT_OUTPUT_DIRPATH
 
     city: Optional[str] = None
@@ -723,6 +2083,56 @@ class Arguments:
     price_max: Optional[int | float] = None
     price_min: Optional[int | float] = None
     show_contingent: bool = False
+    scroll: bool = False
+    queue: bool = False
+    queue_filepath: str = ''
+    exit_when_empty: bool = False
+    in_tab: bool = False
+    workers: int = 2
+    bands: int = 1
+    shard_zip: Optional[List[int]] = None
+    shard_miles: Optional[float] = None
+    max_monthly: Optional[float] = None
+    query: str = ''
+    limit: int = 50
+    fields: Optional[List[str]] = None
+    where: str = ''
+    miles: Optional[float] = None
+    bbox: Optional[str] = None
+    interval: float = 3.0
+
+    debug_port: int = DEFAULT_CHROME_DEBUG_PORT
+    profile_dirpath: str = DEFAULT_PROFILE_DIRPATH
+    headless: bool = False
+    daemon_filepath: str = DEFAULT_DAEMON_FILEPATH
+    no_daemon: bool = False
+    block: bool = False
+    block_config_filepath: str = ''
+    archive: bool = False
+    metrics_port: Optional[int] = None
+    metrics_filepath: str = ''
+    recycle_mb: float = RecycleLimits.rss_mb
+    recycle_heap_mb: float = RecycleLimits.heap_mb
+    recycle_pages: int = RecycleLimits.pages
+
+    k: int = 10
+    score: str = 'total'
+    bed_min: Optional[int] = None
+    property_type: Optional[List[str]] = None
+    hoa_max: Optional[float] = None
+    land_lease_max: Optional[float] = None
+
+    refresh: bool = False
+    since: str = ''
+    listing: str = ''
+    as_of: str = ''
+
+    hold_years: int = 10
+    years: int = 30
+    down: float = 20.0
+    hoa_growth: float = 3.0
+    land_lease_growth: float = 3.0
+    appreciation: float = 0.0
 
     debug: bool = False
     log_level: str = 'INFO'
@@ -730,13 +2140,30 @@ class Arguments:
 
     @staticmethod
     def add_common_arguments(parser):
-        parser.add_argument('--commute', '-c', type=str, help='an address youd like to calculate a commute from')
+        parser.add_argument('--commute', '-c', type=str, action='append', help='an address youd like to calculate a commute from, repeat for more destinations')
         parser.add_argument('--output-dirpath', '-o', type=str, default=DEFAULT_OUTPUT_DIRPATH, help='where do you want to save the output json and downloaded descriptions')
+        parser.add_argument('--daemon-filepath', type=str, default=DEFAULT_DAEMON_FILEPATH, help='state file of a running "house daemon" to attach to')
+        parser.add_argument('--no-daemon', action='store_true', help='cold-start a fresh browser even if a daemon is running')
+        parser.add_argument('--headless', action='store_true', help='run the browser headless, captchas will be unsolvable')
+        parser.add_argument('--metrics-port', type=int, help='serve prometheus style metrics at http://127.0.0.1:<port>/metrics')
+        parser.add_argument('--metrics-filepath', type=str, default='', help='rewrite prometheus style metrics to this file every few seconds')
 
         parser.add_argument('--debug', action='store_true', help='chose to print debug info')
         parser.add_argument('--log-level', type=str, default='INFO', choices=NAME_TO_LEVEL, help='log level?')
         parser.add_argument('--log-filepath', type=str, default=DEFAULT_LOG_FILEPATH, help='log filepath?')
 
+    @staticmethod
+    def add_recycle_arguments(parser):
+        parser.add_argument('--recycle-mb', type=float, default=RecycleLimits.rss_mb, help='relaunch a browser once it and its children pass this much rss, 0 never')
+        parser.add_argument('--recycle-heap-mb', type=float, default=RecycleLimits.heap_mb, help='relaunch once a page js heap passes this, 0 never')
+        parser.add_argument('--recycle-pages', type=int, default=RecycleLimits.pages, help='relaunch every this many pages regardless, 0 never')
+
+    @staticmethod
+    def add_block_arguments(parser):
+        parser.add_argument('--block', action='store_true', help='block images/fonts/media/trackers on detail pages via devtools, pairs well with --headless')
+        parser.add_argument('--block-config-filepath', type=str, default='', help='json of {hostname: {resource_types: [], url_patterns: []}} overriding the defaults')
+        parser.add_argument('--archive', action='store_true', help='keep the rendered html of every browser fetch, lzma\'d under <output-dirpath>/html-archive, for reextract')
+
     @staticmethod
     def argparser():
         # type: () -> ArgumentParser
@@ -747,10 +2174,19 @@ class Arguments:
         Arguments.add_common_arguments(url_file)
         url_file.set_defaults(mode='url-file')
         url_file.add_argument('input_filepath', type=str, help='filepath with urls to injest')
+        url_file.add_argument('--refresh', action='store_true', help='refetch listings already in the txt-cache and record what changed')
+        Arguments.add_block_arguments(url_file)
+        Arguments.add_recycle_arguments(url_file)
 
         browse = modes.add_parser('browse', help='open up a driver and browse at our liesure until closed')
         Arguments.add_common_arguments(browse)
-        browse.set_defaults(mode='browse')
+        browse.set_defaults(mode='browse', headless=True)
+        browse.add_argument('--in-tab', action='store_true', help='extract in your own tab instead of handing listings to background browsers')
+        browse.add_argument('--workers', type=int, default=2, help='how many background headless browsers')
+        browse.add_argument('--interval', type=float, default=0.5, help='seconds between background page loads across all of them')
+        browse.add_argument('--headed', dest='headless', action='store_false', help='show the background browsers, e.g. to solve zillow captchas')
+        Arguments.add_block_arguments(browse)
+        Arguments.add_recycle_arguments(browse)
 
         search = modes.add_parser('search', help='run a search query on all websites and collate')
         Arguments.add_common_arguments(search)
@@ -761,13 +2197,101 @@ class Arguments:
         search.add_argument('--price-max', type=int, help='some maximum price?')
         search.add_argument('--price-min', type=int, help='some minimum price?')
         search.add_argument('--show-contingent', action='store_true', help='show pending or contingent?')
+        search.add_argument('--scroll', action='store_true', help='scroll the zillow grid page by page instead of reading the search-state json')
+        search.add_argument('--queue', action='store_true', help='enqueue the detail urls for "house worker"s instead of visiting them here')
+        search.add_argument('--queue-filepath', type=str, default='', help='shared sqlite queue, defaults to <output-dirpath>/queue.sqlite3')
+        search.add_argument('--bands', type=int, default=1, help='shard into this many price bands, bands that hit the site page cap split further')
+        search.add_argument('--shard-zip', type=int, action='append', help='shard by zip instead of the city/zip, repeat for more')
+        search.add_argument('--shard-miles', type=float, help='shard by every zip within this many miles of --zip')
+        search.add_argument('--workers', type=int, default=2, help='how many browsers search at once, realtor and zillow (and their shards) run side by side')
+        search.add_argument('--max-monthly', type=float, help='skip results whose card price (30 year at current rates) + HOA already costs more than this per month')
+        search.add_argument('--bed-min', type=int, help='skip results whose card shows fewer beds')
+        Arguments.add_block_arguments(search)
+        Arguments.add_recycle_arguments(search)
+
+        worker = modes.add_parser('worker', help='claim detail urls off the shared queue "search --queue" fills, run as many as you have browsers for')
+        Arguments.add_common_arguments(worker)
+        worker.set_defaults(mode='worker')
+        worker.add_argument('--queue-filepath', type=str, default='', help='shared sqlite queue, defaults to <output-dirpath>/queue.sqlite3')
+        worker.add_argument('--exit-when-empty', action='store_true', help='stop once nothing is queued or leased instead of polling')
+        worker.add_argument('--refresh', action='store_true', help='refetch listings already in the txt-cache and record what changed')
+        Arguments.add_block_arguments(worker)
+        Arguments.add_recycle_arguments(worker)
+
+        warm = modes.add_parser('warm', help='prefetch the txt-cache for a url file in the background, cheapest known price first')
+        Arguments.add_common_arguments(warm)
+        warm.set_defaults(mode='warm', headless=True)
+        warm.add_argument('input_filepath', type=str, help='filepath with urls to warm')
+        warm.add_argument('--workers', type=int, default=2, help='how many headless browsers')
+        warm.add_argument('--interval', type=float, default=3.0, help='seconds between page loads across all browsers, be polite')
+        warm.add_argument('--headed', dest='headless', action='store_false', help='show the browsers, e.g. to solve zillow captchas')
+        Arguments.add_block_arguments(warm)
+        Arguments.add_recycle_arguments(warm)
+
+        top = modes.add_parser('top', help='k best properties across every stored output')
+        Arguments.add_common_arguments(top)
+        top.set_defaults(mode='top')
+        top.add_argument('-k', type=int, default=10, help='how many to keep')
+        top.add_argument('--score', type=str, default='total', choices=list(TOP_SCORES), help='lower is better')
+        top.add_argument('--bed-min', type=int, help='at least this many beds')
+        top.add_argument('--property-type', type=str, action='append', help='substring of property_type like "condo", repeat for any-of')
+        top.add_argument('--hoa-max', type=float, help='at most this HOA per month')
+        top.add_argument('--land-lease-max', type=float, help='at most this land lease per month')
+
+        grep = modes.add_parser('grep', help='full-text search over the txt-cache, boolean terms and "quoted phrases"')
+        Arguments.add_common_arguments(grep)
+        grep.set_defaults(mode='grep')
+        grep.add_argument('query', type=str, help='like \'"55+" AND ("land lease" OR solar) NOT pets\', words next to each other are AND')
+        grep.add_argument('--limit', type=int, default=50, help='at most this many listings, best match first')
+
+        reextract = modes.add_parser('reextract', help='reparse the newest archived html of every listing offline with the current rules')
+        Arguments.add_common_arguments(reextract)
+        reextract.set_defaults(mode='reextract')
+        reextract.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='how many processes parse at once')
+        reextract.add_argument('--field', dest='fields', type=str, action='append', help='extra column like "lot=Lot size:? ([\\d,.]+)", first group wins')
+
+        near = modes.add_parser('near', help='stored properties within a radius, a bounding box or the k nearest to a point')
+        Arguments.add_common_arguments(near)
+        near.set_defaults(mode='near')
+        near.add_argument('where', type=str, nargs='?', default='', help='"lat,lon" or an address, zip level unless in the geocode cache')
+        near.add_argument('--miles', type=float, help='everything within this many straight-line miles')
+        near.add_argument('--bbox', type=str, help='"south,west,north,east" in degrees')
+        near.add_argument('-k', type=int, default=10, help='the k nearest, when neither --miles nor --bbox')
+
+        project = modes.add_parser('project', help='cost of ownership projections for every stored property')
+        Arguments.add_common_arguments(project)
+        project.set_defaults(mode='project')
+        project.add_argument('--hold-years', type=int, default=10, help='how long you would own it, at least 1')
+        project.add_argument('--years', type=int, default=30, choices=[15, 20, 30], help='loan term')
+        project.add_argument('--down', type=float, default=20.0, help='down payment percent')
+        project.add_argument('--hoa-growth', type=float, default=3.0, help='yearly HOA increase percent')
+        project.add_argument('--land-lease-growth', type=float, default=3.0, help='yearly land lease increase percent')
+        project.add_argument('--appreciation', type=float, default=0.0, help='yearly home value appreciation percent')
+
+        changes = modes.add_parser('changes', help='price cuts across every tracked listing from the listing history')
+        Arguments.add_common_arguments(changes)
+        changes.set_defaults(mode='changes')
+        changes.add_argument('--since', type=str, default='', help='YYYY-MM-DD, only changes seen on or after')
+
+        trend = modes.add_parser('trend', help='price/fee/rate trajectory of one listing from the time series store')
+        Arguments.add_common_arguments(trend)
+        trend.set_defaults(mode='trend')
+        trend.add_argument('listing', type=str, help='listing url or its id, the txt-cache filename without .txt')
+        trend.add_argument('--as-of', type=str, default='', help='YYYY-MM-DD, also show the monthly cost as it was that day')
+
+        daemon = modes.add_parser('daemon', help='keep a warmed browser alive that the other modes attach to')
+        Arguments.add_common_arguments(daemon)
+        daemon.set_defaults(mode='daemon')
+        daemon.add_argument('--debug-port', type=int, default=DEFAULT_CHROME_DEBUG_PORT, help='chrome remote debugging port to expose')
+        daemon.add_argument('--profile-dirpath', type=str, default=DEFAULT_PROFILE_DIRPATH, help='persistent chrome profile so cookies survive restarts')
 
         return parser
 
     def process(self):
+        self.commute = self.commute or []
         if self.mode == 'search':
-            if not ((self.city and self.state) or (self.zip)):
-                raise RuntimeError('must provide either --city + --state OR --zip!')
+            if not ((self.city and self.state) or (self.zip) or (self.shard_zip)):
+                raise RuntimeError('must provide either --city + --state OR --zip OR --shard-zip!')
         make_dirpath(self.output_dirpath)
         if self.debug:
             self.log_level = 'DEBUG'
@@ -783,80 +2307,1761 @@ class Arguments:
         return arguments
 
 
-def url_file(input_filepath, output_dirpath, commute='', driver=None, wait=None):
-    # type: (str, str, str, Optional[WebDriver], Optional[WebDriverWait]) -> None
-    url_text = read_text_file(input_filepath)
-    urls = [url.strip() for url in url_text.splitlines() if url.strip() and not url.strip().startswith('#')]
-    filename = os.path.splitext(os.path.basename(input_filepath))[1]
+def listing_id(url, u=0):
+    # type: (str, int) -> str
+    '''
+    Description:
+        the last non-empty path component, the realtor slug or the zillow NNN_zpid, used for the txt-cache filename and history.
+        zillow detail urls end in a slash, so the last component alone is empty and every listing used to land in ".txt".
+    '''
+    parsed = urllib.parse.urlparse(url)
+    if not parsed.hostname:
+        return f'{u}'
+    components = [component for component in parsed.path.split('/') if component]
+    return components[-1] if components else f'{u}'
 
-    # NOTE: use_subprocess=False in python interactive mode
-    driver = driver or uc.Chrome(headless=False, use_subprocess=True)
-    wait = wait or WebDriverWait(driver, 20)  # for zillow
 
-    cache_dirpath = abspath(output_dirpath)
+def text_hash(text):
+    # type: (str) -> str
+    '''
+    the txt-cache has the url on the first line, fresh scrapes dont, hash only the page part so both agree
+    '''
+    if text.startswith('http'):
+        text = text.split('\n', 1)[-1]
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+@contextlib.contextmanager
+def file_lock(lock_filepath, timeout=60.0, stale=120.0):
+    # type: (str, float, float) -> Generator[None, None, None]
+    '''
+    Description:
+        a lock file created with O_EXCL, which holds across processes and machines sharing a volume where flock may not.
+        a lock file older than stale seconds is assumed left behind by a dead process and broken.
+    Raises:
+        TimeoutError: still held by someone else after timeout seconds
+    '''
+    deadline = time.time() + timeout
+    while True:
+        try:
+            fd = os.open(lock_filepath, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_filepath) > stale:
+                    LOGGER.warning('breaking the stale lock "%s"', lock_filepath)
+                    os.remove(lock_filepath)
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.time() > deadline:
+                raise TimeoutError(f'"{lock_filepath}" is still locked after {timeout} sec!')
+            time.sleep(0.05)
+    try:
+        os.write(fd, f'{socket.gethostname()}:{os.getpid()}'.encode('utf-8'))
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.remove(lock_filepath)
+        except FileNotFoundError:
+            pass
+
+
+class ListingHistory():
+    '''
+    Description:
+        <output>/history/state.json holds the last hash and fields seen per listing id,
+        <output>/history/deltas.jsonl gets one line per changed fetch with only the HISTORY_FIELDS that moved:
+            {"t": "2026-10-19", "id": "...", "link": "...", "address": "...", "h": "<text hash>", "d": {"price": [old, new]}}
+        several workers can share one output dirpath: record and save hold <output>/history/.lock and first catch up
+        on whatever the others appended to deltas.jsonl or saved to state.json, so a change is only ever logged once.
+    '''
+
+    def __init__(self, output_dirpath):
+        # type: (str) -> None
+        self.dirpath = abspath(output_dirpath, 'history')
+        self.state_filepath = abspath(self.dirpath, 'state.json')
+        self.deltas_filepath = abspath(self.dirpath, 'deltas.jsonl')
+        self.lock_filepath = abspath(self.dirpath, '.lock')
+        self.state_mtime = self.mtime(self.state_filepath)
+        self.state = self.load()
+        self.deltas_offset = os.path.getsize(self.deltas_filepath) if is_file(self.deltas_filepath) else 0
+        self.recorded = set()  # type: set
+        self.dirty = False
+
+    @staticmethod
+    def mtime(filepath):
+        # type: (str) -> float
+        return os.path.getmtime(filepath) if is_file(filepath) else 0.0
+
+    def load(self):
+        # type: () -> Dict[str, dict]
+        if is_file(self.state_filepath):
+            with open(self.state_filepath, 'r', encoding='utf-8') as r:
+                return json.load(r)
+        return {}
+
+    def catch_up(self):
+        # type: () -> None
+        '''
+        under the lock: take listings another worker saved since we loaded, then replay delta lines appended since we last looked
+        '''
+        mtime = self.mtime(self.state_filepath)
+        if mtime != self.state_mtime:
+            self.state.update({listing_id: entry for listing_id, entry in self.load().items() if listing_id not in self.recorded})
+            self.state_mtime = mtime
+        if not is_file(self.deltas_filepath) or os.path.getsize(self.deltas_filepath) <= self.deltas_offset:
+            return
+        with open(self.deltas_filepath, 'rb') as rb:
+            rb.seek(self.deltas_offset)
+            tail = rb.read()
+        complete = tail[:tail.rfind(b'\n') + 1]
+        self.deltas_offset += len(complete)
+        for line in complete.decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            delta = json.loads(line)
+            entry = self.state.setdefault(delta['id'], dict(hash='', seen=delta['t'], fields={}))
+            for key, (_, new) in delta['d'].items():
+                entry['fields'][key] = new
+            if delta.get('h'):
+                entry['hash'] = delta['h']
+
+    def is_new_text(self, listing_id, text):
+        # type: (str, str) -> bool
+        entry = self.state.get(listing_id)
+        return not entry or entry['hash'] != text_hash(text)
+
+    def record(self, listing_id, text, prop):
+        # type: (str, str, Property) -> Dict[str, list]
+        '''
+        remember this version and append a delta line if any tracked field moved since the last one anyone recorded
+
+        Returns:
+            Dict[str, list]
+                field -> [old, new]
+        '''
+        make_dirpath(self.dirpath)
+        digest = text_hash(text)
+        fields = {key: value for key, value in asdict(prop).items() if key in PARSED_KEYS}
+        deltas = {}
+        with file_lock(self.lock_filepath):
+            self.catch_up()
+            entry = self.state.get(listing_id)
+            if entry and entry['hash'] != digest:
+                for key in HISTORY_FIELDS:
+                    old, new = entry['fields'].get(key), fields.get(key)
+                    if old != new:
+                        deltas[key] = [old, new]
+            if deltas:
+                line = dict(t=NOW, id=listing_id, link=prop.link, address=prop.address, h=digest, d=deltas)
+                with open(self.deltas_filepath, 'a', encoding='utf-8') as a:
+                    a.write(f'{json.dumps(line)}\n')
+                self.deltas_offset = os.path.getsize(self.deltas_filepath)
+        self.state[listing_id] = dict(hash=digest, seen=NOW, fields=fields)
+        self.recorded.add(listing_id)
+        self.dirty = True
+        return deltas
+
+    def save(self):
+        # type: () -> None
+        '''
+        merges into whatever is on disk now so several workers sharing an output dirpath dont drop each others listings
+        '''
+        if self.dirty:
+            make_dirpath(self.dirpath)
+            with file_lock(self.lock_filepath):
+                self.catch_up()
+                state = self.load()
+                state.update({listing_id: self.state[listing_id] for listing_id in self.recorded})
+                self.state = state
+                temp_filepath = f'{self.state_filepath}.{os.getpid()}'
+                write_text_file(temp_filepath, json.dumps(self.state))
+                os.replace(temp_filepath, self.state_filepath)
+                self.state_mtime = self.mtime(self.state_filepath)
+            self.recorded.clear()
+            self.dirty = False
+
+
+def extractor_version(hostname):
+    # type: (str) -> str
+    '''
+    Description:
+        a short hash of everything parse_text does for this host: each rule's key, pattern, anchor, flags and window,
+        plus the property field types the values are coerced to. editing any rule gives the host a new version.
+    Raises:
+        NotImplementedError: not realtor or zillow
+    '''
+    for host, rules in PARSE_RULES.items():
+        if host in hostname:
+            break
+    else:
+        raise NotImplementedError(f'{hostname} not yet implemented!')
+    spec = [host, [(key, regex.pattern, regex.flags, anchor.pattern, before, after) for key, regex, anchor, before, after in rules]]
+    spec.append(sorted((key, KeyType.__name__) for key, KeyType in PROPERTY_KEY_TYPES.items()))
+    return hashlib.sha256(json.dumps(spec).encode('utf-8')).hexdigest()[:16]
+
+
+class ParseMemo():
+    '''
+    Description:
+        <output>/parse-memo.sqlite3, the PARSED_KEYS parse_text got out of a page keyed by (text hash, extractor version),
+        so a cached page that has not changed is never regexed twice, only calculated with the day's rates.
+        rows of versions no current rule set produces are dropped on open, a rule edit invalidates just that host.
+        a parse where any field failed (a blown budget on a busy box) is not memoized, the next run tries again.
+        new parses are committed in batches of flush_every or every flush_seconds, flush() writes whatever is left.
+        default rollback journal like the WorkQueue, the output dirpath may be a network volume several workers share.
+    '''
+    lock = threading.Lock()
+    shared_memos = {}  # type: Dict[str, ParseMemo]
+
+    def __init__(self, output_dirpath, timeout=60, flush_every=100, flush_seconds=10.0):
+        # type: (str, int|float, int, float) -> None
+        self.output_dirpath = abspath(output_dirpath)
+        self.db_filepath = abspath(output_dirpath, 'parse-memo.sqlite3')
+        self.versions = {host: extractor_version(host) for host in PARSE_RULES}
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+        self.pending = {}  # type: Dict[Tuple[str, str], str]
+        self.flushed_at = time.time()
+        make_dirpath(self.output_dirpath)
+        self.conn = sqlite3.connect(self.db_filepath, timeout=timeout, check_same_thread=False)
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS memo (
+                    hash TEXT,
+                    version TEXT,
+                    fields TEXT,
+                    PRIMARY KEY (hash, version)
+                )
+            ''')
+            versions = list(self.versions.values())
+            stale = self.conn.execute(f'DELETE FROM memo WHERE version NOT IN ({",".join("?" * len(versions))})', versions).rowcount
+        if stale:
+            LOGGER.info('the parse rules changed, dropped %d memoized parses', stale)
+
+    @staticmethod
+    def shared(output_dirpath):
+        # type: (str) -> ParseMemo
+        '''
+        one memo per output dirpath per process, safe to use from threads
+        '''
+        key = abspath(output_dirpath)
+        with ParseMemo.lock:
+            if key not in ParseMemo.shared_memos:
+                ParseMemo.shared_memos[key] = ParseMemo(key)
+            return ParseMemo.shared_memos[key]
+
+    def version(self, hostname):
+        # type: (str) -> str
+        for host, version in self.versions.items():
+            if host in hostname:
+                return version
+        return ''
+
+    def get(self, text, hostname):
+        # type: (str, str) -> Optional[Property]
+        '''
+        the property parse_text made of this exact text under today's rules, None if it has to be parsed
+        '''
+        version = self.version(hostname)
+        if not version:
+            return None
+        key = (text_hash(text), version)
+        with ParseMemo.lock:
+            fields = self.pending.get(key)
+            if fields is None:
+                row = self.conn.execute('SELECT fields FROM memo WHERE hash = ? AND version = ?', key).fetchone()
+                fields = row[0] if row else None
+        if fields is None:
+            return None
+        return Property(**json.loads(fields))
+
+    def put(self, text, hostname, prop):
+        # type: (str, str, Property) -> None
+        version = self.version(hostname)
+        if not version:
+            return
+        fields = {key: value for key, value in asdict(prop).items() if key in PARSED_KEYS}
+        with ParseMemo.lock:
+            self.pending[(text_hash(text), version)] = json.dumps(fields)
+            due = len(self.pending) >= self.flush_every or time.time() - self.flushed_at >= self.flush_seconds
+        if due:
+            self.flush()
+
+    def parse(self, text, hostname):
+        # type: (str, str) -> Property
+        '''
+        Description:
+            the memoized property, or parse_text's, memoized if every field parsed
+        Raises:
+            NotImplementedError: not realtor or zillow
+        '''
+        prop = self.get(text, hostname)
+        METRICS.inc('house_parse_memo_total', result='miss' if prop is None else 'hit')
+        if prop is not None:
+            return prop
+        failures = []  # type: List[str]
+        with METRICS.timer('house_stage_seconds', stage='parse', host=hostname.replace('www.', '')):
+            prop = Property.parse_text(text, hostname=hostname, failures=failures)
+        if failures:
+            LOGGER.debug('not memoizing a parse that failed on %s', failures)
+        else:
+            self.put(text, hostname, prop)
+        return prop
+
+    def flush(self):
+        # type: () -> None
+        with ParseMemo.lock:
+            pending, self.pending = self.pending, {}
+            self.flushed_at = time.time()
+            if pending:
+                with self.conn:
+                    self.conn.executemany('INSERT OR REPLACE INTO memo (hash, version, fields) VALUES (?, ?, ?)', [(digest, version, fields) for (digest, version), fields in pending.items()])
+
+    def close(self):
+        # type: () -> None
+        self.flush()
+        with ParseMemo.lock:
+            ParseMemo.shared_memos.pop(self.output_dirpath, None)
+            self.conn.close()
+
+
+TIMESERIES_DTYPE = np.dtype([
+    ('day', '<i4'),  # date.toordinal()
+    ('price', '<f8'),
+    ('hoa', '<f8'),
+    ('land_lease', '<f8'),
+    ('listing_age', '<i4'),
+    ('rate_15', '<f8'),
+    ('rate_20', '<f8'),
+    ('rate_30', '<f8'),
+])
+
+
+class TimeSeriesStore():
+    '''
+    Description:
+        <output>/timeseries/<listing_id>.bin is a flat array of fixed-width TIMESERIES_DTYPE records, one per day seen.
+        reads are np.memmap views so a trend or "as of" lookup is a slice of the file, not a parse of every daily output.
+    '''
+
+    def __init__(self, output_dirpath):
+        # type: (str) -> None
+        self.dirpath = abspath(output_dirpath, 'timeseries')
+
+    def filepath(self, listing_id):
+        # type: (str) -> str
+        return abspath(self.dirpath, f'{listing_id}.bin')
+
+    def append(self, listing_id, prop, rates, day=None):
+        # type: (str, Property, Tuple[float, float, float], Optional[datetime.date]) -> None
+        '''
+        rates are (15yr, 20yr, 30yr) like calculate takes them, a second run on the same day overwrites that day
+        '''
+        day = day or datetime.date.today()
+        record = np.zeros(1, dtype=TIMESERIES_DTYPE)
+        record['day'] = day.toordinal()
+        record['price'], record['hoa'], record['land_lease'], record['listing_age'] = prop.price, prop.hoa, prop.land_lease, prop.listing_age
+        record['rate_15'], record['rate_20'], record['rate_30'] = rates
+
+        make_dirpath(self.dirpath)
+        filepath = self.filepath(listing_id)
+        with open(filepath, 'ab+') as f:
+            size = f.tell()
+            if size >= TIMESERIES_DTYPE.itemsize:
+                f.seek(size - TIMESERIES_DTYPE.itemsize)
+                last = np.frombuffer(f.read(TIMESERIES_DTYPE.itemsize), dtype=TIMESERIES_DTYPE)
+                if last['day'][0] == record['day'][0]:
+                    f.truncate(size - TIMESERIES_DTYPE.itemsize)
+            f.write(record.tobytes())
+
+    def series(self, listing_id):
+        # type: (str) -> np.ndarray
+        '''
+        every record for the listing oldest first, a read-only memmap so series['price'] et al. are zero-copy
+        '''
+        filepath = self.filepath(listing_id)
+        if not is_file(filepath) or os.path.getsize(filepath) < TIMESERIES_DTYPE.itemsize:
+            return np.zeros(0, dtype=TIMESERIES_DTYPE)
+        return np.memmap(filepath, dtype=TIMESERIES_DTYPE, mode='r')
+
+    def as_of(self, listing_id, day):
+        # type: (str, datetime.date) -> Optional[np.void]
+        series = self.series(listing_id)
+        i = int(np.searchsorted(series['day'], day.toordinal(), side='right')) - 1
+        return series[i] if i >= 0 else None
+
+    def cost_as_of(self, listing_id, day, bed=1, down=20.0):
+        # type: (str, datetime.date, int, float) -> Optional[Property]
+        '''
+        what calculate would have said on that day, with that day's price, fees and rates
+        '''
+        record = self.as_of(listing_id, day)
+        if record is None:
+            return None
+        prop = Property(price=float(record['price']), hoa=float(record['hoa']), land_lease=float(record['land_lease']), listing_age=int(record['listing_age']), bed=bed)
+        prop.calculate(float(record['rate_15']), float(record['rate_20']), float(record['rate_30']), down=down)
+        return prop
+
+
+FTS_OPERATORS = {'AND', 'OR', 'NOT', '(', ')'}
+
+
+def fts_query(query):
+    # type: (str) -> str
+    '''
+    Description:
+        make a grep-ish query safe for fts5: AND/OR/NOT, parentheses and "quoted phrases" pass through, every other
+        word is quoted so things like 55+ or pet-friendly dont trip the fts5 syntax. words next to each other are AND.
+    Raises:
+        ValueError: a NOT with nothing on its left, fts5 only knows "a NOT b"
+    '''
+    tokens = re.findall(r'"[^"]*"|\(|\)|[^\s()"]+', query)
+    quoted = []
+    for token in tokens:
+        if token == 'NOT' and (not quoted or quoted[-1] in FTS_OPERATORS - {')'}):
+            raise ValueError(f'NOT needs something to subtract from in {query!r}, like "solar NOT pets"!')
+        if token not in FTS_OPERATORS and not (token.startswith('"') and token.endswith('"') and len(token) > 1):
+            token = '"{}"'.format(token.replace('"', '""'))
+        # fts5 only does implicit AND between phrases, spell it out so "55+" (pool OR spa) works too
+        if quoted and quoted[-1] not in FTS_OPERATORS - {')'} and token not in FTS_OPERATORS - {'('}:
+            quoted.append('AND')
+        quoted.append(token)
+    return ' '.join(quoted)
+
+
+class TextIndex():
+    '''
+    Description:
+        <output>/txt-index.sqlite3, an fts5 inverted index over the txt-cache with a row of (id, link, hash, mtime, text_rowid) per listing.
+        texts are replaced by text_rowid, the id column of an fts5 table is UNINDEXED so a WHERE on it scans every row.
+        write_cached_text keeps it current on every cache write, sync catches up on files written any other way.
+        "+" is a token character so "55+" is searchable, which also means "55" alone does not match it.
+    '''
+    lock = threading.Lock()
+    shared_indices = {}  # type: Dict[str, TextIndex]
+
+    def __init__(self, output_dirpath, timeout=60):
+        # type: (str, int|float) -> None
+        self.output_dirpath = abspath(output_dirpath)
+        self.txt_cache_dirpath = abspath(output_dirpath, 'txt-cache')
+        self.db_filepath = abspath(output_dirpath, 'txt-index.sqlite3')
+        make_dirpath(self.output_dirpath)
+        self.conn = sqlite3.connect(self.db_filepath, timeout=timeout, check_same_thread=False)
+        with self.conn:
+            columns = [row[1] for row in self.conn.execute('PRAGMA table_info(listings)')]
+            if columns and 'text_rowid' not in columns:
+                LOGGER.info('rebuilding "%s" with text rowids, sync reindexes the txt-cache', self.db_filepath)
+                self.conn.executescript('DROP TABLE listings; DROP TABLE IF EXISTS texts;')
+            self.conn.executescript('''
+                CREATE TABLE IF NOT EXISTS listings (
+                    id TEXT PRIMARY KEY,
+                    link TEXT,
+                    hash TEXT,
+                    mtime REAL,
+                    text_rowid INTEGER
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS texts USING fts5(id UNINDEXED, body, tokenize="unicode61 tokenchars '+'");
+            ''')
+
+    @staticmethod
+    def shared(output_dirpath):
+        # type: (str) -> TextIndex
+        '''
+        one index per output dirpath per process, safe to use from the WarmPool threads
+        '''
+        key = abspath(output_dirpath)
+        with TextIndex.lock:
+            if key not in TextIndex.shared_indices:
+                TextIndex.shared_indices[key] = TextIndex(key)
+            return TextIndex.shared_indices[key]
+
+    def update(self, listing_id, link, text, mtime=None):
+        # type: (str, str, str, Optional[float]) -> bool
+        '''
+        Returns:
+            bool
+                False if the text was already indexed as-is
+        '''
+        digest = text_hash(text)
+        mtime = time.time() if mtime is None else mtime
+        with TextIndex.lock, self.conn:
+            row = self.conn.execute('SELECT hash, text_rowid FROM listings WHERE id = ?', (listing_id, )).fetchone()
+            if row and row[0] == digest:
+                self.conn.execute('UPDATE listings SET mtime = ? WHERE id = ?', (mtime, listing_id))
+                return False
+            if row:
+                self.conn.execute('DELETE FROM texts WHERE rowid = ?', (row[1], ))
+            text_rowid = self.conn.execute('INSERT INTO texts (id, body) VALUES (?, ?)', (listing_id, text)).lastrowid
+            self.conn.execute(
+                'INSERT OR REPLACE INTO listings (id, link, hash, mtime, text_rowid) VALUES (?, ?, ?, ?, ?)',
+                (listing_id, link, digest, mtime, text_rowid),
+            )
+        return True
+
+    def sync(self):
+        # type: () -> Tuple[int, int]
+        '''
+        index txt-cache files newer than what the index saw, drop listings whose file is gone
+        Returns:
+            Tuple[int, int]
+                (indexed, removed)
+        '''
+        with TextIndex.lock:
+            seen = {listing_id: mtime for listing_id, mtime in self.conn.execute('SELECT id, mtime FROM listings')}
+        indexed = 0
+        present = set()
+        for filepath in glob.glob(abspath(self.txt_cache_dirpath, '*.txt')):
+            listing = os.path.splitext(os.path.basename(filepath))[0]
+            present.add(listing)
+            mtime = os.path.getmtime(filepath)
+            if listing in seen and seen[listing] >= mtime:
+                continue
+            content = read_text_file(filepath)
+            link, _, text = content.partition('\n') if content.startswith('http') else ('', '', content)
+            indexed += self.update(listing, link, text, mtime=mtime)
+        removed = [listing for listing in seen if listing not in present]
+        with TextIndex.lock, self.conn:
+            for listing in removed:
+                self.conn.execute('DELETE FROM texts WHERE rowid = (SELECT text_rowid FROM listings WHERE id = ?)', (listing, ))
+                self.conn.execute('DELETE FROM listings WHERE id = ?', (listing, ))
+        return indexed, len(removed)
+
+    def search(self, query, limit=50):
+        # type: (str, int) -> List[Tuple[str, str, str]]
+        '''
+        Returns:
+            List[Tuple[str, str, str]]
+                (listing id, link, snippet with the hits in [brackets]), best match first
+        '''
+        with TextIndex.lock:
+            return self.conn.execute(
+                '''
+                SELECT texts.id, listings.link, snippet(texts, 1, '[', ']', '...', 12)
+                FROM texts JOIN listings ON listings.text_rowid = texts.rowid
+                WHERE texts MATCH ? ORDER BY rank LIMIT ?
+                ''',
+                (fts_query(query), limit),
+            ).fetchall()
+
+    def close(self):
+        # type: () -> None
+        with TextIndex.lock:
+            TextIndex.shared_indices.pop(self.output_dirpath, None)
+            self.conn.close()
+
+
+def write_cached_text(cached_filepath, url, text):
+    # type: (str, str, str) -> None
+    '''
+    the one way pages get into <output>/txt-cache/<id>.txt, the full-text index follows along
+    '''
+    write_text_file(cached_filepath, f'{url}\n{text}')
+    output_dirpath = os.path.dirname(os.path.dirname(cached_filepath))
+    listing = os.path.splitext(os.path.basename(cached_filepath))[0]
+    try:
+        TextIndex.shared(output_dirpath).update(listing, url, text, mtime=os.path.getmtime(cached_filepath))
+    except sqlite3.Error as ex:
+        LOGGER.warning('could not index %s, "house grep" will catch up: %s', listing, ex)
+
+
+class HtmlArchive():
+    '''
+    Description:
+        <output>/html-archive/objects/<sha[:2]>/<sha>.html.xz, the full rendered html of a fetch, lzma compressed and
+        named by the sha256 of the html so a page fetched twice unchanged is stored once.
+        <output>/html-archive/manifest.jsonl gets a line per fetch either way:
+            {"t": "2026-10-19T20:30:00", "id": "...", "url": "...", "sha": "...", "bytes": 812345, "stored": 90123}
+    '''
+    lock = threading.Lock()
+
+    def __init__(self, output_dirpath, preset=6):
+        # type: (str, int) -> None
+        self.dirpath = abspath(output_dirpath, 'html-archive')
+        self.objects_dirpath = abspath(self.dirpath, 'objects')
+        self.manifest_filepath = abspath(self.dirpath, 'manifest.jsonl')
+        self.preset = preset
+        make_dirpath(self.objects_dirpath)
+
+    def object_filepath(self, sha):
+        # type: (str) -> str
+        return abspath(self.objects_dirpath, sha[:2], f'{sha}.html.xz')
+
+    def put(self, listing, url, html):
+        # type: (str, str, str) -> str
+        '''
+        Returns:
+            str
+                the sha the html is stored under
+        '''
+        data = html.encode('utf-8')
+        sha = hashlib.sha256(data).hexdigest()
+        object_filepath = self.object_filepath(sha)
+        stored = 0
+        if not is_file(object_filepath):
+            make_dirpath(os.path.dirname(object_filepath))
+            compressed = lzma.compress(data, preset=self.preset)
+            temp_filepath = f'{object_filepath}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(temp_filepath, 'wb') as wb:
+                wb.write(compressed)
+            os.replace(temp_filepath, object_filepath)
+            stored = len(compressed)
+        entry = dict(t=datetime.datetime.now().isoformat(timespec='seconds'), id=listing, url=url, sha=sha, bytes=len(data), stored=stored)
+        with HtmlArchive.lock, open(self.manifest_filepath, 'a', encoding='utf-8') as a:
+            a.write(json.dumps(entry) + '\n')
+        return sha
+
+    def get(self, sha):
+        # type: (str) -> str
+        with open(self.object_filepath(sha), 'rb') as rb:
+            return lzma.decompress(rb.read()).decode('utf-8')
+
+    def entries(self):
+        # type: () -> Generator[dict, None, None]
+        if not is_file(self.manifest_filepath):
+            return
+        with open(self.manifest_filepath, 'r', encoding='utf-8') as r:
+            for line in r:
+                if line.strip():
+                    yield json.loads(line)
+
+    def latest(self):
+        # type: () -> Dict[str, dict]
+        '''
+        the newest manifest entry per listing id
+        '''
+        latest = {}
+        for entry in self.entries():
+            latest[entry['id']] = entry
+        return latest
+
+
+def rendered_html(driver):
+    # type: (WebDriver) -> str
+    '''
+    the page as rendered right now, through save_page if it hands back a saved file, the live DOM otherwise
+    '''
+    try:
+        saved = save_page(driver)
+        if isinstance(saved, str) and is_file(saved):
+            return read_text_file(saved)
+    except Exception:
+        LOGGER.debug('save_page failed, reading the DOM instead', exc_info=True)
+    return str(driver.execute_script('return document.documentElement.outerHTML;'))
+
+
+HTML_TEXT_SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'svg', 'head'}
+HTML_TEXT_BLOCK_TAGS = {'p', 'div', 'section', 'article', 'li', 'ul', 'ol', 'tr', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'dt', 'dd', 'table', 'header', 'footer', 'button'}
+HTML_COORDINATE_REGEXES = [
+    re.compile(r'"latitude"\s*:\s*"?(-?\d+\.\d+)"?\s*,\s*"longitude"\s*:\s*"?(-?\d+\.\d+)'),
+    re.compile(r'"coordinate"\s*:\s*\{\s*"lat"\s*:\s*(-?\d+\.\d+)\s*,\s*"lon"\s*:\s*(-?\d+\.\d+)'),
+]
+
+
+class HtmlText(HTMLParser):
+    '''
+    roughly innerText: visible text with a line break per block element, scripts/styles dropped
+    '''
+
+    def __init__(self):
+        # type: () -> None
+        super().__init__(convert_charrefs=True)
+        self.chunks = []  # type: List[str]
+        self.skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in HTML_TEXT_SKIP_TAGS:
+            self.skipping += 1
+        elif tag in HTML_TEXT_BLOCK_TAGS:
+            self.chunks.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in HTML_TEXT_SKIP_TAGS:
+            self.skipping = max(0, self.skipping - 1)
+        elif tag in HTML_TEXT_BLOCK_TAGS:
+            self.chunks.append('\n')
+
+    def handle_data(self, data):
+        if not self.skipping:
+            self.chunks.append(data)
+
+    def text(self):
+        # type: () -> str
+        lines = (' '.join(line.split()) for line in ''.join(self.chunks).splitlines())
+        return '\n'.join(line for line in lines if line)
+
+
+def html_text(html):
+    # type: (str) -> str
+    '''
+    the visible text of archived html plus the same "Coordinates: lat, lon" line the live scrapers append
+    '''
+    parser = HtmlText()
+    parser.feed(html)
+    parser.close()
+    text = parser.text()
+    for regex in HTML_COORDINATE_REGEXES:
+        mo = regex.search(html)
+        if mo:
+            text = f'{text}\nCoordinates: {mo.groups()[0]}, {mo.groups()[1]}'
+            break
+    return text
+
+
+def reextract_entry(output_dirpath, entry, field_regexes=None):
+    # type: (str, dict, Optional[Dict[str, str]]) -> Tuple[dict, Dict[str, str]]
+    '''
+    Description:
+        one archived fetch back into a Property with whatever PARSE_RULES say today, plus field_regexes
+        (name -> regex, first group wins) run over the same text. runs in a worker process.
+    Returns:
+        Tuple[dict, Dict[str, str]]
+            the property as a dict, the extra fields
+    '''
+    archive = HtmlArchive(output_dirpath)
+    text = html_text(archive.get(entry['sha']))
+    hostname = urllib.parse.urlparse(entry['url']).hostname or ''
+    prop = Property.parse_text(text, hostname=hostname)
+    prop.link = entry['url']
+    extra = {}
+    for name, pattern in (field_regexes or {}).items():
+        mo = re.search(pattern, text, flags=re.MULTILINE)
+        if mo:
+            extra[name] = mo.groups()[0] if mo.groups() else mo.group(0)
+    return asdict(prop), extra
+
+
+def reextract(output_dirpath, fields=None, workers=None):
+    # type: (str, Optional[List[str]], Optional[int]) -> int
+    '''
+    Description:
+        reparse the newest archived html of every listing without a browser, spread over worker processes, into
+        <NOW>.reextract.csv/json/props. fields like "lot=Lot size\:?\s*(.+)" add ad-hoc columns to <NOW>.reextract.fields.json.
+    Returns:
+        int
+            how many listings were reextracted
+    '''
+    field_regexes = {}
+    for field_pattern in fields or []:
+        name, _, pattern = field_pattern.partition('=')
+        if not pattern:
+            raise ValueError(f'{field_pattern!r} should look like name=regex!')
+        field_regexes[name.strip()] = pattern
+
+    archive = HtmlArchive(output_dirpath)
+    entries = list(archive.latest().values())
+    LOGGER.info('reextracting %d archived listings', len(entries))
+    mortgage_rate_30, mortgage_rate_20, mortgage_rate_15 = download_mortgage_rates(dirpath=output_dirpath)
+    properties, extras = [], {}
+    start = time.time()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(reextract_entry, output_dirpath, entry, field_regexes): entry for entry in entries}
+        for future in concurrent.futures.as_completed(futures):
+            entry = futures[future]
+            try:
+                prop_dict, extra = future.result()
+            except Exception as ex:
+                LOGGER.error('could not reextract %s: %s', entry['url'], ex)
+                continue
+            prop = Property(**prop_dict)
+            prop.calculate(mortgage_rate_15, mortgage_rate_20, mortgage_rate_30)
+            properties.append(asdict(prop))
+            if extra:
+                extras[entry['id']] = dict(extra, link=entry['url'])
+    LOGGER.info('reextracted %d listings in %0.2f sec', len(properties), time.time() - start)
+    write_properties(properties, output_dirpath, f'{NOW}.reextract', append=False)
+    if field_regexes:
+        output_filepath_fields = abspath(output_dirpath, f'{NOW}.reextract.fields.json')
+        write_text_file(output_filepath_fields, json.dumps(extras, indent=2))
+        LOGGER.info('wrote "%s"', output_filepath_fields)
+    return len(properties)
+
+
+def grep(output_dirpath, query, limit=50):
+    # type: (str, str, int) -> List[Tuple[str, str, str]]
+    '''
+    Description:
+        "55+" AND ("land lease" OR solar) NOT pets, each hit printed as its link and snippet.
+        no parsed fields, the history can lag the txt-cache and would show a price the snippet contradicts.
+    Returns:
+        List[Tuple[str, str, str]]
+            (listing id, link, snippet) like TextIndex.search
+    '''
+    index = TextIndex.shared(output_dirpath)
+    start = time.time()
+    indexed, removed = index.sync()
+    if indexed or removed:
+        LOGGER.info('indexed %d, dropped %d txt-cache files in %0.3f sec', indexed, removed, time.time() - start)
+    start = time.time()
+    hits = index.search(query, limit=limit)
+    LOGGER.info('%d hits for %s in %0.2f ms', len(hits), fts_query(query), (time.time() - start) * 1000)
+
+    for listing, link, snippet in hits:
+        print(f'{link or listing}\n    {" ".join(snippet.split())}')
+    return hits
+
+
+PROPS_MAGIC = b'HOUSEPRP'
+PROPS_VERSION = 1
+PROPS_HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('n_columns', '<u4'),
+    ('n_rows', '<u8'),
+    ('table_nbytes', '<u8'),
+])  # 32 bytes
+PROPS_COLUMN_DTYPE = np.dtype([
+    ('name', 'S32'),
+    ('kind', 'S4'),  # f8, i8 or str
+    ('pad', '<u4'),
+    ('offset', '<u8'),  # numbers, or the n_rows + 1 string offsets
+    ('nbytes', '<u8'),
+    ('blob_offset', '<u8'),  # utf-8 of every string back to back
+    ('blob_nbytes', '<u8'),
+])  # 72 bytes
+PROPS_KINDS = {float: 'f8', int: 'i8', str: 'str'}
+
+
+def props_value(value, kind):
+    # type: (object, str) -> float|int|str
+    '''
+    coerce a json/csv value into its column, missing floats are nan, missing ints 0
+    '''
+    if kind == 'str':
+        return '' if value is None else str(value)
+    try:
+        number = float(value)  # type: ignore
+    except (TypeError, ValueError):
+        number = float('nan')
+    if kind == 'f8':
+        return number
+    return int(number) if np.isfinite(number) else 0
+
+
+def write_props(property_dicts, filepath):
+    # type: (List[dict], str) -> None
+    '''
+    Description:
+        header, column table, then each column 8-byte aligned:
+            f8/i8: n_rows little endian numbers
+            str:   n_rows + 1 uint64 offsets into a utf-8 blob
+        written to a temp file and swapped in so a reader never sees half of one
+    '''
+    n_rows = len(property_dicts)
+    columns = [(key, PROPS_KINDS[key_type]) for key, key_type in PROPERTY_KEY_TYPES.items()]
+    table = np.zeros(len(columns), dtype=PROPS_COLUMN_DTYPE)
+    header = np.zeros(1, dtype=PROPS_HEADER_DTYPE)
+    header['magic'], header['version'], header['n_columns'], header['n_rows'], header['table_nbytes'] = PROPS_MAGIC, PROPS_VERSION, len(columns), n_rows, table.nbytes
+
+    chunks = []  # type: List[bytes]
+    offset = PROPS_HEADER_DTYPE.itemsize + table.nbytes
+
+    def place(data):
+        # type: (bytes) -> Tuple[int, int]
+        nonlocal offset
+        start = offset
+        padding = -len(data) % 8
+        chunks.append(data + b'\0' * padding)
+        offset += len(data) + padding
+        return start, len(data)
+
+    for c, (key, kind) in enumerate(columns):
+        values = [props_value(prop_dict.get(key), kind) for prop_dict in property_dicts]
+        table[c]['name'], table[c]['kind'] = key.encode(), kind.encode()
+        if kind == 'str':
+            encoded = [value.encode('utf-8') for value in values]  # type: ignore
+            offsets = np.zeros(n_rows + 1, dtype='<u8')
+            np.cumsum([len(value) for value in encoded], out=offsets[1:])
+            table[c]['offset'], table[c]['nbytes'] = place(offsets.tobytes())
+            table[c]['blob_offset'], table[c]['blob_nbytes'] = place(b''.join(encoded))
+        else:
+            table[c]['offset'], table[c]['nbytes'] = place(np.array(values, dtype=f'<{kind}').tobytes())
+
+    make_dirpath(os.path.dirname(filepath))
+    temp_filepath = f'{filepath}.{os.getpid()}'
+    with open(temp_filepath, 'wb') as w:
+        w.write(header.tobytes())
+        w.write(table.tobytes())
+        for chunk in chunks:
+            w.write(chunk)
+    os.replace(temp_filepath, filepath)
+
+
+class PropertyColumns():
+    '''
+    Description:
+        read-only view of a .props file, nothing is deserialized up front:
+            columns['price']                  -> zero-copy np.memmap slice
+            columns.column('address')         -> every string of one column
+            columns[i] / columns.row(i)       -> one property dict, random access
+            columns.rows(columns['bed'] >= 2) -> iterate only the rows the mask keeps
+    '''
+
+    def __init__(self, filepath):
+        # type: (str) -> None
+        self.filepath = filepath
+        self.data = np.memmap(filepath, dtype=np.uint8, mode='r')
+        header = self.data[:PROPS_HEADER_DTYPE.itemsize].view(PROPS_HEADER_DTYPE)[0]
+        if bytes(header['magic']) != PROPS_MAGIC:
+            raise ValueError(f'{filepath!r} is not a .props file!')
+        if int(header['version']) != PROPS_VERSION:
+            raise ValueError(f'{filepath!r} is .props version {int(header["version"])}, expected {PROPS_VERSION}!')
+        self.n_rows = int(header['n_rows'])
+        end = PROPS_HEADER_DTYPE.itemsize + int(header['table_nbytes'])
+        table = self.data[PROPS_HEADER_DTYPE.itemsize:end].view(PROPS_COLUMN_DTYPE)
+        self.table = {entry['name'].decode(): entry for entry in table}
+        self.keys = list(self.table)
+
+    def __len__(self):
+        # type: () -> int
+        return self.n_rows
+
+    def kind(self, key):
+        # type: (str) -> str
+        return self.table[key]['kind'].decode()
+
+    def view(self, offset, nbytes, dtype):
+        # type: (int, int, str) -> np.ndarray
+        return self.data[offset:offset + nbytes].view(dtype)
+
+    def __getitem__(self, key):
+        # type: (str|int) -> np.ndarray|dict
+        if isinstance(key, str):
+            entry = self.table[key]
+            if self.kind(key) == 'str':
+                raise TypeError(f'{key!r} is a string column, use column() or string()!')
+            return self.view(int(entry['offset']), int(entry['nbytes']), f'<{self.kind(key)}')
+        return self.row(key)
+
+    def string(self, key, i):
+        # type: (str, int) -> str
+        entry = self.table[key]
+        offsets = self.view(int(entry['offset']), int(entry['nbytes']), '<u8')
+        blob_offset = int(entry['blob_offset'])
+        return bytes(self.data[blob_offset + int(offsets[i]):blob_offset + int(offsets[i + 1])]).decode('utf-8')
+
+    def column(self, key):
+        # type: (str) -> np.ndarray|List[str]
+        if self.kind(key) != 'str':
+            return self[key]  # type: ignore
+        entry = self.table[key]
+        offsets = self.view(int(entry['offset']), int(entry['nbytes']), '<u8').tolist()
+        blob_offset = int(entry['blob_offset'])
+        blob = bytes(self.data[blob_offset:blob_offset + int(entry['blob_nbytes'])])
+        return [blob[start:stop].decode('utf-8') for start, stop in zip(offsets[:-1], offsets[1:])]
+
+    def row(self, i, keys=None):
+        # type: (int, Optional[List[str]]) -> dict
+        if i < 0:
+            i += self.n_rows
+        if not 0 <= i < self.n_rows:
+            raise IndexError(f'row {i} out of {self.n_rows}!')
+        row = {}
+        for key in keys or self.keys:
+            kind = self.kind(key)
+            if kind == 'str':
+                row[key] = self.string(key, i)
+            elif kind == 'i8':
+                row[key] = int(self[key][i])  # type: ignore
+            else:
+                row[key] = float(self[key][i])  # type: ignore
+        return row
+
+    def rows(self, mask=None, keys=None):
+        # type: (Optional[np.ndarray], Optional[List[str]]) -> Generator[dict, None, None]
+        '''
+        mask is a boolean array over the rows, usually built from numeric columns like (columns['price'] < 3e5) & (columns['bed'] >= 2)
+        '''
+        indices = range(self.n_rows) if mask is None else np.flatnonzero(mask)
+        for i in indices:
+            yield self.row(int(i), keys=keys)
+
+
+def trend(output_dirpath, listing, as_of=''):
+    # type: (str, str, str) -> np.ndarray
+    listing = listing_id(listing) if listing.startswith('http') else listing
+    store = TimeSeriesStore(output_dirpath)
+    series = store.series(listing)
+    for record in series:
+        day = datetime.date.fromordinal(int(record['day']))
+        print(f'{day}  ${record["price"]:>11,.0f}  hoa ${record["hoa"]:>6,.0f}  lease ${record["land_lease"]:>6,.0f}  {record["listing_age"]:>4d} days  30yr {record["rate_30"]:0.3f}%')
+    if as_of:
+        prop = store.cost_as_of(listing, datetime.date.fromisoformat(as_of))
+        if prop is None:
+            LOGGER.warning('%s was not tracked yet on %s', listing, as_of)
+        else:
+            print(f'as of {as_of}: ${prop.total:0.2f}/mo total, ${prop.monthly_30:0.2f}/mo 30yr mortgage')
+    LOGGER.info('%d records for %s', len(series), listing)
+    return series
+
+
+def iter_deltas(output_dirpath, since=''):
+    # type: (str, str) -> Generator[dict, None, None]
+    '''
+    stream delta lines on or after since (YYYY-MM-DD), never touches the txt-cache
+    '''
+    deltas_filepath = abspath(output_dirpath, 'history', 'deltas.jsonl')
+    if not is_file(deltas_filepath):
+        return
+    with open(deltas_filepath, 'r', encoding='utf-8') as r:
+        for line in r:
+            line = line.strip()
+            if not line:
+                continue
+            delta = json.loads(line)
+            if since and delta['t'] < since:
+                continue
+            yield delta
+
+
+def changes(output_dirpath, since=''):
+    # type: (str, str) -> List[dict]
+    '''
+    Description:
+        price cuts since a date across every tracked listing, biggest cut first, other field changes are only counted
+
+    Returns:
+        List[dict]
+            the price cut deltas
+    '''
+    cuts = []
+    others = {}  # type: Dict[str, int]
+    for delta in iter_deltas(output_dirpath, since=since):
+        for key, (old, new) in delta['d'].items():
+            if key == 'price' and old and new and new < old:
+                cuts.append(delta)
+            elif key != 'price':
+                others[key] = others.get(key, 0) + 1
+    cuts.sort(key=lambda delta: (delta['d']['price'][1] - delta['d']['price'][0]) / delta['d']['price'][0])
+    for delta in cuts:
+        old, new = delta['d']['price']
+        print(f'{delta["t"]}  ${old:>11,.0f} -> ${new:>11,.0f}  {100 * (new - old) / old:>6.1f}%  {delta["address"]}  {delta["link"]}')
+    LOGGER.info('%d price cuts since %s, other changes: %s', len(cuts), since or 'forever', json.dumps(others))
+    return cuts
+
+
+def listing_text(driver, wait, url):
+    # type: (WebDriver, WebDriverWait, str) -> str
+    '''
+    Raises:
+        NotImplementedError: not realtor or zillow
+    '''
+    hostname = urllib.parse.urlparse(url).hostname or ''
+    if 'realtor.com' in hostname:
+        return realtor_com_to_text(driver, wait, url)
+    elif 'zillow.com' in hostname:
+        return zillow_com_to_text(driver, wait, url)
+    raise NotImplementedError(f'not implemented for {hostname!r}!')
+
+
+def fetch_listing(driver, wait, url, cache_filename, cache_dirpath, history, timeseries, rates, blocker=None, refresh=False, progress='', archive=None):
+    # type: (WebDriver, WebDriverWait, str, str, str, ListingHistory, TimeSeriesStore, Tuple[float, float, float], Optional[ResourceBlocker], bool, str, Optional[HtmlArchive]) -> Property
+    '''
+    Description:
+        one listing from the txt-cache or the browser, parsed (unless the ParseMemo has it), calculated and appended to the time series
+        with an archive every browser fetch also keeps its rendered html for reextract
+    Raises:
+        NotImplementedError: not realtor or zillow
+    '''
+    mortgage_rate_15, mortgage_rate_20, mortgage_rate_30 = rates
+    parsed = urllib.parse.urlparse(url)
+    hostname = str(parsed.hostname) if parsed.hostname else ''
+    cached_filepath = abspath(cache_dirpath, 'txt-cache', f'{cache_filename}.txt')
+    host = hostname.replace('www.', '')
+    if is_file(cached_filepath) and not refresh:
+        LOGGER.info('%s - from file:    %s', progress, url)
+        METRICS.inc('house_cache_total', result='hit')
+        text = read_text_file(cached_filepath)
+    else:
+        LOGGER.info('%s - from browser: %s', progress, url)
+        METRICS.inc('house_cache_total', result='miss')
+        if blocker:
+            blocker.apply(driver, url)
+        try:
+            with METRICS.timer('house_stage_seconds', stage='fetch', host=host):
+                text = listing_text(driver, wait, url)
+        except TimeoutException:
+            METRICS.inc('house_webdriver_timeouts_total', host=host)
+            raise
+        METRICS.inc('house_pages_fetched_total', host=host)
+        if blocker:
+            blocker.collect(driver, hostname)
+        if archive:
+            archive.put(cache_filename, url, rendered_html(driver))
+        if history.is_new_text(cache_filename, text) or not is_file(cached_filepath):
+            write_cached_text(cached_filepath, url, text)
+
+    prop = ParseMemo.shared(cache_dirpath).parse(text, hostname)
+    prop.link = url
+    if history.is_new_text(cache_filename, text):
+        deltas = history.record(cache_filename, text, prop)
+        if deltas:
+            LOGGER.info('%s - changed: %s', progress, json.dumps(deltas))
+    with METRICS.timer('house_stage_seconds', stage='calculate', host=host):
+        prop.calculate(mortgage_rate_15, mortgage_rate_20, mortgage_rate_30)
+        timeseries.append(cache_filename, prop, (mortgage_rate_15, mortgage_rate_20, mortgage_rate_30))
+    METRICS.inc('house_listings_total')
+    METRICS.set('house_last_progress_timestamp_seconds', time.time())
+    return prop
+
+
+BROWSER_GONE_MESSAGES = ('invalid session id', 'disconnected', 'no such window', 'not reachable', 'target window already closed', 'session deleted')
+FAULT_RETRYABLE = {
+    'permanent': False,  # not realtor or zillow, or deterministic like a ValueError, retrying will not help
+    'browser': True,  # the browser or tab died under us, recycled before the retry
+    'captcha': True,
+    'timeout': True,
+    'missing': True,  # the page rendered without what we scrape, usually a half-loaded page
+    'unknown': True,
+}
+
+
+def classify_fault(ex):
+    # type: (BaseException) -> str
+    '''
+    Returns:
+        str
+            one of FAULT_RETRYABLE
+    '''
+    message = str(ex).lower()
+    if isinstance(ex, (NotImplementedError, ValueError)):
+        return 'permanent'
+    if isinstance(ex, (TimeoutException, TimeoutError)):
+        return 'timeout'
+    if isinstance(ex, (NoSuchElementException, StaleElementReferenceException, ElementNotInteractableException)):
+        return 'missing'
+    if isinstance(ex, WebDriverException) and any(gone in message for gone in BROWSER_GONE_MESSAGES):
+        return 'browser'
+    if isinstance(ex, RuntimeError):
+        if 'captcha' in message:
+            return 'captcha'
+        if 'data-testid' in message:
+            return 'missing'
+    return 'unknown'
+
+
+def fetch_listing_retrying(recycler, url, cache_filename, cache_dirpath, history, timeseries, rates, blocker=None, refresh=False, progress='', attempts=3, backoff=2.0, archive=None):
+    # type: (DriverRecycler, str, str, str, ListingHistory, TimeSeriesStore, Tuple[float, float, float], Optional[ResourceBlocker], bool, str, int, float, Optional[HtmlArchive]) -> Tuple[Optional[Property], str, Optional[Exception]]
+    '''
+    Description:
+        fetch_listing for one url without letting it take the batch down. retryable faults wait backoff * 2^n (+- half)
+        and go again from a blank page, the last attempt gets a brand-new tab, a dead browser is recycled first.
+        retries always refetch, a cached page that fails to parse is as suspect as a live one.
+    Returns:
+        Tuple[Optional[Property], str, Optional[Exception]]
+            (the property or None, the fault, the last error)
+    '''
+    error = None  # type: Optional[Exception]
+    fault = ''
+    for attempt in range(1, attempts + 1):
+        try:
+            prop = fetch_listing(
+                recycler.driver,
+                recycler.wait,
+                url,
+                cache_filename,
+                cache_dirpath,
+                history,
+                timeseries,
+                rates,
+                blocker=blocker,
+                refresh=refresh or attempt > 1,
+                progress=progress,
+                archive=archive,
+            )
+            return prop, '', None
+        except Exception as ex:
+            error, fault = ex, classify_fault(ex)
+        if not FAULT_RETRYABLE[fault] or attempt == attempts:
+            break
+        delay = backoff * 2**(attempt - 1) * random.uniform(0.5, 1.5)
+        LOGGER.warning('%s - %s on attempt %d / %d, retrying in %0.1f sec: %s', progress, fault, attempt, attempts, delay, error)
+        METRICS.inc('house_listing_retries_total', fault=fault)
+        time.sleep(delay)
+        try:
+            if fault == 'browser':
+                recycler.recycle('dead')
+            elif attempt + 1 == attempts:
+                recycler.fresh_tab()
+            else:
+                recycler.driver.get('about:blank')  # the *_to_text functions skip the get if the url is already loaded
+        except Exception as ex:
+            LOGGER.warning('%s - could not reset the page before retrying: %s', progress, ex)
+    METRICS.inc('house_listing_failures_total', fault=fault)
+    return None, fault, error
+
+
+def dead_letter(output_dirpath, failures):
+    # type: (str, List[Tuple[str, str, Exception]]) -> str
+    '''
+    Description:
+        append (url, fault, error) to <output>/<NOW>.dead.urls, each url under a comment saying why,
+        so "house url-file" on it is the retry
+    Returns:
+        str
+            the dead letter filepath, empty if nothing failed
+    '''
+    if not failures:
+        return ''
+    dead_filepath = abspath(output_dirpath, f'{NOW}.dead.urls')
+    with open(dead_filepath, 'a', encoding='utf-8') as a:
+        for url, fault, error in failures:
+            reason = ' '.join(f'{type(error).__name__}: {error}'.split())[:300]
+            a.write(f'# {datetime.datetime.now().isoformat(timespec="seconds")} {fault} {reason}\n{url}\n')
+    return dead_filepath
+
+
+def write_properties(property_dicts, output_dirpath, filename, append=True):
+    # type: (List[dict], str, str, bool) -> None
+    '''
+    Description:
+        <filename>.json accumulates across runs (unless append=False), <filename>.csv and <filename>.props are rewritten from it
+    '''
+    LOGGER.info('found %d properties', len(property_dicts))
+    if not property_dicts:
+        return
+    output_filepath_json = abspath(output_dirpath, f'{filename}.json')
+    if append and os.path.isfile(output_filepath_json):
+        with open(output_filepath_json, 'r', encoding='utf-8') as r:
+            existing_dicts = json.load(r)
+        property_dicts.extend(existing_dicts)
+
+    keys = list(asdict(DEFAULT_PROPERTY).keys())
+    output_filepath_csv = abspath(output_dirpath, f'{filename}.csv')
+    with open(output_filepath_csv, 'w', encoding='utf-8', newline='') as w:
+        writer = csv.DictWriter(w, fieldnames=keys)
+        writer.writeheader()
+        writer.writerows(property_dicts)
+    LOGGER.info('wrote "%s"', output_filepath_csv)
+
+    with open(output_filepath_json, 'w', encoding='utf-8') as w:
+        json.dump(property_dicts, w, indent=2)
+    LOGGER.info('wrote "%s"', output_filepath_json)
+
+    output_filepath_props = abspath(output_dirpath, f'{filename}.props')
+    write_props(property_dicts, output_filepath_props)
+    LOGGER.info('wrote "%s"', output_filepath_props)
+
+
+def url_file(
+    input_filepath,
+    output_dirpath,
+    commute='',
+    driver=None,
+    wait=None,
+    attach=True,
+    headless=False,
+    blocker=None,
+    refresh=False,
+    recycler=None,
+    limits=None,
+    archive=None,
+):
+    # type: (str, str, str|List[str], Optional[WebDriver], Optional[WebDriverWait], bool, bool, Optional[ResourceBlocker], bool, Optional[DriverRecycler], Optional[RecycleLimits], Optional[HtmlArchive]) -> None
+    '''
+    Description:
+        refresh refetches listings that are already in the txt-cache, unchanged pages are not rewritten or reparsed
+        and changed ones land in the listing history as deltas
+        the browser is recycled past limits, a recycler handed in (search's) is left open for its owner to close
+    '''
+    url_text = read_text_file(input_filepath)
+    urls = [url.strip() for url in url_text.splitlines() if url.strip() and not url.strip().startswith('#')]
+    filename = os.path.splitext(os.path.basename(input_filepath))[1]
+
+    owns_recycler = recycler is None
+    recycler = recycler or DriverRecycler(driver=driver, headless=headless, attach=attach, performance_log=blocker is not None, limits=limits)
+    driver = recycler.driver
+    if wait is not None:
+        recycler.wait = wait  # for zillow
+
+    cache_dirpath = abspath(output_dirpath)
     os.makedirs(cache_dirpath, exist_ok=True)
 
     LOGGER.info('downloading mortgage rates')
     mortgage_rate_30, mortgage_rate_20, mortgage_rate_15 = download_mortgage_rates(dirpath=output_dirpath)
     LOGGER.info('30 Year mortgage rate of %0.2f%%', mortgage_rate_30)
+    rates = (mortgage_rate_15, mortgage_rate_20, mortgage_rate_30)
 
-    if commute:
+    commutes = commute_addresses(commute)
+    if commutes:
         for url in urls:
             if 'realtor.com' in url:
-                realtor_com_populate_commute(driver, url, commute)
+                realtor_com_populate_commute(driver, url, commutes[0])
             break
 
     LOGGER.info('url processing')
+    history = ListingHistory(output_dirpath)
+    timeseries = TimeSeriesStore(output_dirpath)
     properties = []
-    for u, url in enumerate(urls):
-        if 'rentals' in url:
-            LOGGER.error('%d / %d - NotImplementedError for a url like %s!', u + 1, len(urls), url)
-            continue
+    failures = []  # type: List[Tuple[str, str, Exception]]
+    try:
+        for u, url in enumerate(urls):
+            if 'rentals' in url:
+                LOGGER.error('%d / %d - NotImplementedError for a url like %s!', u + 1, len(urls), url)
+                continue
+            cache_filename = listing_id(url, u)
+            progress = f'{u + 1} / {len(urls)}'
+            prop, fault, error = fetch_listing_retrying(
+                recycler, url, cache_filename, cache_dirpath, history, timeseries, rates, blocker=blocker, refresh=refresh, progress=progress, archive=archive
+            )
+            if prop is None:
+                LOGGER.error('%s - giving up on %s, %s: %s', progress, url, fault, error)
+                failures.append((url, fault, error))  # type: ignore
+            else:
+                properties.append(prop)
+            # every url that got this far is settled, a cache hit that failed to parse was refetched by its retries
+            if recycler.page_done() and commutes and recycler.owned:
+                # the relaunched browser keeps cookies and profile, set the commute again in case realtor kept it elsewhere
+                for next_url in urls[u + 1:]:
+                    if 'realtor.com' in next_url:
+                        realtor_com_populate_commute(recycler.driver, next_url, commutes[0])
+                        break
+    finally:
+        history.save()
+        ParseMemo.shared(cache_dirpath).flush()
+        if owns_recycler:
+            recycler.close()
+        dead_filepath = dead_letter(output_dirpath, failures)
+        if dead_filepath:
+            faults = {}  # type: Dict[str, int]
+            for _, fault, _ in failures:
+                faults[fault] = faults.get(fault, 0) + 1
+            LOGGER.warning('%d / %d urls failed %s, wrote "%s"', len(failures), len(urls), json.dumps(faults), dead_filepath)
+    if blocker:
+        blocker.report()
+    estimate_commutes_ez(properties, commutes, output_dirpath)
+
+    write_properties([asdict(prop) for prop in properties], output_dirpath, filename)
+
+
+class WorkQueue():
+    '''
+    Description:
+        sqlite work queue meant to sit on a volume every worker can see, next to the shared txt-cache
+            work:    url, status (queued/leased/done/failed), worker, lease_until, attempts, error
+            results: url -> the Property as json, written by whichever worker finished it
+        a claim is a lease, if the worker dies the lease runs out and the url goes back to whoever claims next,
+        an error requeues it until max_attempts
+    '''
 
-        parsed = urllib.parse.urlparse(url)
-        cache_filename = f'{u}'
-        hostname = str(parsed.hostname) if parsed.hostname else ''
-        if hostname:
-            cache_filename = parsed.path.split('/')[-1]
-        cached_filepath = abspath(cache_dirpath, 'txt-cache', f'{cache_filename}.txt')
-        if is_file(cached_filepath):
-            LOGGER.info('%d / %d - from file:    %s', u + 1, len(urls), url)
-            text = read_text_file(cached_filepath)
-        else:
-            LOGGER.info('%d / %d - from browser: %s', u + 1, len(urls), url)
-            if 'realtor.com' in hostname:
-                text = realtor_com_to_text(driver, wait, url)
-            elif 'zillow.com' in hostname:
-                text = zillow_com_to_text(driver, wait, url)
+    def __init__(self, db_filepath, lease_seconds=300, max_attempts=3, timeout=60):
+        # type: (str, int|float, int, int|float) -> None
+        self.db_filepath = db_filepath
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        make_dirpath(os.path.dirname(db_filepath))
+        # rollback journal rather than WAL, WAL needs shared memory which network volumes dont have
+        self.conn = sqlite3.connect(db_filepath, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS work (
+                url TEXT PRIMARY KEY,
+                status TEXT NOT NULL DEFAULT 'queued',
+                worker TEXT,
+                lease_until REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                enqueued REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS work_status ON work (status, enqueued);
+            CREATE TABLE IF NOT EXISTS results (
+                url TEXT PRIMARY KEY,
+                worker TEXT,
+                finished REAL NOT NULL,
+                property TEXT NOT NULL
+            );
+        ''')
+
+    def enqueue(self, urls, requeue=False):
+        # type: (Iterable[str], bool) -> int
+        '''
+        Returns:
+            int
+                how many urls were new (or reset back to queued with requeue)
+        '''
+        now = time.time()
+        rows = [(url, now) for url in urls]
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            before = self.conn.total_changes
+            if requeue:
+                self.conn.executemany(
+                    "INSERT INTO work (url, enqueued) VALUES (?, ?) ON CONFLICT (url) DO UPDATE SET status = 'queued', attempts = 0, worker = NULL, lease_until = NULL, error = NULL WHERE status != 'leased'",
+                    rows,
+                )
             else:
-                raise NotImplementedError(f'not implemented for {hostname!r}!')
-            write_text_file(cached_filepath, f'{url}\n{text}')
+                self.conn.executemany('INSERT OR IGNORE INTO work (url, enqueued) VALUES (?, ?)', rows)
+            added = self.conn.total_changes - before
+            self.conn.execute('COMMIT')
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+        return added
+
+    def claim(self, worker, n=1):
+        # type: (str, int) -> List[str]
+        '''
+        lease up to n urls, expired leases count as queued again
+        '''
+        now = time.time()
+        self.conn.execute('BEGIN IMMEDIATE')  # one writer at a time, so two workers never get the same url
+        try:
+            self.conn.execute(
+                "UPDATE work SET status = 'failed', error = COALESCE(error, 'lease expired') WHERE status = 'leased' AND lease_until < ? AND attempts >= ?",
+                (now, self.max_attempts),
+            )
+            urls = [
+                row[0] for row in self.conn.execute(
+                    "SELECT url FROM work WHERE status = 'queued' OR (status = 'leased' AND lease_until < ?) ORDER BY enqueued, url LIMIT ?",
+                    (now, n),
+                )
+            ]
+            self.conn.executemany(
+                "UPDATE work SET status = 'leased', worker = ?, lease_until = ?, attempts = attempts + 1 WHERE url = ?",
+                [(worker, now + self.lease_seconds, url) for url in urls],
+            )
+            self.conn.execute('COMMIT')
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+        return urls
 
-        prop = Property.parse_text(text, hostname=hostname)
-        prop.link = url
-        prop.calculate(mortgage_rate_15, mortgage_rate_20, mortgage_rate_30)
-        properties.append(prop)
+    def complete(self, url, worker, prop_dict):
+        # type: (str, str, dict) -> bool
+        '''
+        Returns:
+            bool
+                False if the lease was lost to another worker, the result is kept either way
+        '''
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            self.conn.execute('INSERT OR REPLACE INTO results (url, worker, finished, property) VALUES (?, ?, ?, ?)', (url, worker, time.time(), json.dumps(prop_dict)))
+            cursor = self.conn.execute("UPDATE work SET status = 'done', lease_until = NULL, error = NULL WHERE url = ? AND worker = ?", (url, worker))
+            self.conn.execute('COMMIT')
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+        return cursor.rowcount == 1
+
+    def fail(self, url, worker, error):
+        # type: (str, str, str) -> str
+        '''
+        Returns:
+            str
+                queued if it will be retried, failed if it ran out of attempts
+        '''
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            self.conn.execute(
+                "UPDATE work SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, lease_until = NULL, error = ? WHERE url = ? AND worker = ?",
+                (self.max_attempts, error, url, worker),
+            )
+            row = self.conn.execute('SELECT status FROM work WHERE url = ?', (url, )).fetchone()
+            self.conn.execute('COMMIT')
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+        return row[0] if row else ''
+
+    def counts(self):
+        # type: () -> Dict[str, int]
+        counts = dict(queued=0, leased=0, done=0, failed=0)
+        counts.update({status: n for status, n in self.conn.execute('SELECT status, COUNT(*) FROM work GROUP BY status')})
+        return counts
+
+    def drained(self):
+        # type: () -> bool
+        counts = self.counts()
+        return counts['queued'] == 0 and counts['leased'] == 0
+
+    def results(self):
+        # type: () -> Generator[dict, None, None]
+        for row in self.conn.execute('SELECT property FROM results ORDER BY finished'):
+            yield json.loads(row[0])
+
+    def close(self):
+        # type: () -> None
+        self.conn.close()
+
+
+def queue_filepath_default(output_dirpath, queue_filepath=''):
+    # type: (str, str) -> str
+    return queue_filepath or abspath(output_dirpath, 'queue.sqlite3')
+
+
+def worker(
+    output_dirpath,
+    queue_filepath='',
+    commute='',
+    driver=None,
+    wait=None,
+    attach=False,
+    headless=False,
+    blocker=None,
+    refresh=False,
+    exit_when_empty=False,
+    poll_for=5.0,
+    worker_id='',
+    limits=None,
+    archive=None,
+):
+    # type: (str, str, str|List[str], Optional[WebDriver], Optional[WebDriverWait], bool, bool, Optional[ResourceBlocker], bool, bool, int|float, str, Optional[RecycleLimits], Optional[HtmlArchive]) -> int
+    '''
+    Description:
+        claim urls off the shared queue one at a time until it is empty (or forever), the txt-cache, history and time series
+        are the same ones url_file uses so point every worker at the same --output-dirpath
+        whichever worker sees the queue drained writes <NOW>.queue.csv/json from the results table
+    Returns:
+        int
+            how many urls this worker completed
+    '''
+    worker_id = worker_id or f'{socket.gethostname()}:{os.getpid()}'
+    queue = WorkQueue(queue_filepath_default(output_dirpath, queue_filepath))
+    recycler = DriverRecycler(driver=driver, headless=headless, attach=attach, performance_log=blocker is not None, limits=limits)
+    if wait is not None:
+        recycler.wait = wait
 
-    property_dicts = [asdict(prop) for prop in properties]
-    LOGGER.info('found %d properties', len(property_dicts))
-    if property_dicts:
-        output_filepath_json = abspath(output_dirpath, f'{filename}.json')
-        if os.path.isfile(output_filepath_json):
-            with open(output_filepath_json, 'r', encoding='utf-8') as r:
-                existing_dicts = json.load(r)
-            property_dicts.extend(existing_dicts)
-
-        keys = list(asdict(DEFAULT_PROPERTY).keys())
-        output_filepath_csv = abspath(output_dirpath, f'{filename}.csv')
-        with open(output_filepath_csv, 'w', encoding='utf-8', newline='') as w:
-            writer = csv.DictWriter(w, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(property_dicts)
-        LOGGER.info('wrote "%s"', output_filepath_csv)
-
-        with open(output_filepath_json, 'w', encoding='utf-8') as w:
-            json.dump(property_dicts, w, indent=2)
-        LOGGER.info('wrote "%s"', output_filepath_json)
+    cache_dirpath = abspath(output_dirpath)
+    os.makedirs(cache_dirpath, exist_ok=True)
+    mortgage_rate_30, mortgage_rate_20, mortgage_rate_15 = download_mortgage_rates(dirpath=output_dirpath)
+    rates = (mortgage_rate_15, mortgage_rate_20, mortgage_rate_30)
+    history = ListingHistory(output_dirpath)
+    timeseries = TimeSeriesStore(output_dirpath)
+
+    completed = 0
+    LOGGER.info('worker %s on "%s"', worker_id, queue.db_filepath)
+    try:
+        while True:
+            urls = queue.claim(worker_id)
+            if not urls:
+                if queue.drained():
+                    if exit_when_empty:
+                        break
+                    LOGGER.debug('queue is empty, polling every %0.1f sec', poll_for)
+                time.sleep(poll_for)
+                continue
+            url = urls[0]
+            try:
+                if 'rentals' in url:
+                    raise NotImplementedError(f'rentals like {url}')
+                prop = fetch_listing(
+                    recycler.driver,
+                    recycler.wait,
+                    url,
+                    listing_id(url),
+                    cache_dirpath,
+                    history,
+                    timeseries,
+                    rates,
+                    blocker=blocker,
+                    refresh=refresh,
+                    progress=worker_id,
+                    archive=archive,
+                )
+                history.save()
+            except Exception as ex:
+                status = queue.fail(url, worker_id, f'{type(ex).__name__}: {ex}')
+                LOGGER.error('%s - %s, %s: %s', worker_id, url, status, ex)
+            else:
+                queue.complete(url, worker_id, asdict(prop))
+                completed += 1
+                LOGGER.info('%s - done, %s', worker_id, json.dumps(queue.counts()))
+            recycler.page_done()  # after the url is settled so a relaunch never sits on a lease
+    finally:
+        history.save()
+        ParseMemo.shared(cache_dirpath).flush()
+        recycler.close()
+        if blocker:
+            blocker.report()
+
+    commutes = commute_addresses(commute)
+    properties = [Property(**prop_dict) for prop_dict in queue.results()]
+    estimate_commutes_ez(properties, commutes, output_dirpath)
+    write_properties([asdict(prop) for prop in properties], output_dirpath, f'{NOW}.queue', append=False)  # the results table is already everything
+    queue.close()
+    return completed
+
+
+class RateLimiter():
+    '''
+    at most one start every interval seconds across every thread sharing it, plus up to jitter seconds of randomness
+    (a third of the interval by default) so the pages dont land like clockwork
+    '''
+
+    def __init__(self, interval=3.0, jitter=None):
+        # type: (float, Optional[float]) -> None
+        self.interval = interval
+        self.jitter = interval / 3 if jitter is None else jitter
+        self.lock = threading.Lock()
+        self.next_at = 0.0
+
+    def wait(self):
+        # type: () -> None
+        with self.lock:
+            now = time.time()
+            start = max(now, self.next_at)
+            self.next_at = start + self.interval + random.uniform(0, self.jitter)
+        if start > now:
+            time.sleep(start - now)
+
+
+class WarmPool():
+    '''
+    Description:
+        background threads that each lazily start their own headless browser and pull (priority, url) off a shared
+        priority queue, write the page into the txt-cache exactly like url_file would and put (url, text, error) on results.
+        every thread shares one RateLimiter so the pool as a whole stays polite no matter how many browsers it runs.
+    '''
+
+    def __init__(self, output_dirpath, workers=2, interval=3.0, headless=True, blocker=None, commute='', limits=None, archive=None):
+        # type: (str, int, float, bool, Optional[ResourceBlocker], str, Optional[RecycleLimits], Optional[HtmlArchive]) -> None
+        self.cache_dirpath = abspath(output_dirpath)
+        self.headless = headless
+        self.blocker = blocker
+        self.limits = limits
+        self.archive = archive
+        self.commute = commute  # realtor keeps the commute per browser, each pool browser sets it on its first realtor page
+        self.limiter = RateLimiter(interval=interval)
+        self.todo = queue.PriorityQueue()  # type: queue.PriorityQueue
+        self.results = queue.Queue()  # type: queue.Queue
+        self.pending = set()  # type: set
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.recyclers = []  # type: List[DriverRecycler]
+        self.counter = 0
+        self.threads = [threading.Thread(target=self.run, name=f'warm-{w}', daemon=True) for w in range(max(1, workers))]
+        for thread in self.threads:
+            thread.start()
+
+    def cached_filepath(self, url):
+        # type: (str) -> str
+        return abspath(self.cache_dirpath, 'txt-cache', f'{listing_id(url)}.txt')
+
+    def submit(self, url, priority=0.0):
+        # type: (str, float) -> bool
+        '''
+        lower priority goes first, a url already pending or already cached is ignored
+        '''
+        with self.lock:
+            if url in self.pending or is_file(self.cached_filepath(url)):
+                return False
+            self.pending.add(url)
+            self.counter += 1
+            self.todo.put((priority, self.counter, url))
+        return True
+
+    def busy(self):
+        # type: () -> int
+        with self.lock:
+            return len(self.pending)
+
+    def run(self):
+        # type: () -> None
+        recycler = None  # type: Optional[DriverRecycler]
+        commute_dealt_with = not self.commute
+        while not self.stopping.is_set():
+            try:
+                _, _, url = self.todo.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            text, error = '', None
+            try:
+                if recycler is None:
+                    recycler = DriverRecycler(headless=self.headless, attach=False, performance_log=self.blocker is not None, limits=self.limits)
+                    with self.lock:
+                        self.recyclers.append(recycler)
+                self.limiter.wait()
+                host = (urllib.parse.urlparse(url).hostname or '').replace('www.', '')
+                if not commute_dealt_with and 'realtor.com' in host:
+                    realtor_com_populate_commute(recycler.driver, url, self.commute)
+                    commute_dealt_with = True
+                if self.blocker:
+                    self.blocker.apply(recycler.driver, url)
+                with METRICS.timer('house_stage_seconds', stage='warm', host=host):
+                    text = listing_text(recycler.driver, recycler.wait, url)
+                METRICS.inc('house_pages_fetched_total', host=host)
+                if self.blocker:
+                    self.blocker.collect(recycler.driver, urllib.parse.urlparse(url).hostname or '')
+                if self.archive:
+                    self.archive.put(listing_id(url), url, rendered_html(recycler.driver))
+                write_cached_text(self.cached_filepath(url), url, text)
+            except Exception as ex:
+                error = ex
+                LOGGER.warning('warming %s failed: %s', url, ex)
+            finally:
+                with self.lock:
+                    self.pending.discard(url)
+                self.results.put((url, text, error))
+            if recycler is None:
+                continue
+            try:
+                if recycler.page_done():
+                    commute_dealt_with = not self.commute
+            except Exception as ex:
+                LOGGER.warning('recycling a warm browser failed, the next url starts a new one: %s', ex)
+                recycler = None
+
+    def close(self):
+        # type: () -> None
+        self.stopping.set()
+        for thread in self.threads:
+            thread.join(timeout=5)
+        for recycler in self.recyclers:
+            try:
+                recycler.close()
+            except Exception:
+                pass
+
+
+def warm_priorities(urls, output_dirpath):
+    # type: (List[str], str) -> Dict[str, float]
+    '''
+    Description:
+        cheapest first, using whatever price is already known: the listing history, then any search <date>.cards.json.
+        unknown prices go last in file order.
+    '''
+    prices = {}  # type: Dict[str, float]
+    for cards_filepath in sorted(glob.glob(abspath(output_dirpath, '*.cards.json'))):
+        with open(cards_filepath, 'r', encoding='utf-8') as r:
+            for card in json.load(r):
+                if card.get('price'):
+                    prices[listing_id(card['url'])] = float(card['price'])
+    history = ListingHistory(output_dirpath)
+    for listing, entry in history.state.items():
+        if entry['fields'].get('price'):
+            prices[listing] = float(entry['fields']['price'])
+    return {url: prices.get(listing_id(url), float('inf')) for url in urls}
+
+
+def warm(input_filepath, output_dirpath, workers=2, interval=3.0, headless=True, blocker=None, limits=None, archive=None):
+    # type: (str, str, int, float, bool, Optional[ResourceBlocker], Optional[RecycleLimits], Optional[HtmlArchive]) -> int
+    '''
+    Description:
+        prefetch every uncached detail page in the url file so a later url_file/browse over them is all cache hits
+    Returns:
+        int
+            how many pages were warmed
+    '''
+    url_text = read_text_file(input_filepath)
+    urls = [url.strip() for url in url_text.splitlines() if url.strip() and not url.strip().startswith('#') and 'rentals' not in url]
+    priorities = warm_priorities(urls, output_dirpath)
+    pool = WarmPool(output_dirpath, workers=workers, interval=interval, headless=headless, blocker=blocker, limits=limits, archive=archive)
+    submitted = sum(pool.submit(url, priority=priorities[url]) for url in urls)
+    LOGGER.info('warming %d of %d urls with %d browsers, one page every %0.1f sec', submitted, len(urls), len(pool.threads), interval)
+    warmed = 0
+    try:
+        for done in range(submitted):
+            url, _, error = pool.results.get()
+            warmed += error is None
+            LOGGER.info('%d / %d - %s %s', done + 1, submitted, 'failed' if error else 'warmed', url)
+    except KeyboardInterrupt:
+        LOGGER.warning('ctrl + c detected!')
+    finally:
+        pool.close()
+        if blocker:
+            blocker.report()
+    return warmed
 
 
 def get_url(driver):
@@ -868,11 +4073,33 @@ def get_url(driver):
         return None
 
 
-def browse(output_dirpath, commute='', driver=None, wait=None):
-    # type: (str, str, Optional[WebDriver], Optional[WebDriverWait]) -> None
-    # NOTE: use_subprocess=False in python interactive mode
-
-    driver = driver or uc.Chrome(headless=False, use_subprocess=True)
+def browse(
+    output_dirpath,
+    commute='',
+    driver=None,
+    wait=None,
+    attach=True,
+    background=True,
+    workers=2,
+    drain_for=60.0,
+    limits=None,
+    interval=0.5,
+    headless=True,
+    blocker=None,
+    archive=None,
+):
+    # type: (str, str|List[str], Optional[WebDriver], Optional[WebDriverWait], bool, bool, int, int|float, Optional[RecycleLimits], float, bool, Optional[ResourceBlocker], Optional[HtmlArchive]) -> None
+    '''
+    Description:
+        watch the tab you are browsing in, every listing you land on gets extracted.
+        background hands uncached listings to a WarmPool of headless browsers so your tab is never clicked, scrolled
+        or slept on, their results stream back and are parsed as they arrive. whatever is still in flight when
+        the browser closes gets up to drain_for seconds to finish.
+        background=False extracts in your own tab like it used to.
+        interval, headless and blocker are the background browsers' like in warm, your own tab is never blocked,
+        archive keeps the html of every listing fetched either way.
+    '''
+    driver = driver or get_driver(attach=attach)
     wait = wait or WebDriverWait(driver, 20)  # in case you need to resolve a captcha or something
 
     cache_dirpath = abspath(output_dirpath)
@@ -882,13 +4109,60 @@ def browse(output_dirpath, commute='', driver=None, wait=None):
     mortgage_rate_30, mortgage_rate_20, mortgage_rate_15 = download_mortgage_rates(dirpath=output_dirpath)
     LOGGER.info('30 Year mortgage rate of %0.2f%%', mortgage_rate_30)
 
+    commutes = commute_addresses(commute)
+    history = ListingHistory(output_dirpath)
+    timeseries = TimeSeriesStore(output_dirpath)
+    memo = ParseMemo.shared(output_dirpath)
     properties = []
+    pool = None
+    if background:
+        pool = WarmPool(
+            output_dirpath,
+            workers=workers,
+            interval=interval,
+            headless=headless,
+            blocker=blocker,
+            commute=commutes[0] if commutes else '',
+            limits=limits,
+            archive=archive,
+        )
+
+    def discovered(url, text):
+        # type: (str, str) -> None
+        hostname = urllib.parse.urlparse(url).hostname or ''
+        cache_filename = listing_id(url)
+        prop = memo.parse(text, hostname)
+        prop.link = url
+        if history.is_new_text(cache_filename, text):
+            deltas = history.record(cache_filename, text, prop)
+            if deltas:
+                LOGGER.info('%s - changed: %s', url, json.dumps(deltas))
+        prop.calculate(mortgage_rate_15, mortgage_rate_20, mortgage_rate_30)
+        timeseries.append(cache_filename, prop, (mortgage_rate_15, mortgage_rate_20, mortgage_rate_30))
+        METRICS.inc('house_listings_total')
+        METRICS.set('house_last_progress_timestamp_seconds', time.time())
+        LOGGER.info('discovered property: %s', prop)
+        properties.append(prop)
+
+    def stream(block_for=0.0):
+        # type: (float) -> None
+        while pool is not None:
+            try:
+                url, text, error = pool.results.get(timeout=block_for) if block_for else pool.results.get_nowait()
+            except queue.Empty:
+                return
+            if error is not None:
+                LOGGER.error('background extraction of %s failed: %s', url, error)
+            else:
+                discovered(url, text)
+
     u = 0
     commute_dealt_with = False
     url = ''
     driver_url = get_url(driver)
     try:
         while driver_url is not None:
+            stream()
             if url == driver_url:
                 time.sleep(0.2)
                 driver_url = get_url(driver)
@@ -905,83 +4179,752 @@ def browse(output_dirpath, commute='', driver=None, wait=None):
 
             u += 1
 
-            cache_filename = f'{u}'
             hostname = str(parsed.hostname) if parsed.hostname else ''
-            if hostname:
-                cache_filename = parsed.path.split('/')[-1]
+            cache_filename = listing_id(url, u)
             cached_filepath = abspath(cache_dirpath, 'txt-cache', f'{cache_filename}.txt')
+            is_listing = ('realtor.com' in hostname and 'realestateandhomes-detail' in parsed.path) or ('zillow.com' in hostname and 'homedetails' in parsed.path)
             if is_file(cached_filepath):
                 LOGGER.info('%d - %s from file', u + 1, url)
                 text = read_text_file(cached_filepath)
+            elif not is_listing:
+                LOGGER.debug('not implemented for hostname %r', hostname)
+            elif pool is not None:
+                if pool.submit(url):
+                    LOGGER.info('%d - %s handed to the background, %d in flight', u + 1, url, pool.busy())
             else:
                 LOGGER.info('%d - %s from browser', u + 1, url)
-                if 'realtor.com' in hostname and 'realestateandhomes-detail' in parsed.path:
-                    if commute and not commute_dealt_with:
-                        realtor_com_populate_commute(driver, url, commute)
+                if 'realtor.com' in hostname:
+                    if commutes and not commute_dealt_with:
+                        realtor_com_populate_commute(driver, url, commutes[0])
                         commute_dealt_with = True
                     text = realtor_com_to_text(driver, wait, url)
-                elif 'zillow.com' in hostname and 'homedetails' in parsed.path:
-                    text = zillow_com_to_text(driver, wait, url)
                 else:
-                    LOGGER.debug('not implemented for hostname %r', hostname)
-                    continue
-                    # raise NotImplementedError(f'not implemented for {hostname!r}!')
-                write_text_file(cached_filepath, f'{url}\n{text}')
-
-                prop = Property.parse_text(text, hostname=hostname)
-                prop.link = url
-                prop.calculate(mortgage_rate_15, mortgage_rate_20, mortgage_rate_30)
-                LOGGER.info('discovered property: %s', prop)
-                properties.append(prop)
+                    text = zillow_com_to_text(driver, wait, url)
+                METRICS.inc('house_pages_fetched_total', host=hostname.replace('www.', ''))
+                if archive:
+                    archive.put(cache_filename, url, rendered_html(driver))
+                write_cached_text(cached_filepath, url, text)
+                discovered(url, text)
 
             driver_url = get_url(driver)
     except KeyboardInterrupt:
         driver.close()
         LOGGER.warning('ctrl + c detected!')
+    finally:
+        if pool is not None:
+            deadline = time.time() + drain_for
+            while pool.busy() and time.time() < deadline:
+                LOGGER.info('waiting on %d background extractions', pool.busy())
+                stream(block_for=1.0)
+            stream()
+            pool.close()
+            if blocker:
+                blocker.report()
+    history.save()
+    memo.flush()
+
+    estimate_commutes_ez(properties, commutes, output_dirpath)
+    write_properties([asdict(prop) for prop in properties], output_dirpath, NOW)
+
+
+# the most result pages either site hands out for one query, a shard reporting this many is assumed truncated.
+# zillow stops at 20, realtor is set conservatively, splitting a shard that was not capped only costs a query.
+SEARCH_PAGE_CAPS = {'zillow.com': 20, 'realtor.com': 50}
+SHARD_PRICE_FLOOR = 25000  # band edges are spaced geometrically from here, almost nothing lists below it
+SHARD_PRICE_CEILING = 10000000  # same as the zillow default max, the top band stays open-ended past it
+SHARD_PRICE_RESOLUTION = 5000  # a band narrower than this is not split any further, it is just truncated
 
-    property_dicts = [asdict(prop) for prop in properties]
-    LOGGER.info('found %d properties', len(property_dicts))
-    if property_dicts:
-        output_filepath_json = abspath(output_dirpath, f'{NOW}.json')
-        if os.path.isfile(output_filepath_json):
-            with open(output_filepath_json, 'r', encoding='utf-8') as r:
-                existing_dicts = json.load(r)
-            property_dicts.extend(existing_dicts)
 
-        keys = list(asdict(DEFAULT_PROPERTY).keys())
-        output_filepath_csv = abspath(output_dirpath, f'{NOW}.csv')
-        with open(output_filepath_csv, 'w', encoding='utf-8', newline='') as w:
-            writer = csv.DictWriter(w, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(property_dicts)
-        LOGGER.info('wrote "%s"', output_filepath_csv)
+@dataclass
+class SearchShard:
+    '''
+    one query on one site: a city/state or a zip, and a price band where None is open-ended
+    '''
+    site: str = 'zillow.com'
+    city: Optional[str] = None
+    state: Optional[str] = None
+    zip: Optional[int] = None
+    price_min: Optional[float] = None
+    price_max: Optional[float] = None
+    depth: int = 0
 
-        with open(output_filepath_json, 'w', encoding='utf-8') as w:
-            json.dump(property_dicts, w, indent=2)
-        LOGGER.info('wrote "%s"', output_filepath_json)
+    def label(self):
+        # type: () -> str
+        where = f'{self.city}, {self.state}' if self.zip is None else str(self.zip)
+        low = 'na' if self.price_min is None else f'{self.price_min:.0f}'
+        high = 'na' if self.price_max is None else f'{self.price_max:.0f}'
+        return f'{self.site} {where} {low}-{high}'
 
 
-def search(output_dirpath, city=None, state=None, zip=None, price_max=None, price_min=None, show_contingent=False, commute='', driver=None, wait=None):
-    # type: (str, Optional[str], Optional[str], Optional[int], Optional[int | float], Optional[int | float], bool, str, Optional[WebDriver], Optional[WebDriverWait]) -> None
+def price_bands(price_min=None, price_max=None, bands=1):
+    # type: (Optional[float], Optional[float], int) -> List[Tuple[Optional[float], Optional[float]]]
+    '''
+    Description:
+        split [price_min, price_max] into bands spaced geometrically (prices are roughly log-normal so each band holds
+        a similar number of listings), edges rounded to $1000 and shared by neighbours, the outer edges stay as given
+    '''
+    if bands <= 1:
+        return [(price_min, price_max)]
+    low = max(price_min or 0, SHARD_PRICE_FLOOR)
+    high = price_max or SHARD_PRICE_CEILING
+    if high - low < bands * SHARD_PRICE_RESOLUTION:
+        return [(price_min, price_max)]
+    edges = [float(round(edge, -3)) for edge in np.geomspace(low, high, bands + 1)]  # type: List[Optional[float]]
+    edges[0], edges[-1] = price_min, price_max
+    return [(edges[b], edges[b + 1]) for b in range(bands)]
+
+
+def split_search_shard(shard):
+    # type: (SearchShard) -> List[SearchShard]
+    '''
+    Description:
+        halve the price band of a capped shard at its geometric middle
+    Returns:
+        List[SearchShard]
+            the two halves, empty if the band is already too narrow to split
+    '''
+    low = shard.price_min or 0
+    high = shard.price_max or SHARD_PRICE_CEILING
+    if high - low < 2 * SHARD_PRICE_RESOLUTION:
+        return []
+    middle = float(round(np.sqrt(max(low, SHARD_PRICE_FLOOR) * high), -3))
+    middle = min(max(middle, low + SHARD_PRICE_RESOLUTION), high - SHARD_PRICE_RESOLUTION)
+    return [
+        SearchShard(**dict(asdict(shard), price_max=middle, depth=shard.depth + 1)),
+        SearchShard(**dict(asdict(shard), price_min=middle, depth=shard.depth + 1)),
+    ]
 
-    # NOTE: use_subprocess=False in python interactive mode
-    driver = driver or uc.Chrome(headless=False, use_subprocess=True)
-    wait = wait or WebDriverWait(driver, 20)  # in case you need to resolve a captcha or something
 
-    cache_dirpath = abspath(output_dirpath)
-    os.makedirs(cache_dirpath, exist_ok=True)
+def zips_within(centroids, zip, miles):
+    # type: (Dict[str, Tuple[float, float]], int|str, float) -> List[int]
+    '''
+    every zip whose centroid is within miles of the centroid of zip, nearest first, zip itself included
+    '''
+    key = f'{int(zip):05d}'
+    if key not in centroids:
+        raise ValueError(f'{key!r} is not a known zip!')
+    keys = list(centroids)
+    distances = haversine_miles(np.array([centroids[key]]), np.array([centroids[k] for k in keys]))[0]
+    order = np.argsort(distances, kind='stable')
+    return [int(keys[i]) for i in order if distances[i] <= miles]
+
+
+def plan_search_shards(sites=('realtor.com', 'zillow.com'), city=None, state=None, zip=None, zips=None, price_min=None, price_max=None, bands=1):
+    # type: (Iterable[str], Optional[str], Optional[str], Optional[int], Optional[List[int]], Optional[float], Optional[float], int) -> List[SearchShard]
+    '''
+    Description:
+        site x place x price band, zips replaces the city/zip as the places when given
+    '''
+    if zips:
+        places = [(None, None, int(z)) for z in zips]  # type: List[Tuple[Optional[str], Optional[str], Optional[int]]]
+    elif zip:
+        places = [(None, None, int(zip))]
+    elif city and state:
+        places = [(city, state, None)]
+    else:
+        raise ValueError('must provide either city and state OR zip!')
+    shards = []
+    for site in sites:
+        for shard_city, shard_state, shard_zip in places:
+            for low, high in price_bands(price_min, price_max, bands):
+                shards.append(SearchShard(site=site, city=shard_city, state=shard_state, zip=shard_zip, price_min=low, price_max=high))
+    return shards
+
+
+def merge_shard_results(results):
+    # type: (Iterable[Tuple[List[str], List[dict]]]) -> Tuple[List[str], List[dict]]
+    '''
+    union of every shard's (urls, cards) in order, first one wins, shards overlap on their shared price edges
+    '''
+    urls = {}  # type: Dict[str, None]
+    cards = {}  # type: Dict[str, dict]
+    for shard_urls, shard_cards in results:
+        for url in shard_urls:
+            urls.setdefault(url, None)
+        for card in shard_cards:
+            cards.setdefault(card['url'], card)
+    return list(urls), list(cards.values())
+
+
+def card_monthly(card, rates, down=20.0):
+    # type: (dict, Tuple[float, float, float], float) -> Optional[float]
+    '''
+    Description:
+        the lowest the monthly total could come out to once the detail page is parsed: the 30 year payment at
+        current rates plus the HOA if the card showed one, land lease and any HOA the card left out can only add to it
+    Returns:
+        Optional[float]
+            None without a price
+    '''
+    price = card.get('price')
+    if not price:
+        return None
+    _, _, mortgage_rate_30 = rates
+    return mortgage_monthly(float(price), mortgage_rate_30, down=down, years=30, as_float=True) + float(card.get('hoa') or 0)
+
+
+def prefilter_cards(urls, cards, rates, max_monthly=None, bed_min=None, down=20.0):
+    # type: (List[str], List[dict], Tuple[float, float, float], Optional[float], Optional[float], float) -> Tuple[List[str], List[Tuple[str, str]]]
+    '''
+    Description:
+        drop the urls whose card alone proves they cannot qualify, anything the card is silent about is kept
+        so a detail page is only skipped when it could not possibly pass
+    Returns:
+        Tuple[List[str], List[Tuple[str, str]]]
+            the urls worth a detail page, (url, reason) for the rest
+    '''
+    by_listing = {listing_id(card['url']): card for card in cards if card.get('url')}
+    kept, skipped = [], []
+    for url in urls:
+        card = by_listing.get(listing_id(url), {})
+        monthly = card_monthly(card, rates, down=down) if max_monthly is not None else None
+        if monthly is not None and monthly > max_monthly:  # type: ignore
+            METRICS.inc('house_cards_prefiltered_total', reason='monthly')
+            skipped.append((url, f'monthly at least ${monthly:,.0f} > ${max_monthly:,.0f}'))
+        elif bed_min is not None and card.get('bed') and float(card['bed']) < bed_min:
+            METRICS.inc('house_cards_prefiltered_total', reason='bed')
+            skipped.append((url, f'{float(card["bed"]):g} bed < {bed_min:g}'))
+        else:
+            kept.append(url)
+    return kept, skipped
+
+
+def search_shard(driver, wait, shard, show_contingent=False, scroll=False):
+    # type: (WebDriver, WebDriverWait, SearchShard, bool, bool) -> Tuple[List[str], List[dict], int]
+    '''
+    Returns:
+        Tuple[List[str], List[dict], int]
+            urls, cards and how many result pages the site said there were
+    '''
+    meta = {}  # type: dict
+    cards = []  # type: List[dict]
+    kwargs = dict(city=shard.city, state=shard.state, zip=shard.zip, price_min=shard.price_min, price_max=shard.price_max, show_contingent=show_contingent, meta=meta)
+    with METRICS.timer('house_stage_seconds', stage='search', host=shard.site):
+        if shard.site == 'zillow.com':
+            urls = zillow_com_search(driver, wait, search_state=not scroll, cards=cards, **kwargs)
+        elif shard.site == 'realtor.com':
+            urls = realtor_com_search(driver, wait, cards=cards, **kwargs)
+        else:
+            raise NotImplementedError(f'{shard.site} search not yet implemented!')
+    return urls, cards, int(meta.get('pages', 1))
+
+
+def search_sharded(shards, workers=2, headless=False, attach=False, blocker=None, limits=None, show_contingent=False, scroll=False, recycler=None):
+    # type: (List[SearchShard], int, bool, bool, Optional[ResourceBlocker], Optional[RecycleLimits], bool, bool, Optional[DriverRecycler]) -> Tuple[List[str], List[dict]]
+    '''
+    Description:
+        run the shards on workers threads, each with its own browser. a shard that comes back with as many pages as the
+        site caps at is split in half by price and both halves go back on the queue, its own urls are kept either way.
+        a shard that fails is logged and skipped, the rest still count.
+        recycler is lent to the first thread instead of it launching a browser, and is left open afterwards.
+    Returns:
+        Tuple[List[str], List[dict]]
+            merged, deduped urls and cards in plan order
+    '''
+    todo = queue.Queue()  # type: queue.Queue
+    lock = threading.Lock()
+    results = {}  # type: Dict[int, Tuple[List[str], List[dict]]]
+    order = {}  # type: Dict[int, tuple]
+    outstanding = [0]
+    counter = [0]
+
+    def put(shard, position):
+        # type: (SearchShard, tuple) -> None
+        with lock:
+            outstanding[0] += 1
+            counter[0] += 1
+            order[counter[0]] = position
+            todo.put((counter[0], shard))
+
+    def run(w):
+        # type: (int) -> None
+        mine = lent if w == 0 else None  # type: Optional[DriverRecycler]
+        while True:
+            item = todo.get()
+            if item is None:
+                break
+            key, shard = item
+            try:
+                if mine is None:
+                    mine = DriverRecycler(headless=headless, attach=attach and w == 0, performance_log=blocker is not None, limits=limits)
+                urls, cards, pages = search_shard(mine.driver, mine.wait, shard, show_contingent=show_contingent, scroll=scroll)
+                with lock:
+                    results[key] = (urls, cards)
+                if pages >= SEARCH_PAGE_CAPS.get(shard.site, pages + 1):
+                    halves = split_search_shard(shard)
+                    if halves:
+                        LOGGER.info('%s - capped at %d pages, splitting into %s', shard.label(), pages, ' and '.join(half.label() for half in halves))
+                        for h, half in enumerate(halves):
+                            put(half, order[key] + (h, ))
+                    else:
+                        LOGGER.warning('%s - capped at %d pages and too narrow to split, some listings are missing', shard.label(), pages)
+                LOGGER.info('%s - %d urls over %d pages', shard.label(), len(urls), pages)
+                mine.page_done()
+            except Exception as ex:
+                LOGGER.error('%s - shard failed, skipping it: %s', shard.label(), ex)
+            finally:
+                with lock:
+                    outstanding[0] -= 1
+                    if not outstanding[0]:
+                        for _ in range(max(1, workers)):
+                            todo.put(None)
+        if mine is not None and mine is not lent:
+            mine.close()
+
+    if not shards:
+        return [], []
+    lent = recycler
+    for s, shard in enumerate(shards):
+        put(shard, (s, ))
+    threads = [threading.Thread(target=run, args=(w, ), name=f'shard-{w}', daemon=True) for w in range(max(1, workers))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    urls, cards = merge_shard_results(results[key] for key in sorted(results, key=lambda key: order[key]))
+    LOGGER.info('%d shards run, %d unique urls', len(results), len(urls))
+    return urls, cards
+
+
+def search(
+    output_dirpath,
+    city=None,
+    state=None,
+    zip=None,
+    price_max=None,
+    price_min=None,
+    show_contingent=False,
+    commute='',
+    driver=None,
+    wait=None,
+    attach=True,
+    headless=False,
+    blocker=None,
+    scroll=False,
+    queue_filepath=None,
+    limits=None,
+    bands=1,
+    zips=None,
+    shard_miles=None,
+    workers=2,
+    max_monthly=None,
+    bed_min=None,
+    archive=None,
+):
+    # type: (str, Optional[str], Optional[str], Optional[int], Optional[int | float], Optional[int | float], bool, str|List[str], Optional[WebDriver], Optional[WebDriverWait], bool, bool, Optional[ResourceBlocker], bool, Optional[str], Optional[RecycleLimits], int, Optional[List[int]], Optional[float], int, Optional[float], Optional[int], Optional[HtmlArchive]) -> None
+    '''
+    Description:
+        queue_filepath hands the detail urls to "house worker"s through the shared queue instead of visiting them here
+        bands > 1, zips or shard_miles (every zip within that many miles of zip) shard the search, see search_sharded
+        max_monthly/bed_min skip results whose card already rules them out, see prefilter_cards, into <NOW>.skipped.urls
+    '''
+    zips = list(zips or [])
+    if shard_miles:
+        if not zip:
+            raise ValueError('shard_miles needs a zip to measure from!')
+        zips.extend(z for z in zips_within(download_zip_centroids(dirpath=output_dirpath), zip, shard_miles) if z not in zips)
+    recycler = DriverRecycler(driver=driver, headless=headless, attach=attach, performance_log=blocker is not None, limits=limits)
+    if wait is not None:
+        recycler.wait = wait
+
+    try:
+        cache_dirpath = abspath(output_dirpath)
+        os.makedirs(cache_dirpath, exist_ok=True)
+
+        # realtor and zillow (and every shard of them) at the same time, the first thread borrows this browser,
+        # the rest get their own, each site keeps its own pacing. url_file below gets this browser back.
+        shards = plan_search_shards(city=city, state=state, zip=zip, zips=zips, price_min=price_min, price_max=price_max, bands=bands)
+        workers = max(1, min(workers, len(shards)))
+        LOGGER.info('%d shards on %d browsers', len(shards), workers)
+        urls, cards = search_sharded(
+            shards,
+            workers=workers,
+            headless=headless,
+            attach=False,
+            blocker=blocker,
+            limits=limits,
+            show_contingent=show_contingent,
+            scroll=scroll,
+            recycler=recycler,
+        )
+        if cards:
+            output_filepath_cards = abspath(output_dirpath, f'{NOW}.cards.json')
+            write_text_file(output_filepath_cards, json.dumps(cards, indent=2))
+            LOGGER.info('wrote "%s"', output_filepath_cards)
+        if urls and (max_monthly is not None or bed_min is not None):
+            mortgage_rate_30, mortgage_rate_20, mortgage_rate_15 = download_mortgage_rates(dirpath=output_dirpath)
+            urls, skipped = prefilter_cards(urls, cards, (mortgage_rate_15, mortgage_rate_20, mortgage_rate_30), max_monthly=max_monthly, bed_min=bed_min)
+            LOGGER.info('%d results ruled out by their card at %0.2f%%, %d left for detail pages', len(skipped), mortgage_rate_30, len(urls))
+            if skipped:
+                output_filepath_skipped = abspath(output_dirpath, f'{NOW}.skipped.urls')
+                write_text_file(output_filepath_skipped, '\n'.join(f'# {reason}\n{url}' for url, reason in skipped))
+                LOGGER.info('wrote "%s"', output_filepath_skipped)
+        if urls:
+            output_filepath_urls = abspath(output_dirpath, f'{NOW}.urls')
+            write_text_file(output_filepath_urls, '\n'.join(urls))
+            LOGGER.info('wrote "%s"', output_filepath_urls)
+
+            if queue_filepath is not None:
+                queue = WorkQueue(queue_filepath_default(output_dirpath, queue_filepath))
+                added = queue.enqueue(urls)
+                LOGGER.info('enqueued %d new urls onto "%s", %s', added, queue.db_filepath, json.dumps(queue.counts()))
+                queue.close()
+                return
+
+            url_file(output_filepath_urls, output_dirpath, commute=commute, blocker=blocker, recycler=recycler, archive=archive)
+    finally:
+        recycler.close()
+
+
+def property_from_row(row):
+    # type: (Dict[str, str]) -> Property
+    '''
+    Description:
+        csv rows are all strings, cast them back using the types of DEFAULT_PROPERTY, unknown columns from older/newer outputs are dropped
+    '''
+    kwargs = {}
+    for key, value in row.items():
+        if key not in PROPERTY_KEY_TYPES or value is None or value == '':
+            continue
+        KeyType = PROPERTY_KEY_TYPES[key]
+        try:
+            kwargs[key] = KeyType(float(value)) if KeyType is int else KeyType(value)
+        except ValueError:
+            continue
+    return Property(**kwargs)
+
+
+def iter_property_rows(output_dirpath):
+    # type: (str) -> Generator[Dict[str, str], None, None]
+    '''
+    Description:
+        stream every property row out of every output csv, oldest file first, one row in memory at a time.
+        the csv and json outputs carry the same rows so only the csv is read.
+    '''
+    for csv_filepath in sorted(glob.glob(abspath(output_dirpath, '*.csv'))):
+        with open(csv_filepath, 'r', encoding='utf-8', newline='') as r:
+            reader = csv.DictReader(r)
+            if not reader.fieldnames or 'link' not in reader.fieldnames or 'address' not in reader.fieldnames:
+                continue  # zip-centroids.csv and friends
+            for row in reader:
+                yield row
+
+
+def row_float(row, key):
+    # type: (Dict[str, str], str) -> float
+    try:
+        return float(row.get(key) or 0)
+    except ValueError:
+        return 0.0
+
+
+def score_price_per_area(row):
+    # type: (Dict[str, str]) -> Optional[float]
+    area = row_float(row, 'area')
+    return row_float(row, 'price') / area if area else None
+
+
+def score_commute(row):
+    # type: (Dict[str, str]) -> Optional[float]
+    minutes = row_float(row, 'commute_minutes')
+    if minutes:
+        return minutes
+    mo = re.search(r'(\d+) min', row.get('commute') or '')
+    return float(mo.groups()[0]) if mo else None
+
+
+# scores run on the raw csv row so only the survivors pay for building a Property
+TOP_SCORES = {
+    'total': lambda row: row_float(row, 'total') or None,
+    'per_person': lambda row: row_float(row, 'per_person') or None,
+    'price_per_area': score_price_per_area,
+    'commute': score_commute,
+}
+
+
+def top_properties(rows, k=10, score='total', bed_min=None, property_types=None, hoa_max=None, land_lease_max=None):
+    # type: (Iterable[Dict[str, str]], int, str, Optional[int], Optional[List[str]], Optional[float], Optional[float]) -> List[Tuple[float, Property]]
+    '''
+    Description:
+        the k lowest scoring properties, lowest first. only the latest row per listing (link, else address) counts,
+        like located_properties and project, so a reverted price cut or a stale rate never keeps a listing in.
+        filters run on that raw row, a bounded max-heap of size k holds the best so far, only the winners become Property.
+
+    Returns:
+        List[Tuple[float, Property]]
+    '''
+    if k < 1:
+        return []
+    scorer = TOP_SCORES[score]
+    property_types = [property_type.lower() for property_type in (property_types or [])]
+    latest = {}  # type: Dict[str, Tuple[int, Dict[str, str]]]
+    for r, row in enumerate(rows):
+        latest[row.get('link') or row.get('address') or f'row-{r}'] = (r, row)
+
+    heap = []  # type: List[Tuple[float, int, str]]
+    for link, (r, row) in latest.items():
+        if bed_min is not None and row_float(row, 'bed') < bed_min:
+            continue
+        if hoa_max is not None and row_float(row, 'hoa') > hoa_max:
+            continue
+        if land_lease_max is not None and row_float(row, 'land_lease') > land_lease_max:
+            continue
+        if property_types and not any(property_type in (row.get('property_type') or '').lower() for property_type in property_types):
+            continue
+
+        value = scorer(row)
+        if value is None:
+            continue
+        if len(heap) < k:
+            heapq.heappush(heap, (-value, -r, link))
+        elif value < -heap[0][0]:
+            heapq.heapreplace(heap, (-value, -r, link))
+
+    return sorted(((-negative, property_from_row(latest[link][1])) for negative, _, link in heap), key=lambda tpl: tpl[0])
+
+
+def top(output_dirpath, k=10, score='total', bed_min=None, property_types=None, hoa_max=None, land_lease_max=None):
+    # type: (str, int, str, Optional[int], Optional[List[str]], Optional[float], Optional[float]) -> List[Tuple[float, Property]]
+    start = time.time()
+    results = top_properties(
+        iter_property_rows(output_dirpath),
+        k=k,
+        score=score,
+        bed_min=bed_min,
+        property_types=property_types,
+        hoa_max=hoa_max,
+        land_lease_max=land_lease_max,
+    )
+    for value, prop in results:
+        print(f'{value:>10.2f}  ${prop.total:>8.2f}/mo  ${prop.price:>11,.0f}  {prop.bed}bed/{prop.bath}bath  {prop.address}  {prop.link}')
+    LOGGER.info('top %d by %s in %0.3f sec', len(results), score, time.time() - start)
+    return results
+
 
-    search_args = (driver, wait)
-    search_kwargs = dict(city=city, state=state, zip=zip, price_max=price_max, price_min=price_min, show_contingent=show_contingent)
-    zillow_com_urls = zillow_com_search(*search_args, **search_kwargs)
-    realtor_com_urls = realtor_com_search(*search_args, **search_kwargs)
-    urls = realtor_com_urls + zillow_com_urls
-    if urls:
-        output_filepath_urls = abspath(output_dirpath, f'{NOW}.urls')
-        write_text_file(output_filepath_urls, '\n'.join(urls))
-        LOGGER.info('wrote "%s"', output_filepath_urls)
+MILES_PER_DEGREE_LATITUDE = 69.0
 
-        url_file(output_filepath_urls, output_dirpath, commute=commute, driver=driver, wait=wait)
+
+class SpatialIndex():
+    '''
+    Description:
+        uniform lat/lon grid over (N, 2) points, each cell holds the indices of the points in it.
+        a query only looks at the cells its bounding box touches, then checks exact distances with numpy.
+        cell_degrees=0.05 is about 3.5 miles north-south, roughly a neighborhood.
+    '''
+
+    def __init__(self, latlons, cell_degrees=0.05):
+        # type: (np.ndarray|List[Tuple[float, float]], float) -> None
+        self.latlons = np.asarray(latlons, dtype=np.float64).reshape(-1, 2)
+        self.cell_degrees = cell_degrees
+        valid = np.flatnonzero(~np.isnan(self.latlons).any(axis=1))
+        cells = np.floor(self.latlons[valid] / cell_degrees).astype(np.int64)
+        self.cells = {}  # type: Dict[Tuple[int, int], np.ndarray]
+        if len(valid):
+            order = np.lexsort((cells[:, 1], cells[:, 0]))
+            cells, valid = cells[order], valid[order]
+            starts = np.flatnonzero(np.r_[True, (np.diff(cells, axis=0) != 0).any(axis=1)])
+            for start, stop in zip(starts, np.r_[starts[1:], len(valid)]):
+                self.cells[(int(cells[start, 0]), int(cells[start, 1]))] = valid[start:stop]
+        self.n_valid = len(valid)
+
+    def __len__(self):
+        # type: () -> int
+        return self.n_valid
+
+    def candidates(self, south, west, north, east):
+        # type: (float, float, float, float) -> np.ndarray
+        i0, i1 = int(np.floor(south / self.cell_degrees)), int(np.floor(north / self.cell_degrees))
+        j0, j1 = int(np.floor(west / self.cell_degrees)), int(np.floor(east / self.cell_degrees))
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self.cells):  # huge box, cheaper to walk the occupied cells
+            chunks = [indices for (i, j), indices in self.cells.items() if i0 <= i <= i1 and j0 <= j <= j1]
+        else:
+            chunks = [self.cells[(i, j)] for i in range(i0, i1 + 1) for j in range(j0, j1 + 1) if (i, j) in self.cells]
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+
+    def bbox(self, south, west, north, east):
+        # type: (float, float, float, float) -> np.ndarray
+        '''
+        indices of every point inside, no antimeridian wrapping, these are houses in one metro
+        '''
+        indices = self.candidates(south, west, north, east)
+        latlons = self.latlons[indices]
+        inside = (latlons[:, 0] >= south) & (latlons[:, 0] <= north) & (latlons[:, 1] >= west) & (latlons[:, 1] <= east)
+        return np.sort(indices[inside])
+
+    def radius(self, latitude, longitude, miles):
+        # type: (float, float, float) -> Tuple[np.ndarray, np.ndarray]
+        '''
+        Returns:
+            Tuple[np.ndarray, np.ndarray]
+                indices within miles, nearest first, and their straight-line miles
+        '''
+        dlat = miles / MILES_PER_DEGREE_LATITUDE
+        dlon = miles / (MILES_PER_DEGREE_LATITUDE * max(np.cos(np.radians(latitude)), 1e-6))
+        indices = self.candidates(latitude - dlat, longitude - dlon, latitude + dlat, longitude + dlon)
+        if not len(indices):
+            return indices, np.zeros(0)
+        distances = haversine_miles(self.latlons[indices], [(latitude, longitude)])[:, 0]
+        keep = distances <= miles
+        indices, distances = indices[keep], distances[keep]
+        order = np.argsort(distances, kind='stable')
+        return indices[order], distances[order]
+
+    def nearest(self, latitude, longitude, k=10):
+        # type: (float, float, int) -> Tuple[np.ndarray, np.ndarray]
+        '''
+        grow the radius a cell at a time until k points are inside it, then the k closest
+        '''
+        k = min(k, self.n_valid)
+        if k < 1:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        miles = self.cell_degrees * MILES_PER_DEGREE_LATITUDE
+        while True:
+            indices, distances = self.radius(latitude, longitude, miles)
+            if len(indices) >= k or miles > np.pi * EARTH_RADIUS_MILES:
+                return indices[:k], distances[:k]
+            miles *= 2
+
+
+def located_properties(output_dirpath, geocoder=None):
+    # type: (str, Optional[Geocoder]) -> Tuple[List[Property], np.ndarray]
+    '''
+    Description:
+        the latest row per listing across every output, with scraped coordinates or the geocoder's for older rows
+    Returns:
+        Tuple[List[Property], np.ndarray]
+            properties and their (N, 2) latitude/longitude, NaN where unknown
+    '''
+    latest = {}  # type: Dict[str, Property]
+    for row in iter_property_rows(output_dirpath):
+        prop = property_from_row(row)
+        latest[prop.link or prop.address] = prop
+    properties = list(latest.values())
+    nan = (float('nan'), float('nan'))
+    latlons = np.array([property_latlon(prop, geocoder) or nan for prop in properties], dtype=np.float64).reshape(-1, 2)
+    if geocoder is not None:
+        geocoder.save()
+    return properties, latlons
+
+
+def near(output_dirpath, where, miles=None, bbox=None, k=None):
+    # type: (str, str, Optional[float], Optional[str], Optional[int]) -> List[Tuple[float, Property]]
+    '''
+    Description:
+        where is "lat,lon" or an address (zip centroid), then a radius, a bbox "south,west,north,east" or the k nearest
+    '''
+    try:
+        geocoder = Geocoder.load(output_dirpath)  # type: Optional[Geocoder]
+    except Exception:
+        LOGGER.warning('no zip centroids, only listings with scraped coordinates are indexed')
+        geocoder = None
+    start = time.time()
+    properties, latlons = located_properties(output_dirpath, geocoder=geocoder)
+    index = SpatialIndex(latlons)
+    LOGGER.info('indexed %d / %d properties in %0.3f sec', len(index), len(properties), time.time() - start)
+
+    mo = re.match(r'^\s*(-?[\d\.]+)\s*,\s*(-?[\d\.]+)\s*$', where or '')
+    center = (float(mo.group(1)), float(mo.group(2))) if mo else (geocoder.geocode(where) if geocoder and where else None)
+    if center is None and not bbox:
+        raise ValueError(f'could not locate {where!r}, try "lat,lon"!')
+
+    start = time.time()
+    if bbox:
+        south, west, north, east = [float(token) for token in bbox.split(',')]
+        indices = index.bbox(south, west, north, east)
+        distances = haversine_miles(latlons[indices], [center])[:, 0] if center is not None else np.zeros(len(indices))
+    elif miles is not None:
+        indices, distances = index.radius(center[0], center[1], miles)  # type: ignore
+    else:
+        indices, distances = index.nearest(center[0], center[1], k=k or 10)  # type: ignore
+    LOGGER.info('%d properties in %0.2f ms', len(indices), (time.time() - start) * 1000)
+
+    results = [(float(distance), properties[i]) for i, distance in zip(indices, distances)]
+    for distance, prop in results:
+        print(f'{distance:>6.2f} mi  ${prop.total:>8.2f}/mo  ${prop.price:>11,.0f}  {prop.bed}bed/{prop.bath}bath  {prop.address}  {prop.link}')
+    return results
+
+
+def cost_of_ownership(properties, apr, down=20.0, years=30, hold_years=10, hoa_growth=0.0, land_lease_growth=0.0, appreciation=0.0):
+    # type: (List[Property], float, float, int, int, float, float, float) -> List[Dict[str, float]]
+    '''
+    Description:
+        what owning each property for hold_years costs and leaves you with, all properties in one schedule pass
+
+    Returns:
+        List[Dict[str, float]]
+            per property: interest, principal, hoa_and_land_lease, cost, balance, equity after hold_years, plus interest over the whole loan
+    Raises:
+        ValueError: hold_years or years under 1
+    '''
+    if hold_years < 1 or years < 1:
+        raise ValueError(f'hold_years ({hold_years}) and years ({years}) must be at least 1!')
+    if not properties:
+        return []
+    schedules = amortization_schedules(
+        [prop.price for prop in properties],
+        apr,
+        down=down,
+        years=years,
+        hoa=[prop.hoa for prop in properties],
+        land_lease=[prop.land_lease for prop in properties],
+        hoa_growth=hoa_growth,
+        land_lease_growth=land_lease_growth,
+        appreciation=appreciation,
+    )
+    m = min(hold_years, years) * 12 - 1
+    fees = np.cumsum(schedules['hoa'][:, :m + 1] + schedules['land_lease'][:, :m + 1], axis=1)[:, -1]
+    columns = dict(
+        interest=schedules['cum_interest'][:, m],
+        principal=schedules['cum_principal'][:, m],
+        hoa_and_land_lease=fees,
+        cost=schedules['cum_cost'][:, m],
+        balance=schedules['balance'][:, m],
+        equity=schedules['equity'][:, m],
+        loan_interest=schedules['cum_interest'][:, -1],
+    )
+    return [{key: round(float(values[p]), 2) for key, values in columns.items()} for p in range(len(properties))]
+
+
+def project(output_dirpath, hold_years=10, years=30, down=20.0, hoa_growth=3.0, land_lease_growth=3.0, appreciation=0.0):
+    # type: (str, int, int, float, float, float, float) -> str
+    '''
+    Description:
+        cost of ownership for the latest version of every property in the stored outputs, at today's rate for the loan term
+
+    Returns:
+        str
+            the projection csv
+    '''
+    mortgage_rate_30, mortgage_rate_20, mortgage_rate_15 = download_mortgage_rates(dirpath=output_dirpath)
+    apr = {30: mortgage_rate_30, 20: mortgage_rate_20, 15: mortgage_rate_15}.get(years, mortgage_rate_30)
+    LOGGER.info('%d year loan at %0.2f%%, held %d years', years, apr, hold_years)
+
+    latest = {}  # type: Dict[str, Property]
+    for row in iter_property_rows(output_dirpath):
+        prop = property_from_row(row)
+        latest[prop.link or prop.address] = prop
+    properties = list(latest.values())
+    projections = cost_of_ownership(
+        properties,
+        apr,
+        down=down,
+        years=years,
+        hold_years=hold_years,
+        hoa_growth=hoa_growth,
+        land_lease_growth=land_lease_growth,
+        appreciation=appreciation,
+    )
+
+    output_filepath_csv = abspath(output_dirpath, 'projections', f'{NOW}.csv')
+    make_dirpath(os.path.dirname(output_filepath_csv))
+    keys = ['link', 'address', 'price', 'hoa', 'land_lease'] + (list(projections[0]) if projections else [])
+    with open(output_filepath_csv, 'w', encoding='utf-8', newline='') as w:
+        writer = csv.DictWriter(w, fieldnames=keys)
+        writer.writeheader()
+        for prop, projection in zip(properties, projections):
+            writer.writerow(dict(link=prop.link, address=prop.address, price=prop.price, hoa=prop.hoa, land_lease=prop.land_lease, **projection))
+    LOGGER.info('wrote "%s"', output_filepath_csv)
+    return output_filepath_csv
 
 
 def main():
@@ -992,10 +4935,38 @@ def main():
         sys.exit(1)
 
     args = Arguments.parse(parser=parser)
+    blocker = ResourceBlocker(load_block_config(args.block_config_filepath)) if args.block else None
+    limits = RecycleLimits(rss_mb=args.recycle_mb, heap_mb=args.recycle_heap_mb, pages=args.recycle_pages)
+    archive = HtmlArchive(args.output_dirpath) if args.archive else None
+    if args.metrics_port is not None:
+        METRICS.serve(args.metrics_port)
+    if args.metrics_filepath:
+        METRICS.write_every(args.metrics_filepath)
     if args.mode == 'url-file':
-        url_file(args.input_filepath, args.output_dirpath, commute=args.commute)
+        url_file(
+            args.input_filepath,
+            args.output_dirpath,
+            commute=args.commute,
+            attach=not args.no_daemon,
+            headless=args.headless,
+            blocker=blocker,
+            refresh=args.refresh,
+            limits=limits,
+            archive=archive,
+        )
     elif args.mode == 'browse':
-        browse(args.output_dirpath, commute=args.commute)
+        browse(
+            args.output_dirpath,
+            commute=args.commute,
+            attach=not args.no_daemon,
+            background=not args.in_tab,
+            workers=args.workers,
+            limits=limits,
+            interval=args.interval,
+            headless=args.headless,
+            blocker=blocker,
+            archive=archive,
+        )
     elif args.mode == 'search':
         search(
             args.output_dirpath,
@@ -1006,8 +4977,79 @@ def main():
             price_min=args.price_min,
             show_contingent=args.show_contingent,
             commute=args.commute,
+            attach=not args.no_daemon,
+            headless=args.headless,
+            blocker=blocker,
+            scroll=args.scroll,
+            queue_filepath=args.queue_filepath if args.queue else None,
+            limits=limits,
+            bands=args.bands,
+            zips=args.shard_zip,
+            shard_miles=args.shard_miles,
+            workers=args.workers,
+            max_monthly=args.max_monthly,
+            bed_min=args.bed_min,
+            archive=archive,
         )
-
+    elif args.mode == 'warm':
+        warm(
+            args.input_filepath,
+            args.output_dirpath,
+            workers=args.workers,
+            interval=args.interval,
+            headless=args.headless,
+            blocker=blocker,
+            limits=limits,
+            archive=archive,
+        )
+    elif args.mode == 'worker':
+        worker(
+            args.output_dirpath,
+            queue_filepath=args.queue_filepath,
+            commute=args.commute,
+            attach=False,  # every worker drives its own browser, several attached to one daemon would fight over the tab
+            headless=args.headless,
+            blocker=blocker,
+            refresh=args.refresh,
+            exit_when_empty=args.exit_when_empty,
+            limits=limits,
+            archive=archive,
+        )
+    elif args.mode == 'top':
+        top(
+            args.output_dirpath,
+            k=args.k,
+            score=args.score,
+            bed_min=args.bed_min,
+            property_types=args.property_type,
+            hoa_max=args.hoa_max,
+            land_lease_max=args.land_lease_max,
+        )
+    elif args.mode == 'grep':
+        grep(args.output_dirpath, args.query, limit=args.limit)
+    elif args.mode == 'reextract':
+        reextract(args.output_dirpath, fields=args.fields, workers=args.workers)
+    elif args.mode == 'near':
+        near(args.output_dirpath, args.where, miles=args.miles, bbox=args.bbox, k=args.k)
+    elif args.mode == 'project':
+        project(
+            args.output_dirpath,
+            hold_years=args.hold_years,
+            years=args.years,
+            down=args.down,
+            hoa_growth=args.hoa_growth,
+            land_lease_growth=args.land_lease_growth,
+            appreciation=args.appreciation,
+        )
+    elif args.mode == 'changes':
+        changes(args.output_dirpath, since=args.since)
+    elif args.mode == 'trend':
+        trend(args.output_dirpath, args.listing, as_of=args.as_of)
+    elif args.mode == 'daemon':
+        daemon(debug_port=args.debug_port, profile_dirpath=args.profile_dirpath, daemon_filepath=args.daemon_filepath, headless=args.headless)
+
+    if args.metrics_filepath:
+        METRICS.write(args.metrics_filepath)
     LOGGER.info('done')
     return 0
 